@@ -6,20 +6,30 @@ TIMEZONE UPDATE: All queries now use Pacific Time (PT) for date ranges
 """
 
 import os
+import sys
 import json
 import logging
+import re
 from datetime import datetime, timedelta, date, time
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, render_template, jsonify, request, Response, stream_with_context, after_this_request
 from flask_cors import CORS
 from dotenv import load_dotenv
 import time as time_module
 from collections import defaultdict
+from dataclasses import dataclass, asdict
+from functools import lru_cache, partial
+from typing import Optional
 import calendar
-import random
-from urllib.parse import urlparse
+import heapq
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 import pytz  # Added for timezone support
+import numpy as np
 import demo_data  # Import the demo data module
-from performance_boost import optimize_app, global_cache, daily_cache, time_it, parallel_fetch
+from performance_boost import (optimize_app, PERFORMANCE_CONFIG, global_cache, daily_cache, failed_fetch_cache, time_it, etag_response, json_response, json_bytes_response, parallel_fetch, parallel_map,
+                               read_json_file, write_json_file, stream_json_response, create_response_cache,
+                               litify_case_type_filter, LITIFY_CREATED_QUERY, LITIFY_CONVERTED_QUERY, salesforce_records_by_id, salesforce_bulk_records_by_id, is_expired_session_error, warn_if_query_truncated, campaign_row_data, wants_msgpack, to_json_bytes, fast_json_response_hook, to_msgpack_bytes, msgpack_bytes_response)
 
 # Set Pacific Timezone
 PACIFIC_TZ = pytz.timezone('America/Los_Angeles')
@@ -46,17 +56,40 @@ except ImportError as e:
 
 try:
     from simple_salesforce import Salesforce
+    # simple_salesforce's HTTP stack, used to give it a pooled session
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     SALESFORCE_AVAILABLE = True
     logger.info("✅ Salesforce API loaded successfully")
 except ImportError:
     SALESFORCE_AVAILABLE = False
     logger.warning("⚠️ Salesforce API not available")
 
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+    logger.warning("⚠️ pandas not available - best/worst days use plain Python scans")
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'sweet-james-2025')
 CORS(app)
 
+# Month lengths never change - cache them instead of recomputing every request
+@lru_cache(maxsize=128)
+def get_month_end_day(year, month):
+    """Return the last day number of the given month"""
+    return calendar.monthrange(year, month)[1]
+
+def month_bounds(d):
+    """Return ('YYYY-MM-01', 'YYYY-MM-DD') strings for the first and last day of d's month"""
+    first = d.replace(day=1)
+    last = (first.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return f"{first.year:04d}-{first.month:02d}-01", f"{last.year:04d}-{last.month:02d}-{last.day:02d}"
+
 # Helper function to get Pacific Time dates
 def get_pacific_date_range(start_date_str=None, end_date_str=None):
     """
@@ -85,7 +118,7 @@ def get_pacific_date_range(start_date_str=None, end_date_str=None):
     return start_dt_pt, end_dt_pt
 
 # In-Practice Case Types
-IN_PRACTICE_CASE_TYPES = [
+IN_PRACTICE_CASE_TYPES = frozenset([
     'Pedestrian',
     'Automobile Accident',
     'Wrongful Death',
@@ -102,21 +135,50 @@ IN_PRACTICE_CASE_TYPES = [
     'Electric Scooter',
     'Mold',
     'Product Liability'
-]
+])
 
 # Case types to exclude by default (can be included via checkbox)
-EXCLUDED_CASE_TYPES = [
+EXCLUDED_CASE_TYPES = frozenset([
     'Spam',
     'Abandoned',
     'Duplicate'
-]
+])
+
+# Intake statuses LitifyManager.fetch_detailed_leads counts as converted
+SIGNED_STATUSES = frozenset(['Signed', 'Retained', 'Retained - Converted'])
 
 # Campaign Bucket Mapping Configuration (for Google Ads campaign names)
 CAMPAIGN_BUCKETS = {}
 
+# mtime of campaign_mappings.json when CAMPAIGN_BUCKETS was last loaded/saved (None = reload)
+CAMPAIGN_MAPPINGS_MTIME = None
+
+# Reverse index of CAMPAIGN_BUCKETS: campaign name -> bucket (see rebuild_campaign_index)
+CAMPAIGN_TO_BUCKET = {}
+
+# Names of the "<State> LSA" buckets in CAMPAIGN_BUCKETS, in mapping order (see rebuild_campaign_index)
+LSA_BUCKET_NAMES = ()
+
+# CAMPAIGN_BUCKETS with each campaign list as a set, for membership tests (see rebuild_campaign_index)
+# CAMPAIGN_BUCKETS itself keeps lists: it is saved and served to the mapping UI in the user's order
+CAMPAIGN_BUCKET_SETS = {}
+
+# Campaign name -> state of the first bucket listing it whose name names a state (see rebuild_campaign_index)
+CAMPAIGN_TO_STATE = {}
+
+# BUCKET_PRIORITY snapshot served as 'available_buckets', and its JSON text for streamed responses (see rebuild_campaign_index)
+AVAILABLE_BUCKETS = ()
+AVAILABLE_BUCKETS_JSON = '[]'
+
+# Bucket -> position in BUCKET_PRIORITY, for O(1) membership checks and ordering (see rebuild_campaign_index)
+BUCKET_RANK = {}
+
 # UTM Campaign to Bucket Mapping (for Litify leads)
 UTM_TO_BUCKET_MAPPING = {}
 
+# Lowercased UTM_TO_BUCKET_MAPPING for case-insensitive lookups (see rebuild_utm_index)
+UTM_TO_BUCKET_LOWER = {}
+
 # Bucket Priority Order (defines the order buckets appear in UI)
 BUCKET_PRIORITY = [
     "California Brand",
@@ -134,43 +196,126 @@ BUCKET_PRIORITY = [
     "Crisp/Youtube"
 ]
 
-# Simple cache for dashboard data
-CACHE_DATA = None
-CACHE_TIME = None
+# Encoded dashboard-data responses by filter set, shared by worker processes when Redis is configured
 CACHE_DURATION = 300  # 5 minutes in seconds
+DASHBOARD_CACHE = create_response_cache('dashboard', ttl=CACHE_DURATION)
+
+# Debug endpoints re-bucket the same campaigns on every poll; results are reused until
+# the campaign mapping changes (see process_campaigns_to_buckets_cached)
+DEBUG_BUCKET_CACHE = {}
+DEBUG_BUCKET_CACHE_SIZE = 8
+
+def clear_debug_bucket_cache():
+    """Drop memoized debug bucket results (call whenever CAMPAIGN_BUCKETS changes)"""
+    DEBUG_BUCKET_CACHE.clear()
+
+# Google-generated LSA campaign names all start with this prefix
+LSA_CAMPAIGN_PREFIX = 'LocalServicesCampaign'
+
+def is_lsa_campaign(campaign):
+    """True for Local Services Ads campaigns (flagged by the fetch, or recognised by name)"""
+    return bool(campaign.get('is_lsa')) or campaign.get('name', '').startswith(LSA_CAMPAIGN_PREFIX)
+
+@lru_cache(maxsize=256)
+def determine_state_from_bucket(bucket):
+    """Extract the state from a bucket name (None if it names none) - forecast pacing rules"""
+    if 'California' in bucket or 'CA' in bucket:
+        return 'CA'
+    elif 'Arizona' in bucket or 'AZ' in bucket:
+        return 'AZ'
+    elif 'Georgia' in bucket or 'GA' in bucket:
+        return 'GA'
+    elif 'Texas' in bucket or 'TX' in bucket:
+        return 'TX'
+    return None
+
+def rebuild_campaign_index():
+    """
+    Rebuild CAMPAIGN_TO_BUCKET from CAMPAIGN_BUCKETS (call whenever either it or BUCKET_PRIORITY changes)
+    Only buckets in BUCKET_PRIORITY are indexed and the first bucket listing a campaign wins
+    Also refreshes BUCKET_RANK, LSA_BUCKET_NAMES, CAMPAIGN_BUCKET_SETS, CAMPAIGN_TO_STATE and AVAILABLE_BUCKETS(_JSON)
+    """
+    global CAMPAIGN_TO_BUCKET, LSA_BUCKET_NAMES, CAMPAIGN_BUCKET_SETS, CAMPAIGN_TO_STATE
+    global AVAILABLE_BUCKETS, AVAILABLE_BUCKETS_JSON, BUCKET_RANK
+    BUCKET_RANK = {bucket: rank for rank, bucket in enumerate(BUCKET_PRIORITY)}
+    index = {}
+    state_index = {}
+    for bucket_name, bucket_campaigns in CAMPAIGN_BUCKETS.items():
+        if bucket_name in BUCKET_RANK:
+            for campaign_name in bucket_campaigns:
+                index.setdefault(campaign_name, bucket_name)
+        state = determine_state_from_bucket(bucket_name)
+        if state:
+            for campaign_name in bucket_campaigns:
+                state_index.setdefault(campaign_name, state)
+    CAMPAIGN_TO_BUCKET = index
+    CAMPAIGN_TO_STATE = state_index
+    LSA_BUCKET_NAMES = tuple(b for b in CAMPAIGN_BUCKETS if b.endswith(' LSA'))
+    CAMPAIGN_BUCKET_SETS = {b: set(campaigns) for b, campaigns in CAMPAIGN_BUCKETS.items()}
+    AVAILABLE_BUCKETS = tuple(BUCKET_PRIORITY)
+    AVAILABLE_BUCKETS_JSON = to_json_bytes(AVAILABLE_BUCKETS).decode('utf-8')
 
 def load_campaign_mappings():
-    """Load campaign bucket mappings from JSON file or use demo defaults"""
-    global CAMPAIGN_BUCKETS
+    """
+    Load campaign bucket mappings from JSON file or use demo defaults
+    Skips re-parsing when the file hasn't changed since it was last loaded/saved
+    """
+    global CAMPAIGN_BUCKETS, CAMPAIGN_MAPPINGS_MTIME
     mappings_file = 'campaign_mappings.json'
     
     if os.path.exists(mappings_file):
+        mtime = os.path.getmtime(mappings_file)
+        if mtime == CAMPAIGN_MAPPINGS_MTIME:
+            return
         try:
-            with open(mappings_file, 'r') as f:
-                CAMPAIGN_BUCKETS = json.load(f)
+            CAMPAIGN_BUCKETS = read_json_file(mappings_file)
+            CAMPAIGN_MAPPINGS_MTIME = mtime
             logger.info(f"✅ Loaded campaign mappings from {mappings_file}")
             logger.info(f"   Found {len(CAMPAIGN_BUCKETS)} bucket mappings")
         except Exception as e:
             logger.error(f"❌ Error loading campaign mappings: {e}")
             # Fall back to demo mappings
             CAMPAIGN_BUCKETS = demo_data.DEMO_CAMPAIGN_BUCKETS
+            CAMPAIGN_MAPPINGS_MTIME = None
     else:
         # Use demo mappings as defaults
         CAMPAIGN_BUCKETS = demo_data.DEMO_CAMPAIGN_BUCKETS
+        CAMPAIGN_MAPPINGS_MTIME = None
         logger.info("📋 Using default demo campaign mappings")
+    rebuild_campaign_index()
+    clear_debug_bucket_cache()
 
 def save_mappings():
-    """Save campaign bucket mappings to JSON file"""
+    """Save campaign bucket mappings to JSON file (atomically)"""
+    global CAMPAIGN_MAPPINGS_MTIME
     mappings_file = 'campaign_mappings.json'
+    clear_debug_bucket_cache()
     try:
-        with open(mappings_file, 'w') as f:
-            json.dump(CAMPAIGN_BUCKETS, f, indent=2)
+        write_json_file(mappings_file, CAMPAIGN_BUCKETS)
+        # In-memory buckets match the file we just wrote - no need to re-read it
+        CAMPAIGN_MAPPINGS_MTIME = os.path.getmtime(mappings_file)
         logger.info(f"✅ Saved campaign mappings to {mappings_file}")
         return True
     except Exception as e:
+        CAMPAIGN_MAPPINGS_MTIME = None
         logger.error(f"❌ Error saving campaign mappings: {e}")
         return False
 
+def rebuild_utm_index():
+    """Rebuild UTM_TO_BUCKET_LOWER from UTM_TO_BUCKET_MAPPING (first key in mapping order wins)"""
+    global UTM_TO_BUCKET_LOWER
+    index = {}
+    for utm, bucket in UTM_TO_BUCKET_MAPPING.items():
+        index.setdefault(utm.lower(), bucket)
+    UTM_TO_BUCKET_LOWER = index
+
+def lookup_utm_bucket(utm_campaign):
+    """Bucket a UTM campaign maps to - exact match first, then case-insensitive ('' if unmapped)"""
+    bucket = UTM_TO_BUCKET_MAPPING.get(utm_campaign, '')
+    if not bucket and utm_campaign:
+        bucket = UTM_TO_BUCKET_LOWER.get(utm_campaign.lower(), '')
+    return bucket
+
 def load_utm_mapping():
     """Load UTM to bucket mapping from JSON file or use demo defaults"""
     global UTM_TO_BUCKET_MAPPING
@@ -178,24 +323,25 @@ def load_utm_mapping():
     
     if os.path.exists(utm_file):
         try:
-            with open(utm_file, 'r') as f:
-                UTM_TO_BUCKET_MAPPING = json.load(f)
+            UTM_TO_BUCKET_MAPPING = read_json_file(utm_file)
             logger.info(f"✅ Loaded UTM mappings from {utm_file}")
         except Exception as e:
             logger.error(f"❌ Error loading UTM mappings: {e}")
             # Fall back to demo mappings
-            UTM_TO_BUCKET_MAPPING = demo_data.DEMO_UTM_TO_BUCKET_MAPPING
+            UTM_TO_BUCKET_MAPPING = dict(demo_data.DEMO_UTM_TO_BUCKET_MAPPING)
     else:
         # Use demo mappings as defaults
-        UTM_TO_BUCKET_MAPPING = demo_data.DEMO_UTM_TO_BUCKET_MAPPING
+        UTM_TO_BUCKET_MAPPING = dict(demo_data.DEMO_UTM_TO_BUCKET_MAPPING)
         logger.info("📋 Using default demo UTM mappings")
+    rebuild_utm_index()
 
 def save_utm_mapping():
     """Save UTM to bucket mapping to JSON file"""
     utm_file = 'utm_mappings.json'
+    # Every mapping change is saved - keep the lowercase index in step
+    rebuild_utm_index()
     try:
-        with open(utm_file, 'w') as f:
-            json.dump(UTM_TO_BUCKET_MAPPING, f, indent=2)
+        write_json_file(utm_file, UTM_TO_BUCKET_MAPPING)
         logger.info(f"✅ Saved UTM mappings to {utm_file}")
         return True
     except Exception as e:
@@ -206,10 +352,22 @@ def save_utm_mapping():
 load_campaign_mappings()
 load_utm_mapping()
 
+# Settings served from forecast_settings.json, and that file's mtime when it was read
+FORECAST_SETTINGS = None
+FORECAST_SETTINGS_MTIME = None
+
 def load_forecast_settings():
-    """Load forecast settings from JSON file"""
+    """
+    Load forecast settings from JSON file
+    Returns the last loaded settings while the file's mtime is unchanged
+    """
+    global FORECAST_SETTINGS, FORECAST_SETTINGS_MTIME
     settings_file = 'forecast_settings.json'
     
+    mtime = os.path.getmtime(settings_file) if os.path.exists(settings_file) else None
+    if mtime is not None and FORECAST_SETTINGS is not None and mtime == FORECAST_SETTINGS_MTIME:
+        return FORECAST_SETTINGS
+    
     # Default settings
     default_settings = {
         'targets': {
@@ -232,15 +390,15 @@ def load_forecast_settings():
         }
     }
     
-    if os.path.exists(settings_file):
+    if mtime is not None:
         try:
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-                # Merge with defaults to ensure all fields exist
-                for key in default_settings:
-                    if key not in settings:
-                        settings[key] = default_settings[key]
-                return settings
+            settings = read_json_file(settings_file)
+            # Merge with defaults to ensure all fields exist
+            for key in default_settings:
+                if key not in settings:
+                    settings[key] = default_settings[key]
+            FORECAST_SETTINGS, FORECAST_SETTINGS_MTIME = settings, mtime
+            return settings
         except Exception as e:
             logger.error(f"Error loading forecast settings: {e}")
     
@@ -248,7 +406,10 @@ def load_forecast_settings():
 
 def save_forecast_settings(settings):
     """Save forecast settings to JSON file"""
+    global FORECAST_SETTINGS_MTIME
     settings_file = 'forecast_settings.json'
+    # Force the next load to re-read (and re-merge) what was written
+    FORECAST_SETTINGS_MTIME = None
     try:
         with open(settings_file, 'w') as f:
             json.dump(settings, f, indent=2)
@@ -258,6 +419,36 @@ def save_forecast_settings(settings):
         logger.error(f"❌ Error saving forecast settings: {e}")
         return False
     
+# Connection pool size for API sessions (comfortably above parallel_fetch's worker count)
+HTTP_POOL_SIZE = 32
+
+def create_http_session():
+    """requests.Session with a keep-alive connection pool and backed-off retries of idempotent requests"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Parse (SOQL) JSON responses with orjson
+    session.hooks['response'].append(fast_json_response_hook)
+    return session
+
+# Seconds an MCC's discovered child accounts are reused before initialize() queries them again
+CHILD_ACCOUNT_DISCOVERY_TTL = 3600
+
+# Minimum seconds between reloads of the Litify case type names triggered by an unknown Id
+CASE_TYPE_RELOAD_INTERVAL = 300
+
+# Seconds a generated demo lead list is reused (its created dates are relative to when it was built)
+DEMO_LEADS_CACHE_TTL = 300
+
+# Seconds after logging in that the Litify client logs in again before its next query
+# (Salesforce sessions time out after 2 hours by default)
+SALESFORCE_SESSION_MAX_AGE = 5400
+
 class GoogleAdsManager:
     """Enhanced Google Ads Manager with MCC and multi-account support"""
     
@@ -269,6 +460,9 @@ class GoogleAdsManager:
         self.is_mcc = False
         self.mcc_id = None
         self.child_accounts = {}  # Store child account info
+        self.child_accounts_discovered_at = None  # time_module.monotonic() of the last discovery
+        self.account_names = {}  # customer_id -> descriptive name (see get_account_name)
+        self.ga_service = None  # GoogleAdsService, created once per client (see get_ga_service)
         
     def initialize(self):
         """Initialize Google Ads connection with MCC support"""
@@ -287,10 +481,13 @@ class GoogleAdsManager:
             customer_ids_env = os.getenv('GOOGLE_ADS_CUSTOMER_IDS', os.getenv('GOOGLE_ADS_CUSTOMER_ID', '2419159990'))
             
             # Parse customer IDs (support comma-separated list)
+            # IDs are interned: every fetched campaign carries one of these
+            # objects as its customer_id, so per-account dict keys hash and
+            # compare by identity
             if ',' in customer_ids_env:
-                self.customer_ids = [cid.strip().replace('-', '') for cid in customer_ids_env.split(',')]
+                self.customer_ids = [sys.intern(cid.strip().replace('-', '')) for cid in customer_ids_env.split(',')]
             else:
-                self.customer_ids = [customer_ids_env.replace('-', '')]
+                self.customer_ids = [sys.intern(customer_ids_env.replace('-', ''))]
             
             # If MCC ID is provided, use it
             if mcc_id:
@@ -299,6 +496,7 @@ class GoogleAdsManager:
                 logger.info(f"🏢 Using MCC account: {self.mcc_id}")
             
             # Initialize Google Ads client
+            self.ga_service = None
             if os.path.exists(credentials_path):
                 # Load from file and potentially add login_customer_id
                 self.client = GoogleAdsClient.load_from_storage(credentials_path)
@@ -348,13 +546,59 @@ class GoogleAdsManager:
             logger.error(f"❌ Failed to initialize Google Ads API: {e}")
             return False
     
-    def discover_child_accounts(self):
-        """Discover all accessible child accounts under MCC"""
+    def get_ga_service(self):
+        """
+        GoogleAdsService for the current client, created once so every query (including
+        parallel_fetch workers) reuses one gRPC channel instead of opening a new one
+        """
+        if self.ga_service is None:
+            self.ga_service = self.client.get_service("GoogleAdsService")
+        return self.ga_service
+    
+    def get_account_name(self, customer_id):
+        """
+        An account's descriptive name, looked up once (from child account discovery or a
+        one-row customer query) instead of being selected on every campaign row
+        """
+        name = self.account_names.get(customer_id)
+        if name is None:
+            child = self.child_accounts.get(customer_id)
+            if child:
+                name = child['name']
+            else:
+                try:
+                    response = self.get_ga_service().search_stream(
+                        customer_id=customer_id, query="SELECT customer.descriptive_name FROM customer")
+                    for batch in response:
+                        for row in batch.results:
+                            name = row.customer.descriptive_name
+                except Exception as e:
+                    # Not remembered - the next fetch tries again
+                    logger.warning(f"⚠️ Could not look up account name for {customer_id}: {e}")
+                    return 'Unknown'
+            name = sys.intern(name or 'Unknown')
+            self.account_names[customer_id] = name
+        return name
+    
+    def discover_child_accounts(self, force_refresh=False):
+        """
+        Discover all accessible child accounts under MCC
+        Results are reused for CHILD_ACCOUNT_DISCOVERY_TTL seconds, so re-initializing
+        doesn't repeat the customer_client query
+        """
         if not self.client or not self.is_mcc:
             return
         
+        if (not force_refresh and self.child_accounts_discovered_at is not None
+                and time_module.monotonic() - self.child_accounts_discovered_at < CHILD_ACCOUNT_DISCOVERY_TTL):
+            for cid in self.child_accounts:
+                if cid not in self.customer_ids:
+                    self.customer_ids.append(cid)
+            logger.info(f"✅ Reusing {len(self.child_accounts)} discovered child accounts")
+            return
+        
         try:
-            ga_service = self.client.get_service("GoogleAdsService")
+            ga_service = self.get_ga_service()
             
             # Query to get all accessible customers
             query = """
@@ -376,7 +620,7 @@ class GoogleAdsManager:
             
             for batch in response:
                 for row in batch.results:
-                    customer_id = str(row.customer_client.id)
+                    customer_id = sys.intern(str(row.customer_client.id))
                     # Only add non-manager, enabled accounts
                     if row.customer_client.status.name == 'ENABLED' and not row.customer_client.manager:
                         self.child_accounts[customer_id] = {
@@ -391,13 +635,18 @@ class GoogleAdsManager:
                 if cid not in self.customer_ids:
                     self.customer_ids.append(cid)
             
+            self.child_accounts_discovered_at = time_module.monotonic()
             logger.info(f"✅ Discovered {len(self.child_accounts)} active child accounts")
             
         except Exception as e:
             logger.error(f"❌ Error discovering child accounts: {e}")
     
-    def fetch_campaigns(self, start_date=None, end_date=None, active_only=True):
-        """Fetch campaign performance data from Google Ads with Pacific Time support"""
+    def fetch_campaigns(self, start_date=None, end_date=None, active_only=True, by_date=False, force_refresh=False):
+        """
+        Fetch campaign performance data from Google Ads with Pacific Time support
+        by_date=True segments rows per day and adds a 'date' field to each campaign
+        force_refresh matches the cached fetch optimize_app installs (this one always queries)
+        """
         if not self.client or not self.connected:
             return None
         
@@ -420,10 +669,14 @@ class GoogleAdsManager:
         # Build status filter
         status_filter = "AND campaign.status = 'ENABLED'" if active_only else ""
         
+        # Add the date segment when rows are needed per day
+        date_segment = "segments.date," if by_date else ""
+        
         # Iterate through all customer IDs
         for customer_id in self.customer_ids:
             try:
-                ga_service = self.client.get_service("GoogleAdsService")
+                customer_name = self.get_account_name(customer_id)
+                ga_service = self.get_ga_service()
                 
                 # Query for campaign performance including LSA
                 query = f"""
@@ -432,7 +685,7 @@ class GoogleAdsManager:
                         campaign.name,
                         campaign.status,
                         campaign.advertising_channel_type,
-                        customer.descriptive_name,
+                        {date_segment}
                         metrics.cost_micros,
                         metrics.clicks,
                         metrics.impressions,
@@ -446,32 +699,16 @@ class GoogleAdsManager:
                 
                 response = ga_service.search_stream(customer_id=customer_id, query=query)
                 
-                account_campaigns = []
-                for batch in response:
-                    for row in batch.results:
-                        campaign_data = {
-                            'id': row.campaign.id,
-                            'name': row.campaign.name,
-                            'status': row.campaign.status.name,
-                            'cost': row.metrics.cost_micros / 1_000_000,
-                            'clicks': row.metrics.clicks,
-                            'impressions': row.metrics.impressions,
-                            'conversions': row.metrics.conversions,
-                            'channel_type': row.campaign.advertising_channel_type.name if hasattr(row.campaign, 'advertising_channel_type') else 'UNKNOWN',
-                            'customer_id': customer_id,
-                            'customer_name': row.customer.descriptive_name if hasattr(row.customer, 'descriptive_name') else 'Unknown'
-                        }
-                        campaign_data['is_lsa'] = campaign_data['channel_type'] == 'LOCAL_SERVICES'
-                        account_campaigns.append(campaign_data)
-                        all_campaigns.append(campaign_data)
+                account_campaigns = [campaign_row_data(row, customer_id, customer_name, by_date)
+                                     for batch in response for row in batch.results]
+                all_campaigns.extend(account_campaigns)
                 
                 if account_campaigns:
                     # Count LSA vs regular campaigns
-                    lsa_count = sum(1 for c in account_campaigns if c.get('is_lsa'))
+                    lsa_count = sum(c['is_lsa'] for c in account_campaigns)
                     regular_count = len(account_campaigns) - lsa_count
                     
-                    account_name = account_campaigns[0].get('customer_name', 'Unknown')
-                    logger.info(f"  ✅ Account {customer_id} ({account_name}): {len(account_campaigns)} campaigns ({lsa_count} LSA, {regular_count} regular)")
+                    logger.info(f"  ✅ Account {customer_id} ({customer_name}): {len(account_campaigns)} campaigns ({lsa_count} LSA, {regular_count} regular)")
                 
             except Exception as e:
                 logger.error(f"  ❌ Error fetching campaigns from {customer_id}: {e}")
@@ -489,7 +726,7 @@ class GoogleAdsManager:
         try:
             # Get current month date range in Pacific Time
             now_pt = datetime.now(PACIFIC_TZ)
-            start_date = date(now_pt.year, now_pt.month, 1).strftime('%Y-%m-%d')
+            start_date = month_bounds(now_pt)[0]
             end_date = now_pt.strftime('%Y-%m-%d')
             
             # Fetch campaigns for current month (including all accounts)
@@ -512,7 +749,7 @@ class GoogleAdsManager:
                 bucket_name = None
                 
                 # Check CAMPAIGN_BUCKETS for this campaign
-                for bucket, bucket_campaigns in CAMPAIGN_BUCKETS.items():
+                for bucket, bucket_campaigns in CAMPAIGN_BUCKET_SETS.items():
                     if campaign_name in bucket_campaigns:
                         bucket_name = bucket
                         break
@@ -540,7 +777,72 @@ class LitifyManager:
         self.connected = False
         self.error = None
         self.instance_url = None
-        self.case_type_cache = set()
+        self.case_type_cache = {}  # litify_pm__Case_Type__c Id -> case type name
+        self.case_types_loaded_at = None  # time_module.monotonic() of the last _cache_case_types
+        self.session_started_at = None  # time_module.monotonic() of the client's login
+        self.session_lock = Lock()  # one re-login at a time (see renew_session)
+        # (include_spam, include_abandoned, include_duplicate) -> (UTM_TO_BUCKET_LOWER, monotonic build time, demo leads)
+        self.demo_leads_cache = {}
+        
+    def connect_client(self):
+        """Log in to Salesforce and (re)create self.client; False when credentials are missing"""
+        # Check for required credentials
+        username = os.getenv('LITIFY_USERNAME')
+        password = os.getenv('LITIFY_PASSWORD')
+        security_token = os.getenv('LITIFY_SECURITY_TOKEN')
+        
+        if not all([username, password, security_token]):
+            self.error = "Missing Litify credentials"
+            logger.warning(f"⚠️ {self.error}")
+            return False
+        
+        # Initialize Salesforce client on a pooled, retrying session so parallel
+        # fetches reuse keep-alive connections instead of each doing a TLS handshake
+        self.client = Salesforce(
+            username=username,
+            password=password,
+            security_token=security_token,
+            domain='login',  # Use 'test' for sandbox
+            session=create_http_session()
+        )
+        self.session_started_at = time_module.monotonic()
+        
+        self.instance_url = self.client.base_url.replace('/services/data/v61.0', '')
+        return True
+    
+    def renew_session(self, stale_client):
+        """Log in again unless another thread already replaced stale_client"""
+        with self.session_lock:
+            if self.client is stale_client:
+                logger.info("🔄 Renewing Litify session")
+                self.connect_client()
+    
+    def query_records_by_id(self, query, bulk=False):
+        """
+        {Id: record} for an intake query on the current client - bulk=True runs it as a Bulk API 2.0
+        job (salesforce_bulk_records_by_id), otherwise a REST query (salesforce_records_by_id).
+        The session is renewed before the query once it is SALESFORCE_SESSION_MAX_AGE old, and a
+        query rejected as unauthorized (expired session) is retried once after logging in again -
+        the case type cache is kept either way
+        """
+        def run(client):
+            if bulk:
+                return salesforce_bulk_records_by_id(client, 'litify_pm__Intake__c', query)
+            return salesforce_records_by_id(client, query)
+        
+        if (self.session_started_at is not None
+                and time_module.monotonic() - self.session_started_at > SALESFORCE_SESSION_MAX_AGE):
+            self.renew_session(self.client)
+        
+        client = self.client
+        try:
+            return run(client)
+        except Exception as e:
+            if not is_expired_session_error(e):
+                raise
+            logger.warning(f"⚠️ Litify session expired - logging in again: {e}")
+            self.renew_session(client)
+            return run(self.client)
         
     def initialize(self):
         """Initialize Salesforce/Litify connection"""
@@ -549,26 +851,9 @@ class LitifyManager:
             return False
             
         try:
-            # Check for required credentials
-            username = os.getenv('LITIFY_USERNAME')
-            password = os.getenv('LITIFY_PASSWORD')
-            security_token = os.getenv('LITIFY_SECURITY_TOKEN')
-            
-            if not all([username, password, security_token]):
-                self.error = "Missing Litify credentials"
-                logger.warning(f"⚠️ {self.error}")
+            if not self.connect_client():
                 return False
             
-            # Initialize Salesforce client
-            self.client = Salesforce(
-                username=username,
-                password=password,
-                security_token=security_token,
-                domain='login'  # Use 'test' for sandbox
-            )
-    
-            self.instance_url = self.client.base_url.replace('/services/data/v61.0', '')
-            
             self.connected = True
             self.error = None
             
@@ -585,30 +870,31 @@ class LitifyManager:
             return False
     
     def _cache_case_types(self):
-        """Cache available case types from Litify"""
+        """Cache the Id -> name of every Litify case type"""
         if not self.client:
             return
-            
+        
+        self.case_types_loaded_at = time_module.monotonic()
         try:
-            # Query for distinct case types
-            query = """
-                SELECT litify_pm__Case_Type__c 
-                FROM litify_pm__Intake__c 
-                WHERE litify_pm__Case_Type__c != null 
-                GROUP BY litify_pm__Case_Type__c
-            """
-            
-            result = self.client.query(query)
-            
-            for record in result['records']:
-                case_type = record.get('litify_pm__Case_Type__c')
-                if case_type:
-                    self.case_type_cache.add(case_type)
+            query = "SELECT Id, Name FROM litify_pm__Case_Type__c"
+            self.case_type_cache = {record['Id']: record['Name']
+                                    for record in self.client.query_all_iter(query)}
             
             logger.info(f"✅ Cached {len(self.case_type_cache)} case types from Litify")
             
         except Exception as e:
             logger.warning(f"⚠️ Could not cache case types: {e}")
+    
+    def case_type_names(self, case_type_ids):
+        """
+        Case type Id -> name map covering case_type_ids where possible; reloaded when an Id
+        isn't in it yet (a case type added since the last load), at most every CASE_TYPE_RELOAD_INTERVAL
+        """
+        if not self.case_type_cache.keys() >= set(case_type_ids) and (
+                self.case_types_loaded_at is None
+                or time_module.monotonic() - self.case_types_loaded_at >= CASE_TYPE_RELOAD_INTERVAL):
+            self._cache_case_types()
+        return self.case_type_cache
 
     def fetch_detailed_leads(self, start_date=None, end_date=None, limit=10000, 
         include_spam=False, include_abandoned=False, include_duplicate=False,
@@ -631,70 +917,32 @@ class LitifyManager:
             datetime_start = start_dt_utc.strftime('%Y-%m-%dT%H:%M:%S.000Z')  # For DATETIME fields
             datetime_end = end_dt_utc.strftime('%Y-%m-%dT%H:%M:%S.999Z')  # For DATETIME fields
             
+            # Spam/Abandoned/Duplicate intakes that weren't asked for are left out by the queries
+            case_type_filter = litify_case_type_filter(include_spam, include_abandoned, include_duplicate)
+            
+            # Long ranges run as Bulk API 2.0 jobs
+            bulk = (end_dt_pt - start_dt_pt).days + 1 >= PERFORMANCE_CONFIG['bulk_query_min_days']
+            
             # Query 1: Leads CREATED in date range (for lead counts)
-            leads_query = f"""
-                SELECT Id, Name, CreatedDate, 
-                    litify_pm__Status__c,
-                    litify_pm__Display_Name__c,
-                    litify_pm__First_Name__c,
-                    litify_pm__Last_Name__c,
-                    Client_Name__c,
-                    litify_pm__Case_Type__c,
-                    litify_pm__Case_Type__r.Name,
-                    Retainer_Signed_Date__c,
-                    litify_pm__UTM_Campaign__c,
-                    litify_pm__Matter__c,
-                    litify_ext__Companion__c,
-                    isDroppedatIntake__c
-                FROM litify_pm__Intake__c
-                WHERE litify_pm__UTM_Campaign__c != null
-                AND CreatedDate >= {datetime_start}
-                AND CreatedDate <= {datetime_end}
-                ORDER BY CreatedDate DESC
-                LIMIT {limit}
-            """
+            leads_query = LITIFY_CREATED_QUERY.format(start=datetime_start, end=datetime_end, limit=int(limit),
+                                                      case_type_filter=case_type_filter)
             
             # Query 2: Leads CONVERTED in date range (for conversion metrics)
-            conversions_query = f"""
-                SELECT Id, Name, CreatedDate, 
-                    litify_pm__Status__c,
-                    litify_pm__Display_Name__c,
-                    litify_pm__First_Name__c,
-                    litify_pm__Last_Name__c,
-                    Client_Name__c,
-                    litify_pm__Case_Type__c,
-                    litify_pm__Case_Type__r.Name,
-                    Retainer_Signed_Date__c,
-                    litify_pm__UTM_Campaign__c,
-                    litify_pm__Matter__c,
-                    litify_ext__Companion__c,
-                    isDroppedatIntake__c
-                FROM litify_pm__Intake__c
-                WHERE litify_pm__UTM_Campaign__c != null
-                AND Retainer_Signed_Date__c != null
-                AND Retainer_Signed_Date__c >= {date_format}
-                AND Retainer_Signed_Date__c <= {end_date_format}
-                ORDER BY Retainer_Signed_Date__c DESC
-                LIMIT {limit}
-            """
+            conversions_query = LITIFY_CONVERTED_QUERY.format(start=date_format, end=end_date_format, limit=int(limit),
+                                                              case_type_filter=case_type_filter)
             
             # Execute both queries with pagination
-            created_leads = {}
-            converted_leads = {}
-            
-            # Get leads created in period - USE query_all to handle pagination
+            # Get leads created in period (pages are consumed as they arrive)
             logger.info(f"Fetching leads CREATED between {start_dt_pt} and {end_dt_pt} PT...")
-            created_records = self.client.query_all(leads_query)
-            for record in created_records:
-                created_leads[record['Id']] = record
+            created_leads = self.query_records_by_id(leads_query, bulk)
             logger.info(f"   Found {len(created_leads)} leads created in period")
+            warn_if_query_truncated('created', created_leads, limit)
             
-            # Get leads converted in period - USE query_all to handle pagination
+            # Get leads converted in period (pages are consumed as they arrive)
             logger.info(f"Fetching leads CONVERTED between {date_format} and {end_date_format} PT...")
-            converted_records = self.client.query_all(conversions_query)
-            for record in converted_records:
-                converted_leads[record['Id']] = record
+            converted_leads = self.query_records_by_id(conversions_query, bulk)
             logger.info(f"   Found {len(converted_leads)} leads converted in period")
+            warn_if_query_truncated('converted', converted_leads, limit)
             
             # Merge the results intelligently
             all_records_dict = created_leads.copy()
@@ -717,6 +965,16 @@ class LitifyManager:
             utm_campaigns = set()
             excluded_count = 0
             
+            # Salesforce record URLs share the org's Lightning prefix
+            instance_name = self.instance_url.split('//')[1].split('.')[0] if self.instance_url else 'sweetjames'
+            salesforce_url_prefix = f"https://{instance_name}.lightning.force.com/lightning/r/litify_pm__Intake__c/"
+            
+            # One bucket lookup per distinct UTM campaign
+            utm_buckets = {utm: lookup_utm_bucket(utm)
+                           for utm in {record.get('litify_pm__UTM_Campaign__c', '') for record in all_records}}
+            case_type_names = self.case_type_names(
+                {record['litify_pm__Case_Type__c'] for record in all_records if record.get('litify_pm__Case_Type__c')})
+            
             for record in all_records:
                 # Get UTM Campaign
                 utm_campaign = record.get('litify_pm__UTM_Campaign__c', '')
@@ -724,13 +982,7 @@ class LitifyManager:
                     utm_campaigns.add(utm_campaign)
                 
                 # Map UTM Campaign to bucket
-                bucket = UTM_TO_BUCKET_MAPPING.get(utm_campaign, '')
-                if not bucket and utm_campaign:
-                    utm_lower = utm_campaign.lower()
-                    for utm_key, bucket_name in UTM_TO_BUCKET_MAPPING.items():
-                        if utm_key.lower() == utm_lower:
-                            bucket = bucket_name
-                            break
+                bucket = utm_buckets[utm_campaign]
                 
                 # Get status
                 status = record.get('litify_pm__Status__c', '')
@@ -738,28 +990,18 @@ class LitifyManager:
                     status = 'Unknown'
                 
                 # Determine if converted
-                is_converted = status in ['Signed', 'Retained', 'Retained - Converted']
+                is_converted = status in SIGNED_STATUSES
                 is_pending = status == 'Retainer Sent'
                 
-                # Get case type
-                case_type = record.get('litify_pm__Case_Type__c', '')
-                if not case_type:
-                    case_type_obj = record.get('litify_pm__Case_Type__r')
-                    if case_type_obj and isinstance(case_type_obj, dict):
-                        case_type = case_type_obj.get('Name', '')
+                # Get case type NAME from its Id
+                case_type = case_type_names.get(record.get('litify_pm__Case_Type__c'), '')
                 
                 # Check if this is an excluded case type
-                is_excluded = case_type in ['Spam', 'Abandoned', 'Duplicate']
+                is_excluded = case_type in EXCLUDED_CASE_TYPES
                 
-                # Apply exclusion filters
+                # Count excluded types (only the included ones are queried)
                 if is_excluded:
                     excluded_count += 1
-                    if case_type == 'Spam' and not include_spam:
-                        continue
-                    elif case_type == 'Abandoned' and not include_abandoned:
-                        continue
-                    elif case_type == 'Duplicate' and not include_duplicate:
-                        continue
                 
                 # Determine in_practice
                 in_practice = not is_excluded
@@ -772,8 +1014,7 @@ class LitifyManager:
                 retainer_signed = record.get('Retainer_Signed_Date__c', '')
                 
                 # Get Salesforce URL
-                instance_name = self.instance_url.split('//')[1].split('.')[0] if self.instance_url else 'sweetjames'
-                salesforce_url = f"https://{instance_name}.lightning.force.com/lightning/r/litify_pm__Intake__c/{record.get('Id')}/view"
+                salesforce_url = f"{salesforce_url_prefix}{record.get('Id')}/view"
                 
                 # Format dates for display
                 created_date_raw = record.get('CreatedDate', '')
@@ -920,89 +1161,108 @@ class LitifyManager:
             return None
     
     def get_demo_litify_leads(self, include_spam=False, include_abandoned=False, include_duplicate=False):
-        """Return demo Litify leads data with bucket mapping and exclusion filters"""
-        return demo_data.get_demo_litify_leads(
+        """
+        Return demo Litify leads data with bucket mapping and exclusion filters
+        Each filter combination is built once and reused (treat as read-only) for DEMO_LEADS_CACHE_TTL,
+        or until the UTM mapping changes (rebuild_utm_index replaces UTM_TO_BUCKET_LOWER)
+        """
+        key = (include_spam, include_abandoned, include_duplicate)
+        entry = self.demo_leads_cache.get(key)
+        if (entry and entry[0] is UTM_TO_BUCKET_LOWER
+                and time_module.monotonic() - entry[1] < DEMO_LEADS_CACHE_TTL):
+            return entry[2]
+        
+        leads = demo_data.get_demo_litify_leads(
             UTM_TO_BUCKET_MAPPING, 
             include_spam, 
             include_abandoned, 
             include_duplicate
         )
-    # Initialize managers
+        self.demo_leads_cache[key] = (UTM_TO_BUCKET_LOWER, time_module.monotonic(), leads)
+        return leads
+
+@dataclass(frozen=True, slots=True)
+class DashboardState:
+    """The app's managers and API availability, shared with blueprints/endpoints as app.extensions['ppcdash']"""
+    ads_manager: GoogleAdsManager
+    litify_manager: LitifyManager
+    google_ads_available: bool
+    salesforce_available: bool
+
+# Initialize managers
 ads_manager = GoogleAdsManager()
 litify_manager = LitifyManager()
+# Shared with blueprints/endpoints via current_app so handlers don't import from app per request
+app.extensions['ppcdash'] = DashboardState(
+    ads_manager=ads_manager,
+    litify_manager=litify_manager,
+    google_ads_available=GOOGLE_ADS_AVAILABLE,
+    salesforce_available=SALESFORCE_AVAILABLE,
+)
 optimize_app(app, ads_manager, litify_manager)
 
 def get_demo_data(include_spam=False, include_abandoned=False, include_duplicate=False):
     """Wrapper function to maintain compatibility"""
     return demo_data.get_demo_bucket_data(include_spam, include_abandoned, include_duplicate)
 
-def process_campaigns_to_buckets_with_litify(campaigns, litify_leads):
+# Pulls the per-day metric fields out of a bucket in one call (every bucket carries all of them)
+BUCKET_METRIC_FIELDS = operator.itemgetter(
+    'name', 'cost', 'leads', 'inPractice', 'unqualified', 'cases', 'retainers',
+    'costPerLead', 'cpa', 'costPerRetainer'
+)
+
+# "Day -1" / unseen-bucket sentinels so day-over-day deltas need no existence checks
+ZERO_DAY = {
+    'spend': 0, 'leads': 0, 'inPractice': 0, 'unqualified': 0, 'cases': 0,
+    'retainers': 0, 'cpl': 0, 'cpa': 0, 'cpr': 0, 'convRate': 0
+}
+ZERO_BUCKET = {
+    'spend': 0, 'leads': 0, 'inPractice': 0, 'cases': 0, 'retainers': 0,
+    'cpl': 0, 'convRate': 0
+}
+DAY_DELTA_FIELDS = (
+    'spendDelta', 'leadsDelta', 'inPracticeDelta', 'unqualifiedDelta', 'casesDelta',
+    'retainersDelta', 'cplDelta', 'cpaDelta', 'cprDelta', 'convDelta'
+)
+BUCKET_DELTA_FIELDS = (
+    'spendDelta', 'leadsDelta', 'inPracticeDelta', 'casesDelta', 'retainersDelta',
+    'cplDelta', 'convDelta'
+)
+
+@dataclass(slots=True)
+class BucketMetrics:
+    """One bucket's metrics for one day in the current-month daily view"""
+    name: str
+    spend: float
+    leads: int
+    inPractice: int
+    unqualified: int
+    cases: int
+    retainers: int
+    cpl: float
+    cpa: float
+    cpr: float
+    convRate: float
+    spendDelta: Optional[float] = None
+    leadsDelta: Optional[int] = None
+
+@dataclass(slots=True)
+class LSACampaignSpend:
+    """One LSA campaign's spend in the LSA spend check (encoded as a dict by the JSON provider)"""
+    name: str
+    spend: float
+    status: str
+
+# Lead counts from which bucket processing counts leads with pandas instead of a Python loop
+PANDAS_BUCKET_MIN_LEADS = 500
+
+BUCKET_LEAD_FLAGS = ('count_for_leads', 'from_previous_period', 'in_practice', 'is_converted', 'is_pending')
+
+def count_bucket_leads(litify_leads, case_assignments, bucketed_data, unmapped_utm_campaigns):
     """
-    Process Google Ads campaigns and Litify leads to create bucketed data
-    Uses CAMPAIGN_BUCKETS from campaign_mappings.json for ALL campaigns including LSA
+    Count leads/inPractice/unqualified/retainers/pendingRetainers/cases into bucketed_data,
+    adding the UTM campaigns of leads with no bucket to unmapped_utm_campaigns
     """
-    # Initialize buckets
-    bucketed_data = {bucket: {
-        'name': bucket,
-        'state': get_state_from_campaign_bucket(bucket) or 'Unknown',
-        'campaigns': [],
-        'cost': 0,
-        'leads': 0,
-        'inPractice': 0,
-        'unqualified': 0,
-        'cases': 0,
-        'retainers': 0,
-        'pendingRetainers': 0,
-        'totalRetainers': 0
-    } for bucket in BUCKET_PRIORITY}
-    
-    unmapped_campaigns = []
-    unmapped_utm_campaigns = set()
-    excluded_counts = {'spam': 0, 'abandoned': 0, 'duplicate': 0, 'total': 0}
-    
-    # Process Google Ads campaigns
-    if campaigns:
-        for campaign in campaigns:
-            campaign_name = campaign.get('name', 'Unknown')
-            cost = campaign.get('cost', 0)
-            is_lsa = campaign.get('is_lsa', False) or 'LocalServicesCampaign' in campaign_name
-            
-            bucket_found = False
-            
-            # Check CAMPAIGN_BUCKETS for this campaign (works for both regular and LSA)
-            for bucket_name, bucket_campaigns in CAMPAIGN_BUCKETS.items():
-                if campaign_name in bucket_campaigns:
-                    if bucket_name in bucketed_data:
-                        bucketed_data[bucket_name]['campaigns'].append(campaign_name)
-                        bucketed_data[bucket_name]['cost'] += cost
-                        bucket_found = True
-                        if is_lsa:
-                            logger.info(f"✅ Mapped LSA campaign '{campaign_name}' to {bucket_name}")
-                        break
-            
-            # If not found, add to unmapped
-            if not bucket_found:
-                unmapped_campaigns.append(campaign_name)
-                if is_lsa:
-                    logger.warning(f"⚠️ Unmapped LSA campaign: {campaign_name}")
-                    logger.warning(f"   Consider adding to campaign_mappings.json")
-    
-    # Track excluded lead counts by type
-    for lead in litify_leads:
-        case_type = lead.get('case_type', '')
-        if case_type == 'Spam':
-            excluded_counts['spam'] += 1
-            excluded_counts['total'] += 1
-        elif case_type == 'Abandoned':
-            excluded_counts['abandoned'] += 1
-            excluded_counts['total'] += 1
-        elif case_type == 'Duplicate':
-            excluded_counts['duplicate'] += 1
-            excluded_counts['total'] += 1
-    
-    # Build companion groups for case counting
-    case_assignments = build_companion_groups(litify_leads)
-    
     # Track unique cases per bucket
     cases_by_bucket = defaultdict(set)
     
@@ -1013,7 +1273,7 @@ def process_campaigns_to_buckets_with_litify(campaigns, litify_leads):
         # If no bucket mapping, try to map based on UTM campaign
         if not bucket_name:
             utm = lead.get('utm_campaign', '')
-            if utm and utm not in ['-', '']:
+            if utm and utm != '-':
                 unmapped_utm_campaigns.add(utm)
                 continue
         
@@ -1053,6 +1313,115 @@ def process_campaigns_to_buckets_with_litify(campaigns, litify_leads):
     for bucket_name in bucketed_data:
         bucketed_data[bucket_name]['cases'] = len(cases_by_bucket[bucket_name])
     
+
+def count_bucket_leads_pandas(litify_leads, case_assignments, bucketed_data):
+    """
+    pandas version of the per-lead counting in process_campaigns_to_buckets_with_litify
+    Fills leads/inPractice/unqualified/retainers/pendingRetainers/cases in bucketed_data
+    and returns the set of UTM campaigns on leads with no bucket
+    """
+    df = pd.DataFrame(litify_leads, columns=['bucket', 'utm_campaign', 'id', *BUCKET_LEAD_FLAGS])
+    df['bucket'] = df['bucket'].fillna('')
+    for flag in BUCKET_LEAD_FLAGS:
+        df[flag] = df[flag].fillna(False).astype(bool)
+    
+    utms = df.loc[df['bucket'] == '', 'utm_campaign'].fillna('')
+    unmapped_utm_campaigns = set(utms[(utms != '') & (utms != '-')])
+    
+    df = df[df['bucket'].isin(bucketed_data.keys())]
+    counted = df['count_for_leads'] & ~df['from_previous_period']
+    in_practice = counted & df['in_practice']
+    ids = df['id'].fillna('')
+    frame = pd.DataFrame({
+        'bucket': df['bucket'],
+        'leads': counted,
+        'inPractice': in_practice,
+        'unqualified': in_practice & ~df['is_converted'],
+        'retainers': df['is_converted'],
+        'pendingRetainers': df['is_pending'],
+        # Unique cases only count converted leads
+        'case': ids.map(lambda lead_id: case_assignments.get(lead_id, f"unknown_{lead_id}")).where(df['is_converted'])
+    })
+    grouped = frame.groupby('bucket').agg(
+        leads=('leads', 'sum'), inPractice=('inPractice', 'sum'), unqualified=('unqualified', 'sum'),
+        retainers=('retainers', 'sum'), pendingRetainers=('pendingRetainers', 'sum'), cases=('case', 'nunique')
+    )
+    for bucket_name, row in grouped.iterrows():
+        data = bucketed_data[bucket_name]
+        for field in ('leads', 'inPractice', 'unqualified', 'retainers', 'pendingRetainers', 'cases'):
+            data[field] = int(row[field])
+    return unmapped_utm_campaigns
+
+def process_campaigns_to_buckets_with_litify(campaigns, litify_leads):
+    """
+    Process Google Ads campaigns and Litify leads to create bucketed data
+    Uses CAMPAIGN_BUCKETS from campaign_mappings.json for ALL campaigns including LSA
+    """
+    # Initialize buckets
+    bucketed_data = {bucket: {
+        'name': bucket,
+        'state': get_state_from_campaign_bucket(bucket) or 'Unknown',
+        'campaigns': [],
+        'cost': 0,
+        'leads': 0,
+        'inPractice': 0,
+        'unqualified': 0,
+        'cases': 0,
+        'retainers': 0,
+        'pendingRetainers': 0,
+        'totalRetainers': 0,
+        'costPerLead': 0,
+        'cpa': 0,
+        'costPerRetainer': 0,
+        'conversionRate': 0
+    } for bucket in BUCKET_PRIORITY}
+    
+    unmapped_campaigns = []
+    unmapped_utm_campaigns = set()
+    excluded_counts = {'spam': 0, 'abandoned': 0, 'duplicate': 0, 'total': 0}
+    
+    # Process Google Ads campaigns
+    if campaigns:
+        for campaign in campaigns:
+            campaign_name = campaign.get('name', 'Unknown')
+            cost = campaign.get('cost', 0)
+            is_lsa = is_lsa_campaign(campaign)
+            
+            # Look up this campaign in CAMPAIGN_BUCKETS (works for both regular and LSA)
+            bucket_name = CAMPAIGN_TO_BUCKET.get(campaign_name)
+            if bucket_name in bucketed_data:
+                bucketed_data[bucket_name]['campaigns'].append(campaign_name)
+                bucketed_data[bucket_name]['cost'] += cost
+                if is_lsa:
+                    logger.info(f"✅ Mapped LSA campaign '{campaign_name}' to {bucket_name}")
+            else:
+                # Not found, add to unmapped
+                unmapped_campaigns.append(campaign_name)
+                if is_lsa:
+                    logger.warning(f"⚠️ Unmapped LSA campaign: {campaign_name}")
+                    logger.warning(f"   Consider adding to campaign_mappings.json")
+    
+    # Track excluded lead counts by type
+    for lead in litify_leads:
+        case_type = lead.get('case_type', '')
+        if case_type == 'Spam':
+            excluded_counts['spam'] += 1
+            excluded_counts['total'] += 1
+        elif case_type == 'Abandoned':
+            excluded_counts['abandoned'] += 1
+            excluded_counts['total'] += 1
+        elif case_type == 'Duplicate':
+            excluded_counts['duplicate'] += 1
+            excluded_counts['total'] += 1
+    
+    # Build companion groups for case counting
+    case_assignments = build_companion_groups(litify_leads)
+    
+    if PANDAS_AVAILABLE and len(litify_leads) >= PANDAS_BUCKET_MIN_LEADS:
+        unmapped_utm_campaigns = count_bucket_leads_pandas(litify_leads, case_assignments, bucketed_data)
+    else:
+        count_bucket_leads(litify_leads, case_assignments, bucketed_data, unmapped_utm_campaigns)
+    
     # Calculate total retainers (signed + pending) and percentages
     for bucket_name, data in bucketed_data.items():
         # Total retainers includes both signed and pending
@@ -1120,6 +1489,23 @@ def process_campaigns_to_buckets_with_litify(campaigns, litify_leads):
     
     return list(bucketed_data.values()), unmapped_campaigns, unmapped_utm_campaigns, excluded_counts
 
+def process_campaigns_to_buckets_cached(campaigns):
+    """
+    Memoized process_campaigns_to_buckets_with_litify(campaigns, []) for debug endpoints
+    Only name, cost and is_lsa affect campaign bucketing, so they form the key
+    Returns (buckets, unmapped, lsa_bucket_view) where lsa_bucket_view maps LSA bucket name -> bucket
+    """
+    key = tuple((c.get('name', 'Unknown'), c.get('cost', 0), c.get('is_lsa', False)) for c in campaigns)
+    result = DEBUG_BUCKET_CACHE.get(key)
+    if result is None:
+        buckets, unmapped, _, _ = process_campaigns_to_buckets_with_litify(campaigns, [])
+        lsa_bucket_view = {b['name']: b for b in buckets if b['name'].endswith(' LSA')}
+        result = (buckets, unmapped, lsa_bucket_view)
+        if len(DEBUG_BUCKET_CACHE) >= DEBUG_BUCKET_CACHE_SIZE:
+            DEBUG_BUCKET_CACHE.pop(next(iter(DEBUG_BUCKET_CACHE)))
+        DEBUG_BUCKET_CACHE[key] = result
+    return result
+
 def get_state_from_campaign_bucket(bucket_name):
     """Determine state from campaign bucket name"""
     bucket_lower = bucket_name.lower()
@@ -1261,10 +1647,9 @@ def api_status():
     })
 
 @app.route('/api/dashboard-data')
+@etag_response(max_age=0)  # polled - cache hits revalidate to an empty 304 until the data changes
 def dashboard_data():
     """Get dashboard data with proper integration of Google Ads and Litify"""
-    global CACHE_DATA, CACHE_TIME
-    
     # Get parameters
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
@@ -1276,30 +1661,40 @@ def dashboard_data():
     include_abandoned = request.args.get('include_abandoned', 'false').lower() == 'true'
     include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
     
-    # Create cache key based on filters
-    cache_key = f"{start_date}_{end_date}_{limit}_{include_spam}_{include_abandoned}_{include_duplicate}"
+    # Clients sending Accept: application/msgpack get the same data msgpack-encoded
+    # (cached separately from the JSON body)
+    use_msgpack = wants_msgpack()
+    
+    # Every response from this URL (cached, fresh or 304) depends on Accept
+    @after_this_request
+    def vary_on_accept(response):
+        response.vary.add('Accept')
+        return response
+    # Cache key based on filters (a tuple - hashed and compared field by field, no string building)
+    cache_key_parts = ('dashboard_data', start_date or 'none', end_date or 'none', limit,
+                       include_spam, include_abandoned, include_duplicate, 'msgpack' if use_msgpack else 'json')
     
     # Check cache validity - SKIP if force_refresh is true
-    cache_valid = False
-    if not force_refresh and CACHE_DATA and CACHE_TIME:
-        cached_key = CACHE_DATA.get('cache_key')
-        if cached_key == cache_key and (datetime.now() - CACHE_TIME).seconds < CACHE_DURATION:
-            cache_valid = True
-            logger.info(f"Returning cached data for key: {cache_key}")
+    if not force_refresh:
+        payload = DASHBOARD_CACHE.get_bytes(cache_key_parts)
+        if payload is not None:
+            logger.info("Returning cached data for key: %s", cache_key_parts)
+            return msgpack_bytes_response(payload) if use_msgpack else json_bytes_response(payload)
     
-    if cache_valid:
-        return jsonify(CACHE_DATA)
+    # Readable form of the key, reported in the response
+    cache_key = f"{start_date}_{end_date}_{limit}_{include_spam}_{include_abandoned}_{include_duplicate}"
     
     # If force_refresh, clear the performance caches too
     if force_refresh:
         logger.info("Force refresh requested - clearing all caches")
-        CACHE_DATA = None
-        CACHE_TIME = None
+        DASHBOARD_CACHE.clear()
         # Clear performance caches if they exist
         if hasattr(global_cache, 'clear'):
             global_cache.clear()
         if hasattr(daily_cache, 'clear'):
             daily_cache.clear()
+        # ...and retry upstreams that failed recently
+        failed_fetch_cache.clear()
     
     logger.info(f"Fetching fresh data for filters: start={start_date}, end={end_date}, limit={limit}, "
                 f"include_spam={include_spam}, include_abandoned={include_abandoned}, include_duplicate={include_duplicate}, "
@@ -1362,7 +1757,7 @@ def dashboard_data():
         'unmapped_campaigns': unmapped_campaigns,
         'unmapped_utms': list(unmapped_utms) if isinstance(unmapped_utms, set) else unmapped_utms,
         'litify_leads': litify_leads,
-        'available_buckets': list(BUCKET_PRIORITY),  # Include list of all available bucket names
+        'available_buckets': AVAILABLE_BUCKETS,  # Include list of all available bucket names
         'data_source': data_source,
         'timestamp': datetime.now(PACIFIC_TZ).isoformat(),
         'date_range': {
@@ -1379,20 +1774,29 @@ def dashboard_data():
         'force_refresh': force_refresh  # Include this in response for debugging
     }
     
-    # Cache the data only if not force_refresh
+    if use_msgpack:
+        payload = to_msgpack_bytes(response_data)
+        if not force_refresh:
+            DASHBOARD_CACHE.set(cache_key_parts, payload)
+        return msgpack_bytes_response(payload)
+    
+    # Stream the fresh response - the lead list goes out row by row instead of
+    # being encoded into one buffer before the first byte is sent - and cache the
+    # encoded body once it has been sent, only if not force_refresh
     if not force_refresh:
-        CACHE_DATA = response_data
-        CACHE_TIME = datetime.now()
         logger.info("Data cached for future requests")
+        on_complete = partial(DASHBOARD_CACHE.set, cache_key_parts)
     else:
         logger.info("Skipping cache due to force_refresh")
+        on_complete = None
     
-    return jsonify(response_data)
+    return stream_json_response(response_data.items(), stream_keys=('litify_leads',), on_complete=on_complete,
+                                encoded={'available_buckets': AVAILABLE_BUCKETS_JSON})
 
 @app.route('/api/campaign-mapping', methods=['GET', 'POST'])
 def api_campaign_mapping():
     """API for campaign bucket mapping"""
-    global CAMPAIGN_BUCKETS, CACHE_DATA, CACHE_TIME
+    global CAMPAIGN_BUCKETS
     
     if request.method == 'GET':
         return jsonify(CAMPAIGN_BUCKETS)
@@ -1419,20 +1823,20 @@ def api_campaign_mapping():
                     cleaned_buckets[bucket_name] = campaigns
             
             CAMPAIGN_BUCKETS = cleaned_buckets
+            rebuild_campaign_index()
             save_mappings()
             
-            CACHE_DATA = None
-            CACHE_TIME = None
+            DASHBOARD_CACHE.clear()
             logger.info("Campaign buckets updated and cache cleared")
             
             return jsonify({'success': True, 'buckets': CAMPAIGN_BUCKETS})
         
         elif action == 'reset_to_defaults':
             CAMPAIGN_BUCKETS = demo_data.DEMO_CAMPAIGN_BUCKETS
+            rebuild_campaign_index()
             save_mappings()
             
-            CACHE_DATA = None
-            CACHE_TIME = None
+            DASHBOARD_CACHE.clear()
             logger.info("Campaign buckets reset to defaults and cache cleared")
             
             return jsonify({'success': True, 'buckets': CAMPAIGN_BUCKETS})
@@ -1442,7 +1846,7 @@ def api_campaign_mapping():
 @app.route('/api/utm-mapping', methods=['GET', 'POST'])
 def api_utm_mapping():
     """API for UTM to bucket mapping"""
-    global UTM_TO_BUCKET_MAPPING, CACHE_DATA, CACHE_TIME
+    global UTM_TO_BUCKET_MAPPING
     
     if request.method == 'GET':
         return jsonify(UTM_TO_BUCKET_MAPPING)
@@ -1459,8 +1863,7 @@ def api_utm_mapping():
                 UTM_TO_BUCKET_MAPPING[utm] = bucket
                 save_utm_mapping()
                 
-                CACHE_DATA = None
-                CACHE_TIME = None
+                DASHBOARD_CACHE.clear()
                 logger.info(f"UTM '{utm}' mapped to bucket '{bucket}' and cache cleared")
                 
                 return jsonify({'success': True, 'mappings': UTM_TO_BUCKET_MAPPING})
@@ -1474,8 +1877,7 @@ def api_utm_mapping():
                 del UTM_TO_BUCKET_MAPPING[utm]
                 save_utm_mapping()
                 
-                CACHE_DATA = None
-                CACHE_TIME = None
+                DASHBOARD_CACHE.clear()
                 logger.info(f"UTM '{utm}' mapping deleted and cache cleared")
                 
                 return jsonify({'success': True, 'mappings': UTM_TO_BUCKET_MAPPING})
@@ -1488,18 +1890,16 @@ def api_utm_mapping():
             UTM_TO_BUCKET_MAPPING = new_mappings
             save_utm_mapping()
             
-            CACHE_DATA = None
-            CACHE_TIME = None
+            DASHBOARD_CACHE.clear()
             logger.info("UTM mappings updated and cache cleared")
             
             return jsonify({'success': True, 'mappings': UTM_TO_BUCKET_MAPPING})
         
         elif action == 'reset_to_defaults':
-            UTM_TO_BUCKET_MAPPING = demo_data.DEMO_UTM_TO_BUCKET_MAPPING
+            UTM_TO_BUCKET_MAPPING = dict(demo_data.DEMO_UTM_TO_BUCKET_MAPPING)
             save_utm_mapping()
             
-            CACHE_DATA = None
-            CACHE_TIME = None
+            DASHBOARD_CACHE.clear()
             logger.info("UTM mapping reset to defaults and cache cleared")
             
             return jsonify({'success': True, 'mappings': UTM_TO_BUCKET_MAPPING})
@@ -1518,10 +1918,10 @@ def api_all_campaigns():
         today = now_pt.strftime('%Y-%m-%d')
         campaigns = ads_manager.fetch_campaigns(today, today)
         if campaigns:
-            return jsonify([c['name'] for c in campaigns])
+            return json_response([c['name'] for c in campaigns])
     
     # Return demo campaign names from module
-    return jsonify(demo_data.DEMO_CAMPAIGNS)
+    return json_response(demo_data.DEMO_CAMPAIGNS)
 
 @app.route('/api/forecast-settings', methods=['GET', 'POST'])
 def api_forecast_settings():
@@ -1537,27 +1937,82 @@ def api_forecast_settings():
         else:
             return jsonify({'success': False, 'error': 'Failed to save settings'}), 500
 
-@app.route('/api/forecast-pacing')
-@time_it
-def api_forecast_pacing():
+# Lead counts from which pacing aggregates leads with pandas instead of a Python loop
+PANDAS_PACING_MIN_LEADS = 500
+
+def lead_frame(leads):
     """
-    Get current month pacing data with performance optimization and Pacific Time
+    Columnar view of the lead fields pacing reads, built once per lead list:
+    utm (UTM campaign, '' when unset), matter (NaN when unset) and retained (retainer signed)
     """
-    # Get date parameters (default to current month)
-    start_date = request.args.get('start_date')
-    end_date = request.args.get('end_date')
-    force_refresh = request.args.get('force_refresh', 'false').lower() == 'true'
+    df = pd.DataFrame(leads, columns=['litify_pm__UTM_Campaign__c', 'litify_pm__Matter__c', 'Retainer_Signed_Date__c'])
+    matters = df['litify_pm__Matter__c']
+    return pd.DataFrame({
+        'utm': df['litify_pm__UTM_Campaign__c'].fillna(''),
+        'matter': matters.where(matters.fillna('').astype(bool)),
+        'retained': df['Retainer_Signed_Date__c'].fillna('').astype(bool)
+    })
+
+def aggregate_pacing_leads_pandas(leads):
+    """pandas version of aggregate_pacing_leads for large lead lists"""
+    df = lead_frame(leads)
+    # One state lookup per distinct UTM campaign
+    df['state'] = df['utm'].map({utm: determine_state_from_utm(utm) for utm in df['utm'].unique()})
+    grouped = df.groupby('state').agg(
+        leads=('state', 'size'), cases=('matter', 'nunique'), retainers=('retained', 'sum')
+    )
     
-    # Get exclusion filter parameters
-    include_spam = request.args.get('include_spam', 'false').lower() == 'true'
-    include_abandoned = request.args.get('include_abandoned', 'false').lower() == 'true'
-    include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
+    state_metrics = {state: {'leads': 0, 'cases': 0, 'retainers': 0} for state in ('CA', 'AZ', 'GA', 'TX')}
+    for state, row in grouped.iterrows():
+        if state in state_metrics:
+            state_metrics[state] = {'leads': int(row['leads']), 'cases': int(row['cases']),
+                                    'retainers': int(row['retainers'])}
+    return state_metrics
+
+def aggregate_pacing_leads(leads):
+    """
+    Count leads, unique cases (matters) and retainers per state for forecast pacing
+    States come from each lead's UTM campaign
+    """
+    if PANDAS_AVAILABLE and len(leads) >= PANDAS_PACING_MIN_LEADS:
+        return aggregate_pacing_leads_pandas(leads)
+    
+    state_metrics = {state: {'leads': 0, 'cases': 0, 'retainers': 0} for state in ('CA', 'AZ', 'GA', 'TX')}
+    case_ids = {state: set() for state in state_metrics}
+    
+    for lead in leads:
+        # Map UTM campaign to state
+        state = determine_state_from_utm(lead.get('litify_pm__UTM_Campaign__c', ''))
+        
+        if state in state_metrics:
+            metrics = state_metrics[state]
+            metrics['leads'] += 1
+            
+            # Check for retainer
+            if lead.get('Retainer_Signed_Date__c'):
+                metrics['retainers'] += 1
+            
+            # Track unique cases
+            matter_id = lead.get('litify_pm__Matter__c')
+            if matter_id:
+                case_ids[state].add(matter_id)
+    
+    for state, metrics in state_metrics.items():
+        metrics['cases'] = len(case_ids[state])
+    return state_metrics
+
+def compute_forecast_pacing(start_date=None, end_date=None, include_spam=False, include_abandoned=False,
+                            include_duplicate=False, force_refresh=False):
+    """
+    Build (or return cached) pacing data for a date range, defaulting to the current month (Pacific Time).
+    Shared by the pacing and projections endpoints so neither round-trips the other through JSON.
+    """
+    # Capture request time once (Pacific Time)
+    now_pt = datetime.now(PACIFIC_TZ)
     
     # Default to current month if not specified (Pacific Time)
     if not start_date or not end_date:
-        now_pt = datetime.now(PACIFIC_TZ)
-        start_date = datetime(now_pt.year, now_pt.month, 1).strftime('%Y-%m-%d')
-        end_date = datetime(now_pt.year, now_pt.month, calendar.monthrange(now_pt.year, now_pt.month)[1]).strftime('%Y-%m-%d')
+        start_date, end_date = month_bounds(now_pt)
     
     # Create cache key for pacing data
     cache_key = ['forecast_pacing', start_date, end_date, include_spam, include_abandoned, include_duplicate]
@@ -1567,7 +2022,7 @@ def api_forecast_pacing():
         cached = global_cache.get(cache_key)
         if cached:
             logger.info("✅ Returning cached forecast pacing data")
-            return jsonify(cached)
+            return cached
     
     # Initialize managers if needed
     if not ads_manager.client:
@@ -1594,7 +2049,7 @@ def api_forecast_pacing():
             'start': start_date,
             'end': end_date
         },
-        'timestamp': datetime.now(PACIFIC_TZ).isoformat()
+        'timestamp': now_pt.isoformat()
     }
     
     # Use parallel fetch for Google Ads and Litify data
@@ -1615,7 +2070,8 @@ def api_forecast_pacing():
                 limit=1000,
                 include_spam=include_spam,
                 include_abandoned=include_abandoned,
-                include_duplicate=include_duplicate
+                include_duplicate=include_duplicate,
+                demo_on_error=False
             )
         else:
             return demo_data.get_demo_litify_leads(include_spam, include_abandoned, include_duplicate)
@@ -1623,8 +2079,23 @@ def api_forecast_pacing():
     fetch_functions['google_ads'] = fetch_ads_data
     fetch_functions['litify'] = fetch_litify_data
     
-    # Execute parallel fetch
-    results = parallel_fetch(fetch_functions, timeout=30)
+    # Execute parallel fetch (a source that raised comes back as None)
+    try:
+        results = parallel_fetch(fetch_functions, timeout=30)
+    except Exception as e:
+        logger.error(f"❌ Forecast pacing fetch failed: {e}")
+        results = {}
+    
+    # If either source failed (None - an empty list is a real empty result), serve the
+    # last good result (even if expired) rather than zeros, and don't cache the partial result
+    fetch_failed = results.get('google_ads') is None or results.get('litify') is None
+    if fetch_failed:
+        stale = global_cache.get_stale(cache_key)
+        if stale:
+            logger.warning(f"⚠️ Forecast pacing fetch failed - serving stale cached data for {start_date} to {end_date}")
+            return {**stale, 'stale': True}
+        logger.warning(f"⚠️ Forecast pacing fetch failed for {start_date} to {end_date} - not caching")
+        pacing_data['partial'] = True
     
     # Process Google Ads data
     if 'google_ads' in results and results['google_ads']:
@@ -1649,40 +2120,12 @@ def api_forecast_pacing():
         leads = results['litify']
         
         # Aggregate by state
-        state_metrics = {"CA": {}, "AZ": {}, "GA": {}, "TX": {}}
-        
-        for state in state_metrics:
-            state_metrics[state] = {
-                'leads': 0,
-                'cases': 0,
-                'retainers': 0,
-                'case_ids': set(),
-                'retainer_ids': set()
-            }
-        
-        for lead in leads:
-            # Map UTM campaign to state
-            utm_campaign = lead.get('litify_pm__UTM_Campaign__c', '')
-            state = determine_state_from_utm(utm_campaign)
-            
-            if state in state_metrics:
-                # Count leads
-                state_metrics[state]['leads'] += 1
-                
-                # Check for retainer
-                if lead.get('Retainer_Signed_Date__c'):
-                    state_metrics[state]['retainer_ids'].add(lead.get('Id'))
-                    state_metrics[state]['retainers'] += 1
-                
-                # Track unique cases
-                matter_id = lead.get('litify_pm__Matter__c')
-                if matter_id:
-                    state_metrics[state]['case_ids'].add(matter_id)
+        state_metrics = aggregate_pacing_leads(leads)
         
         # Update pacing data with metrics
         for state, metrics in state_metrics.items():
             pacing_data['states'][state]['leads'] = metrics['leads']
-            pacing_data['states'][state]['cases'] = len(metrics['case_ids'])
+            pacing_data['states'][state]['cases'] = metrics['cases']
             pacing_data['states'][state]['retainers'] = metrics['retainers']
             
             # Calculate CPL and conversion rate
@@ -1692,50 +2135,102 @@ def api_forecast_pacing():
             
             # Update totals
             pacing_data['totals']['leads'] += metrics['leads']
-            pacing_data['totals']['cases'] += len(metrics['case_ids'])
+            pacing_data['totals']['cases'] += metrics['cases']
             pacing_data['totals']['retainers'] += metrics['retainers']
     
     # Fetch daily data for trend chart (if within current month)
-    now_pt = datetime.now(PACIFIC_TZ)
-    if start_date == datetime(now_pt.year, now_pt.month, 1).strftime('%Y-%m-%d'):
+    if start_date == month_bounds(now_pt)[0]:
         daily_data = fetch_daily_pacing_data(start_date, end_date, include_spam, include_abandoned, include_duplicate)
         pacing_data['daily_data'] = daily_data
     
     # Cache the result
-    global_cache.set(cache_key, pacing_data)
+    if not fetch_failed:
+        global_cache.set(cache_key, pacing_data)
     
     logger.info(f"✅ Forecast pacing data generated: {pacing_data['totals']}")
     
-    return jsonify(pacing_data)
+    return pacing_data
 
+def forecast_pacing_args():
+    """(start_date, end_date, include_spam, include_abandoned, include_duplicate) from the request"""
+    return (
+        request.args.get('start_date'),
+        request.args.get('end_date'),
+        request.args.get('include_spam', 'false').lower() == 'true',
+        request.args.get('include_abandoned', 'false').lower() == 'true',
+        request.args.get('include_duplicate', 'false').lower() == 'true'
+    )
 
-@app.route('/api/forecast-projections')
+
+@app.route('/api/forecast-pacing')
 @time_it
-def api_forecast_projections():
+@etag_response()
+def api_forecast_pacing():
     """
-    Get forecast projections based on current pacing with advanced calculations
+    Get current month pacing data with performance optimization and Pacific Time
     """
+    # Date range (default to current month) and exclusion filter parameters
     force_refresh = request.args.get('force_refresh', 'false').lower() == 'true'
+    return json_response(compute_forecast_pacing(*forecast_pacing_args(), force_refresh=force_refresh))
+
+
+# Metric order of the per-state projection arrays
+PROJECTION_METRICS = ('spend', 'leads', 'retainers', 'cases')
+
+def project_states(current, target, days_elapsed, days_in_month, days_remaining):
+    """
+    Projection math for every state at once
+    current/target are (states x PROJECTION_METRICS) float arrays; returns, per state, the
+    daily_rates, projected, required_daily, variance and variance_percent dicts plus the
+    current CPL, projected CPL and current lead-to-case conversion (%)
+    """
+    zeros = np.zeros_like(current)
+    daily_rates = current / days_elapsed if days_elapsed > 0 else zeros
+    projected = daily_rates * days_in_month
+    required_daily = (target - current) / days_remaining if days_remaining > 0 else zeros
+    variance = projected - target
+    variance_percent = np.divide(variance, target, out=np.zeros_like(variance), where=target > 0) * 100
+    
+    def ratio(numerator, denominator):
+        return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+    current_spend, current_leads, _, current_cases = current.T
+    projected_spend, projected_leads, _, _ = projected.T
+    current_cpl = ratio(current_spend, current_leads)
+    projected_cpl = ratio(projected_spend, projected_leads)
+    current_conversion = ratio(current_cases, current_leads) * 100
+    
+    def as_dicts(values):
+        return [dict(zip(PROJECTION_METRICS, row)) for row in values.tolist()]
+    return (
+        as_dicts(daily_rates), as_dicts(projected), as_dicts(required_daily),
+        as_dicts(variance), as_dicts(variance_percent),
+        current_cpl.tolist(), projected_cpl.tolist(), current_conversion.tolist()
+    )
+
+def compute_forecast_projections(load_pacing, force_refresh=False):
+    """
+    Build (or return cached) month-end projections from current pacing (Pacific Time)
+    load_pacing is called for the pacing data only when the projections aren't cached
+    """
+    # Capture request time once (Pacific Time)
+    now_pt = datetime.now(PACIFIC_TZ)
     
     # Cache key for projections
-    cache_key = ['forecast_projections', datetime.now(PACIFIC_TZ).strftime('%Y-%m-%d')]
+    cache_key = ['forecast_projections', now_pt.strftime('%Y-%m-%d')]
     
     if not force_refresh:
         cached = global_cache.get(cache_key)
         if cached:
             logger.info("✅ Returning cached forecast projections")
-            return jsonify(cached)
+            return cached
     
-    # Get current month pacing data
-    pacing_response = api_forecast_pacing()
-    pacing_data = pacing_response.get_json()
+    pacing_data = load_pacing()
     
     # Load forecast settings
     settings = load_forecast_settings()
     
     # Calculate time factors (Pacific Time)
-    now_pt = datetime.now(PACIFIC_TZ)
-    days_in_month = calendar.monthrange(now_pt.year, now_pt.month)[1]
+    days_in_month = get_month_end_day(now_pt.year, now_pt.month)
     days_elapsed = now_pt.day
     days_remaining = days_in_month - days_elapsed
     percent_complete = (days_elapsed / days_in_month) * 100
@@ -1757,60 +2252,22 @@ def api_forecast_projections():
             'percent_complete': percent_complete
         },
         'recommendations': [],
-        'timestamp': datetime.now(PACIFIC_TZ).isoformat()
+        'timestamp': now_pt.isoformat()
     }
     
-    # Calculate projections by state
-    for state in ['CA', 'AZ', 'GA', 'TX']:
+    # Calculate projections for all states at once
+    states = ('CA', 'AZ', 'GA', 'TX')
+    current_arr = np.array([[pacing_data['states'][state][m] for m in PROJECTION_METRICS] for state in states], dtype=np.float64)
+    target_arr = np.array([[settings['targets'][state][m] for m in PROJECTION_METRICS] for state in states], dtype=np.float64)
+    state_projections = project_states(current_arr, target_arr, days_elapsed, days_in_month, days_remaining)
+    
+    for state, (daily_rates, projected, required_daily, variance, variance_percent,
+                current_cpl, projected_cpl, current_conversion) in zip(states, zip(*state_projections)):
         current = pacing_data['states'][state]
         targets = settings['targets'][state]
         conversion_rates = settings['conversion_rates'][state]
         cpl_target = settings['cpl_targets'][state]
         
-        # Calculate daily run rates
-        daily_rates = {
-            'spend': current['spend'] / days_elapsed if days_elapsed > 0 else 0,
-            'leads': current['leads'] / days_elapsed if days_elapsed > 0 else 0,
-            'retainers': current['retainers'] / days_elapsed if days_elapsed > 0 else 0,
-            'cases': current['cases'] / days_elapsed if days_elapsed > 0 else 0
-        }
-        
-        # Project full month based on current pace
-        projected = {
-            'spend': daily_rates['spend'] * days_in_month,
-            'leads': daily_rates['leads'] * days_in_month,
-            'retainers': daily_rates['retainers'] * days_in_month,
-            'cases': daily_rates['cases'] * days_in_month
-        }
-        
-        # Calculate required daily rates to hit targets
-        required_daily = {
-            'spend': (targets['spend'] - current['spend']) / days_remaining if days_remaining > 0 else 0,
-            'leads': (targets['leads'] - current['leads']) / days_remaining if days_remaining > 0 else 0,
-            'retainers': (targets['retainers'] - current['retainers']) / days_remaining if days_remaining > 0 else 0,
-            'cases': (targets['cases'] - current['cases']) / days_remaining if days_remaining > 0 else 0
-        }
-        
-        # Calculate variances
-        variance = {
-            'spend': projected['spend'] - targets['spend'],
-            'leads': projected['leads'] - targets['leads'],
-            'retainers': projected['retainers'] - targets['retainers'],
-            'cases': projected['cases'] - targets['cases']
-        }
-        
-        variance_percent = {
-            'spend': (variance['spend'] / targets['spend'] * 100) if targets['spend'] > 0 else 0,
-            'leads': (variance['leads'] / targets['leads'] * 100) if targets['leads'] > 0 else 0,
-            'retainers': (variance['retainers'] / targets['retainers'] * 100) if targets['retainers'] > 0 else 0,
-            'cases': (variance['cases'] / targets['cases'] * 100) if targets['cases'] > 0 else 0
-        }
-        
-        # Calculate performance metrics
-        current_cpl = current['spend'] / current['leads'] if current['leads'] > 0 else 0
-        projected_cpl = projected['spend'] / projected['leads'] if projected['leads'] > 0 else 0
-        current_conversion = (current['cases'] / current['leads'] * 100) if current['leads'] > 0 else 0
-        
         # Store state projections
         projections['states'][state] = {
             'current': current,
@@ -1847,113 +2304,188 @@ def api_forecast_projections():
     # Generate recommendations
     projections['recommendations'] = generate_forecast_recommendations(projections)
     
-    # Cache the result
-    global_cache.set(cache_key, projections)
+    # Cache the result (not when built from stale or partial pacing data)
+    pacing_flags = {flag: True for flag in ('stale', 'partial') if pacing_data.get(flag)}
+    if pacing_flags:
+        projections.update(pacing_flags)
+    else:
+        global_cache.set(cache_key, projections)
     
     logger.info(f"✅ Forecast projections generated")
     
-    return jsonify(projections)
+    return projections
 
 
-@app.route('/api/forecast-daily-trend')
+@app.route('/api/forecast-projections')
 @time_it
-def api_forecast_daily_trend():
+@etag_response()
+def api_forecast_projections():
     """
-    Get daily trend data for the current month with caching optimization and Pacific Time
+    Get forecast projections based on current pacing with advanced calculations
     """
     force_refresh = request.args.get('force_refresh', 'false').lower() == 'true'
     
-    # Get filter parameters
-    include_spam = request.args.get('include_spam', 'false').lower() == 'true'
-    include_abandoned = request.args.get('include_abandoned', 'false').lower() == 'true'
-    include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
+    # Current month pacing data (same request parameters the pacing endpoint reads)
+    pacing_args = forecast_pacing_args()
+    return json_response(compute_forecast_projections(
+        lambda: compute_forecast_pacing(*pacing_args, force_refresh=force_refresh), force_refresh
+    ))
+
+
+# Count metrics accumulated (as integers) alongside spend in the daily trend
+TREND_COUNT_METRICS = ('leads', 'cases', 'retainers')
+
+def compute_forecast_daily_trend(include_spam=False, include_abandoned=False, include_duplicate=False,
+                                 force_refresh=False):
+    """Build (or return cached) daily and cumulative metrics for the current month so far (Pacific Time)"""
+    # Capture request time once (Pacific Time)
+    now_pt = datetime.now(PACIFIC_TZ)
     
     # Cache key
-    cache_key = ['forecast_daily_trend', datetime.now(PACIFIC_TZ).strftime('%Y-%m'), 
+    cache_key = ['forecast_daily_trend', now_pt.strftime('%Y-%m'), 
                  include_spam, include_abandoned, include_duplicate]
     
     if not force_refresh:
         cached = global_cache.get(cache_key)
         if cached:
             logger.info("✅ Returning cached daily trend data")
-            return jsonify(cached)
+            return cached
     
     # Get current month date range (Pacific Time)
-    now_pt = datetime.now(PACIFIC_TZ)
     month_start = datetime(now_pt.year, now_pt.month, 1, tzinfo=PACIFIC_TZ)
-    month_end = datetime(now_pt.year, now_pt.month, calendar.monthrange(now_pt.year, now_pt.month)[1], tzinfo=PACIFIC_TZ)
+    month_end = datetime(now_pt.year, now_pt.month, get_month_end_day(now_pt.year, now_pt.month), tzinfo=PACIFIC_TZ)
     today = min(now_pt, month_end)
     
-    daily_data = []
-    cumulative = {'spend': 0, 'leads': 0, 'cases': 0, 'retainers': 0}
-    
-    # Fetch data day by day (leveraging daily_cache)
+    # Fetch the month so far (one range fetch per source for days not in daily_cache)
+    date_strs = []
     current_date = month_start
     while current_date <= today:
-        date_str = current_date.strftime('%Y-%m-%d')
-        
-        # Fetch data for this day (will use daily_cache if available)
-        day_metrics = fetch_single_day_metrics(
-            date_str, 
-            include_spam, 
-            include_abandoned, 
-            include_duplicate
-        )
-        
-        # Update cumulative totals
-        for metric in ['spend', 'leads', 'cases', 'retainers']:
-            cumulative[metric] += day_metrics.get(metric, 0)
-        
-        daily_data.append({
-            'date': date_str,
-            'daily': day_metrics,
-            'cumulative': dict(cumulative)  # Copy current cumulative state
-        })
-        
+        date_strs.append(current_date.strftime('%Y-%m-%d'))
         current_date += timedelta(days=1)
     
+    results = fetch_range_day_metrics(date_strs, include_spam, include_abandoned, include_duplicate)
+    
+    # Running totals for every day at once, in date order (a failed day counts as zero)
+    day_metrics_list = [results[date_str] or {'spend': 0, 'leads': 0, 'cases': 0, 'retainers': 0}
+                        for date_str in date_strs]
+    cumulative_spend = np.cumsum([m.get('spend', 0) for m in day_metrics_list], dtype=np.float64).tolist()
+    cumulative_counts = np.cumsum([[m.get(metric, 0) for metric in TREND_COUNT_METRICS] for m in day_metrics_list],
+                                  axis=0, dtype=np.int64).tolist()
+    
+    daily_data = [{
+        'date': date_str,
+        'daily': day_metrics,
+        'cumulative': {'spend': spend, **dict(zip(TREND_COUNT_METRICS, counts))}
+    } for date_str, day_metrics, spend, counts in zip(date_strs, day_metrics_list, cumulative_spend, cumulative_counts)]
+    
     result = {
         'daily_data': daily_data,
         'month': now_pt.strftime('%Y-%m'),
-        'timestamp': datetime.now(PACIFIC_TZ).isoformat()
+        'timestamp': now_pt.isoformat()
     }
     
-    # Cache the result
-    global_cache.set(cache_key, result)
+    # Cache the result (not when a day's fetch failed and was zero-filled)
+    if any(results[date_str] is None for date_str in date_strs):
+        logger.warning("⚠️ Daily trend has days that failed to fetch - not caching")
+        result['partial'] = True
+    else:
+        global_cache.set(cache_key, result)
     
     logger.info(f"✅ Daily trend data generated: {len(daily_data)} days")
     
-    return jsonify(result)
+    return result
+
+
+@app.route('/api/forecast-daily-trend')
+@time_it
+@etag_response()
+def api_forecast_daily_trend():
+    """
+    Get daily trend data for the current month with caching optimization and Pacific Time
+    """
+    force_refresh = request.args.get('force_refresh', 'false').lower() == 'true'
+    
+    # Get filter parameters
+    include_spam = request.args.get('include_spam', 'false').lower() == 'true'
+    include_abandoned = request.args.get('include_abandoned', 'false').lower() == 'true'
+    include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
+    
+    return json_response(compute_forecast_daily_trend(include_spam, include_abandoned, include_duplicate, force_refresh))
+
+
+@app.route('/api/forecast-bundle')
+@time_it
+@etag_response()
+def api_forecast_bundle():
+    """
+    Pacing, projections and daily trend in one response (what the forecasting page loads)
+    Pacing is computed once and projections are derived from it; the daily trend reuses the
+    per-day metrics pacing just put in daily_cache
+    """
+    force_refresh = request.args.get('force_refresh', 'false').lower() == 'true'
+    start_date, end_date, include_spam, include_abandoned, include_duplicate = forecast_pacing_args()
+    
+    pacing = compute_forecast_pacing(start_date, end_date, include_spam, include_abandoned,
+                                     include_duplicate, force_refresh)
+    return json_response({
+        'pacing': pacing,
+        'projections': compute_forecast_projections(lambda: pacing, force_refresh),
+        'daily_trend': compute_forecast_daily_trend(include_spam, include_abandoned, include_duplicate, force_refresh)
+    })
+
 
 # Helper functions continue...
 
+# (state, keywords) fallbacks when a campaign/UTM name is not mapped to a state bucket, checked in order
+CAMPAIGN_STATE_KEYWORDS = (
+    ('CA', ('california', ' ca ', 'los angeles', 'san diego', 'san francisco')),
+    ('AZ', ('arizona', ' az ', 'phoenix', 'tucson')),
+    ('GA', ('georgia', ' ga ', 'atlanta')),
+    ('TX', ('texas', ' tx ', 'houston', 'dallas', 'austin')),
+)
+UTM_STATE_KEYWORDS = (
+    ('CA', ('california', '_ca_', 'losangeles', 'sandiego')),
+    ('AZ', ('arizona', '_az_', 'phoenix')),
+    ('GA', ('georgia', '_ga_', 'atlanta')),
+    ('TX', ('texas', '_tx_', 'houston', 'dallas')),
+)
+
+def compile_state_patterns(state_keywords):
+    """(state, regex matching any of its keywords) per state, so each state is one scan of the name"""
+    return tuple((state, re.compile('|'.join(map(re.escape, keywords)))) for state, keywords in state_keywords)
+
+CAMPAIGN_STATE_PATTERNS = compile_state_patterns(CAMPAIGN_STATE_KEYWORDS)
+UTM_STATE_PATTERNS = compile_state_patterns(UTM_STATE_KEYWORDS)
+
+def _state_from_keywords(name, state_patterns):
+    """First state whose keywords appear in the lowercased name, defaulting to CA"""
+    name_lower = name.lower()
+    for state, pattern in state_patterns:
+        if pattern.search(name_lower):
+            return state
+    return 'CA'
+
+# The name fallbacks depend only on the name, so they are memoized
+# (the bucket lookups are not - the mappings can be edited at runtime)
+@lru_cache(maxsize=4096)
+def state_from_campaign_name(campaign_name):
+    """Guess a campaign's state from its name alone"""
+    return _state_from_keywords(campaign_name, CAMPAIGN_STATE_PATTERNS)
+
+@lru_cache(maxsize=4096)
+def state_from_utm_name(utm_campaign):
+    """Guess a UTM campaign's state from its name alone"""
+    return _state_from_keywords(utm_campaign, UTM_STATE_PATTERNS)
+
 def determine_state_from_campaign(campaign_name):
     """Map campaign name to state using bucket mappings"""
     # Check campaign bucket mapping
-    for bucket, campaigns in CAMPAIGN_BUCKETS.items():
-        if campaign_name in campaigns:
-            # Extract state from bucket name
-            if 'California' in bucket or 'CA' in bucket:
-                return 'CA'
-            elif 'Arizona' in bucket or 'AZ' in bucket:
-                return 'AZ'
-            elif 'Georgia' in bucket or 'GA' in bucket:
-                return 'GA'
-            elif 'Texas' in bucket or 'TX' in bucket:
-                return 'TX'
-    
-    # Fallback: check campaign name directly
-    campaign_lower = campaign_name.lower()
-    if any(x in campaign_lower for x in ['california', ' ca ', 'los angeles', 'san diego', 'san francisco']):
-        return 'CA'
-    elif any(x in campaign_lower for x in ['arizona', ' az ', 'phoenix', 'tucson']):
-        return 'AZ'
-    elif any(x in campaign_lower for x in ['georgia', ' ga ', 'atlanta']):
-        return 'GA'
-    elif any(x in campaign_lower for x in ['texas', ' tx ', 'houston', 'dallas', 'austin']):
-        return 'TX'
+    state = CAMPAIGN_TO_STATE.get(campaign_name)
+    if state:
+        return state
     
-    return 'CA'  # Default to CA if unable to determine
+    # Fallback: check campaign name directly (defaults to CA if unable to determine)
+    return state_from_campaign_name(campaign_name)
 
 
 def determine_state_from_utm(utm_campaign):
@@ -1962,27 +2494,79 @@ def determine_state_from_utm(utm_campaign):
     bucket = UTM_TO_BUCKET_MAPPING.get(utm_campaign)
     
     if bucket:
-        if 'California' in bucket or 'CA' in bucket:
-            return 'CA'
-        elif 'Arizona' in bucket or 'AZ' in bucket:
-            return 'AZ'
-        elif 'Georgia' in bucket or 'GA' in bucket:
-            return 'GA'
-        elif 'Texas' in bucket or 'TX' in bucket:
-            return 'TX'
-    
-    # Fallback: check UTM campaign directly
-    utm_lower = utm_campaign.lower()
-    if any(x in utm_lower for x in ['california', '_ca_', 'losangeles', 'sandiego']):
-        return 'CA'
-    elif any(x in utm_lower for x in ['arizona', '_az_', 'phoenix']):
-        return 'AZ'
-    elif any(x in utm_lower for x in ['georgia', '_ga_', 'atlanta']):
-        return 'GA'
-    elif any(x in utm_lower for x in ['texas', '_tx_', 'houston', 'dallas']):
-        return 'TX'
+        state = determine_state_from_bucket(bucket)
+        if state:
+            return state
+    
+    # Fallback: check UTM campaign directly (defaults to CA)
+    return state_from_utm_name(utm_campaign)
+
+
+def compute_day_metrics(campaigns, leads):
+    """Spend, leads, unique cases and retainers for one day's campaign rows and Litify leads (either may be None)"""
+    metrics = {'spend': 0, 'leads': 0, 'cases': 0, 'retainers': 0}
+    
+    if campaigns:
+        for campaign in campaigns:
+            metrics['spend'] += campaign.get('cost', 0)
+    
+    if leads and PANDAS_AVAILABLE and len(leads) >= PANDAS_PACING_MIN_LEADS:
+        df = lead_frame(leads)
+        metrics['leads'] = len(df)
+        metrics['cases'] = int(df['matter'].nunique())
+        metrics['retainers'] = int(df['retained'].sum())
+    elif leads:
+        metrics['leads'] = len(leads)
+        case_ids = set()
+        retainer_count = 0
+        
+        for lead in leads:
+            if lead.get('Retainer_Signed_Date__c'):
+                retainer_count += 1
+            
+            matter_id = lead.get('litify_pm__Matter__c')
+            if matter_id:
+                case_ids.add(matter_id)
+        
+        metrics['cases'] = len(case_ids)
+        metrics['retainers'] = retainer_count
+    
+    return metrics
+
+
+def load_day_metrics(date_str, include_spam=False, include_abandoned=False, include_duplicate=False,
+                     force_refresh=False):
+    """
+    Fetch and compute one day's metrics without the metrics cache
+    force_refresh bypasses the source fetches' own caches too (for refresh-ahead reloads)
+    """
+    # Fetch Google Ads data for the day
+    campaigns = None
+    if ads_manager.connected:
+        campaigns = ads_manager.fetch_campaigns(date_str, date_str, active_only=False, force_refresh=force_refresh)
     
-    return 'CA'  # Default to CA
+    # Fetch Litify data for the day
+    leads = None
+    if litify_manager.connected:
+        leads = litify_manager.fetch_detailed_leads(
+            date_str, date_str,
+            limit=500,
+            include_spam=include_spam,
+            include_abandoned=include_abandoned,
+            include_duplicate=include_duplicate,
+            force_refresh=force_refresh
+        )
+    
+    return compute_day_metrics(campaigns, leads)
+
+
+def cache_day_metrics(date_str, metrics, include_spam=False, include_abandoned=False, include_duplicate=False):
+    """Put a day's metrics in daily_cache, reloading them in the background before they expire"""
+    daily_cache.set_day(
+        date_str, metrics, f'metrics_{include_spam}_{include_abandoned}_{include_duplicate}',
+        loader=partial(load_day_metrics, date_str, include_spam, include_abandoned, include_duplicate,
+                       force_refresh=True)
+    )
 
 
 def fetch_single_day_metrics(date_str, include_spam=False, include_abandoned=False, include_duplicate=False):
@@ -1995,45 +2579,67 @@ def fetch_single_day_metrics(date_str, include_spam=False, include_abandoned=Fal
     if cached:
         return cached
     
-    # Initialize metrics
-    metrics = {'spend': 0, 'leads': 0, 'cases': 0, 'retainers': 0}
+    metrics = load_day_metrics(date_str, include_spam, include_abandoned, include_duplicate)
+    
+    # Cache the result
+    cache_day_metrics(date_str, metrics, include_spam, include_abandoned, include_duplicate)
+    
+    return metrics
+
+
+def fetch_range_day_metrics(date_strs, include_spam=False, include_abandoned=False, include_duplicate=False):
+    """
+    Metrics for each day in date_strs (consecutive 'YYYY-MM-DD' days), keyed by date
+    Days missing from daily_cache are fetched with one Google Ads and one Litify call for the
+    whole span and split per day; if a range result can't be split, those days fall back to
+    parallel single-day fetches. A day whose fetch fails maps to None.
+    """
+    cache_type = f'metrics_{include_spam}_{include_abandoned}_{include_duplicate}'
+    results = {}
+    missing = []
+    for date_str in date_strs:
+        cached = daily_cache.get_day(date_str, cache_type)
+        if cached:
+            results[date_str] = cached
+        else:
+            missing.append(date_str)
+    
+    if not missing:
+        return results
+    
+    range_start, range_end = missing[0], missing[-1]
+    
+    # None means the range fetch couldn't be split per day - fall back to per-day calls
+    campaigns_by_day = {}
+    leads_by_day = {}
     
-    # Fetch Google Ads data for the day
     if ads_manager.connected:
-        campaigns = ads_manager.fetch_campaigns(date_str, date_str, active_only=False)
-        if campaigns:
-            for campaign in campaigns:
-                metrics['spend'] += campaign.get('cost', 0)
+        range_campaigns = ads_manager.fetch_campaigns(range_start, range_end, active_only=False, by_date=True)
+        campaigns_by_day = group_campaigns_by_day(range_campaigns) if range_campaigns is not None else None
     
-    # Fetch Litify data for the day
     if litify_manager.connected:
-        leads = litify_manager.fetch_detailed_leads(
-            date_str, date_str,
-            limit=500,
+        range_leads = litify_manager.fetch_detailed_leads(
+            range_start, range_end, limit=500 * len(missing),
             include_spam=include_spam,
             include_abandoned=include_abandoned,
             include_duplicate=include_duplicate
         )
-        if leads:
-            metrics['leads'] = len(leads)
-            case_ids = set()
-            retainer_count = 0
-            
-            for lead in leads:
-                if lead.get('Retainer_Signed_Date__c'):
-                    retainer_count += 1
-                
-                matter_id = lead.get('litify_pm__Matter__c')
-                if matter_id:
-                    case_ids.add(matter_id)
-            
-            metrics['cases'] = len(case_ids)
-            metrics['retainers'] = retainer_count
-    
-    # Cache the result
-    daily_cache.set_day(date_str, metrics, cache_type)
-    
-    return metrics
+        leads_by_day = group_leads_by_day(range_leads, range_start, range_end) if range_leads is not None else None
+    
+    if campaigns_by_day is None or leads_by_day is None:
+        logger.warning(f"⚠️ Range fetch for {range_start} to {range_end} could not be split by day - fetching days individually")
+        results.update(parallel_map(partial(
+            fetch_single_day_metrics, include_spam=include_spam,
+            include_abandoned=include_abandoned, include_duplicate=include_duplicate
+        ), missing, timeout=60))
+        return results
+    
+    for date_str in missing:
+        metrics = compute_day_metrics(campaigns_by_day.get(date_str), leads_by_day.get(date_str))
+        cache_day_metrics(date_str, metrics, include_spam, include_abandoned, include_duplicate)
+        results[date_str] = metrics
+    
+    return results
 
 
 def fetch_daily_pacing_data(start_date, end_date, include_spam=False, include_abandoned=False, include_duplicate=False):
@@ -2046,25 +2652,17 @@ def fetch_daily_pacing_data(start_date, end_date, include_spam=False, include_ab
     start = datetime.strptime(start_date, '%Y-%m-%d')
     end = datetime.strptime(end_date, '%Y-%m-%d')
     
-    # Use parallel fetching for multiple days
-    fetch_functions = {}
+    # One range fetch per source for the days not already in daily_cache
+    date_strs = []
     current = start
-    
     while current <= end:
-        date_str = current.strftime('%Y-%m-%d')
-        fetch_functions[date_str] = lambda d=date_str: fetch_single_day_metrics(
-            d, include_spam, include_abandoned, include_duplicate
-        )
+        date_strs.append(current.strftime('%Y-%m-%d'))
         current += timedelta(days=1)
     
-    # Execute parallel fetch
-    if len(fetch_functions) > 1:
-        results = parallel_fetch(fetch_functions, timeout=30)
-    else:
-        results = {date_str: fetch_functions[date_str]() for date_str in fetch_functions}
+    results = fetch_range_day_metrics(date_strs, include_spam, include_abandoned, include_duplicate)
     
     # Build daily data array
-    for date_str in sorted(results.keys()):
+    for date_str in date_strs:
         daily_data.append({
             'date': date_str,
             'metrics': results[date_str]
@@ -2092,60 +2690,48 @@ def generate_forecast_recommendations(projections):
     """
     Generate actionable recommendations based on projections
     """
-    recommendations = []
-    time_percent = projections['time_metrics']['percent_complete']
+    # One list per severity, appended in check order - concatenating them is the severity ordering.
+    # Entries are (state, type, severity, message template, template args); only the ones that
+    # make the top 10 get their message formatted
+    high, medium, low = [], [], []
     
     for state, data in projections['states'].items():
         variance = data['variance_percent']
+        metrics = data['metrics']
         
         # Check spend pacing
         if variance['spend'] < -10:
-            recommendations.append({
-                'state': state,
-                'type': 'spend',
-                'severity': 'high',
-                'message': f"{state} is {abs(variance['spend']):.1f}% under spend target. Consider increasing daily budget by ${data['required_daily']['spend']:,.0f}/day."
-            })
+            high.append((state, 'spend', 'high',
+                         "{} is {:.1f}% under spend target. Consider increasing daily budget by ${:,.0f}/day.",
+                         (state, abs(variance['spend']), data['required_daily']['spend'])))
         elif variance['spend'] > 10:
-            recommendations.append({
-                'state': state,
-                'type': 'spend',
-                'severity': 'medium',
-                'message': f"{state} is {variance['spend']:.1f}% over spend target. Consider reducing daily budget."
-            })
+            medium.append((state, 'spend', 'medium',
+                           "{} is {:.1f}% over spend target. Consider reducing daily budget.",
+                           (state, variance['spend'])))
         
         # Check lead pacing
         if variance['leads'] < -10:
-            recommendations.append({
-                'state': state,
-                'type': 'leads',
-                'severity': 'high',
-                'message': f"{state} needs {data['required_daily']['leads']:.0f} leads/day to hit target (current: {data['daily_rates']['leads']:.1f}/day)."
-            })
+            high.append((state, 'leads', 'high',
+                         "{} needs {:.0f} leads/day to hit target (current: {:.1f}/day).",
+                         (state, data['required_daily']['leads'], data['daily_rates']['leads'])))
         
         # Check CPL efficiency
-        if data['metrics']['current_cpl'] > data['metrics']['target_cpl'] * 1.2:
-            recommendations.append({
-                'state': state,
-                'type': 'efficiency',
-                'severity': 'medium',
-                'message': f"{state} CPL is ${data['metrics']['current_cpl']:.0f} (target: ${data['metrics']['target_cpl']:.0f}). Review campaign targeting and quality."
-            })
+        if metrics['current_cpl'] > metrics['target_cpl'] * 1.2:
+            medium.append((state, 'efficiency', 'medium',
+                           "{} CPL is ${:.0f} (target: ${:.0f}). Review campaign targeting and quality.",
+                           (state, metrics['current_cpl'], metrics['target_cpl'])))
         
         # Check conversion rate
-        if data['metrics']['current_conversion'] < data['metrics']['target_conversion'] * 0.8:
-            recommendations.append({
-                'state': state,
-                'type': 'conversion',
-                'severity': 'medium',
-                'message': f"{state} conversion rate is {data['metrics']['current_conversion']:.1f}% (target: {data['metrics']['target_conversion']:.1f}%). Review lead quality and intake process."
-            })
-    
-    # Sort by severity
-    severity_order = {'high': 0, 'medium': 1, 'low': 2}
-    recommendations.sort(key=lambda x: severity_order.get(x['severity'], 3))
-    
-    return recommendations[:10]  # Return top 10 recommendations
+        if metrics['current_conversion'] < metrics['target_conversion'] * 0.8:
+            medium.append((state, 'conversion', 'medium',
+                           "{} conversion rate is {:.1f}% (target: {:.1f}%). Review lead quality and intake process.",
+                           (state, metrics['current_conversion'], metrics['target_conversion'])))
+    
+    # Return top 10 recommendations, most severe first
+    return [
+        {'state': state, 'type': rec_type, 'severity': severity, 'message': template.format(*args)}
+        for state, rec_type, severity, template, args in (high + medium + low)[:10]
+    ]
 
 def calculate_comparison_dates(period, custom_start=None, custom_end=None):
     """Calculate date ranges for comparison periods with Pacific Time"""
@@ -2189,7 +2775,7 @@ def calculate_comparison_dates(period, custom_start=None, custom_end=None):
             compare_start = start.replace(month=start.month-1)
             compare_end = end.replace(month=end.month-1)
             # Adjust for different month lengths
-            last_day_prev_month = calendar.monthrange(compare_start.year, compare_start.month)[1]
+            last_day_prev_month = get_month_end_day(compare_start.year, compare_start.month)
             if compare_end.day > last_day_prev_month:
                 compare_end = compare_end.replace(day=last_day_prev_month)
     
@@ -2284,11 +2870,12 @@ def api_comparison_data():
     include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
     
     # Calculate date ranges with Pacific Time
+    now_pt = datetime.now(PACIFIC_TZ)
     if period == 'custom' and custom_start and custom_end:
         current_start = custom_start
         current_end = custom_end
     else:
-        today_pt = datetime.now(PACIFIC_TZ).date()
+        today_pt = now_pt.date()
         if period == 'today':
             current_start = current_end = today_pt.strftime('%Y-%m-%d')
         elif period == 'yesterday':
@@ -2299,10 +2886,10 @@ def api_comparison_data():
             current_start = week_start.strftime('%Y-%m-%d')
             current_end = today_pt.strftime('%Y-%m-%d')
         elif period == 'month':
-            current_start = date(today_pt.year, today_pt.month, 1).strftime('%Y-%m-%d')
+            current_start = month_bounds(today_pt)[0]
             current_end = today_pt.strftime('%Y-%m-%d')
         else:  # mtd
-            current_start = date(today_pt.year, today_pt.month, 1).strftime('%Y-%m-%d')
+            current_start = month_bounds(today_pt)[0]
             current_end = today_pt.strftime('%Y-%m-%d')
     
     compare_start, compare_end = calculate_comparison_dates(
@@ -2345,7 +2932,7 @@ def api_comparison_data():
             'data': compare_data
         },
         'changes': changes,
-        'timestamp': datetime.now(PACIFIC_TZ).isoformat()
+        'timestamp': now_pt.isoformat()
     })
 
 @app.route('/api/annual-data')
@@ -2364,8 +2951,8 @@ def api_annual_data():
         include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
         
         # Get current year or specified year
-        year = request.args.get('year', datetime.now(PACIFIC_TZ).year, type=int)
         current_date_pt = datetime.now(PACIFIC_TZ)
+        year = request.args.get('year', current_date_pt.year, type=int)
         current_month = current_date_pt.month if year == current_date_pt.year else 12
         
         monthly_data = []
@@ -2382,6 +2969,40 @@ def api_annual_data():
             'avg_conversion_rate': 0
         }
         
+        # Demo summaries for months without real data (drawn in one batch on first use)
+        demo_month_summaries = None
+        
+        # Date range of every past/current month (the current month ends today)
+        month_ranges = {}
+        for month_num in range(1, current_month + 1):
+            month_start = date(year, month_num, 1)
+            if month_start > current_date_pt.date():
+                continue
+            start_date, end_date = month_bounds(month_start)
+            if month_num == current_date_pt.month and year == current_date_pt.year:
+                end_date = current_date_pt.strftime('%Y-%m-%d')
+            month_ranges[month_num] = (start_date, end_date)
+        
+        def fetch_month(date_range):
+            """(campaigns, litify_leads) for one month - INCLUDING ALL CAMPAIGNS (not just active)"""
+            start_date, end_date = date_range
+            campaigns = None
+            litify_leads = []
+            if ads_manager.connected:
+                campaigns = ads_manager.fetch_campaigns(start_date, end_date, active_only=False)
+            if litify_manager.connected:
+                litify_leads = litify_manager.fetch_detailed_leads(
+                    start_date, end_date, limit=2000,
+                    include_spam=include_spam,
+                    include_abandoned=include_abandoned,
+                    include_duplicate=include_duplicate
+                )
+            return campaigns, litify_leads
+        
+        # The months are independent - fetch them all at once instead of one after another
+        # (no overall timeout, as before; each fetch has its own)
+        month_results = parallel_map(fetch_month, list(month_ranges.values()), timeout=None)
+        
         # Process each month
         for month_num in range(1, current_month + 1):
             month_date = datetime(year, month_num, 1, tzinfo=PACIFIC_TZ)
@@ -2410,39 +3031,12 @@ def api_annual_data():
                 })
                 continue
             
-            # Calculate date range for the month
-            if month_num == 12:
-                next_month_date = datetime(year + 1, 1, 1, tzinfo=PACIFIC_TZ)
-            else:
-                next_month_date = datetime(year, month_num + 1, 1, tzinfo=PACIFIC_TZ)
-            
-            start_date = month_date.strftime('%Y-%m-%d')
-            end_date = (next_month_date - timedelta(days=1)).strftime('%Y-%m-%d')
-            
-            # For current month, end at today
-            if is_current:
-                end_date = current_date_pt.strftime('%Y-%m-%d')
-            
-            # Fetch data for this month
-            campaigns = None
-            litify_leads = []
-            
-            # Fetch Google Ads campaigns - INCLUDING ALL CAMPAIGNS (not just active)
-            if ads_manager.connected:
-                campaigns = ads_manager.fetch_campaigns(start_date, end_date, active_only=False)
-                if campaigns:
-                    logger.info(f"Fetched {len(campaigns)} campaigns for {month_name} {year} (ALL statuses)")
-            
-            # Fetch Litify leads
-            if litify_manager.connected:
-                litify_leads = litify_manager.fetch_detailed_leads(
-                    start_date, end_date, limit=2000,
-                    include_spam=include_spam,
-                    include_abandoned=include_abandoned,
-                    include_duplicate=include_duplicate
-                )
-                if litify_leads:
-                    logger.info(f"Fetched {len(litify_leads)} Litify leads for {month_name} {year}")
+            # This month's prefetched data (None if its fetch raised)
+            campaigns, litify_leads = month_results[month_ranges[month_num]] or (None, [])
+            if campaigns:
+                logger.info(f"Fetched {len(campaigns)} campaigns for {month_name} {year} (ALL statuses)")
+            if litify_leads:
+                logger.info(f"Fetched {len(litify_leads)} Litify leads for {month_name} {year}")
             
             # Process data for this month
             if campaigns or litify_leads:
@@ -2466,7 +3060,9 @@ def api_annual_data():
                 }
             else:
                 # Use demo data from module if no real data available
-                month_summary = demo_data.get_demo_monthly_summary()
+                if demo_month_summaries is None:
+                    demo_month_summaries = iter(demo_data.get_demo_monthly_summaries(current_month))
+                month_summary = next(demo_month_summaries)
             
             # Calculate metrics
             if month_summary['leads'] > 0:
@@ -2583,13 +3179,13 @@ def api_current_month_daily():
         # Get current month date range in Pacific Time
         now_pt = datetime.now(PACIFIC_TZ)
         month_start = date(now_pt.year, now_pt.month, 1)
-        month_end = date(now_pt.year, now_pt.month, calendar.monthrange(now_pt.year, now_pt.month)[1])
+        month_end = date(now_pt.year, now_pt.month, get_month_end_day(now_pt.year, now_pt.month))
         today = now_pt.date()
         
         # Initialize daily data structure
         daily_data = []
-        previous_day_data = None
-        previous_buckets_data = {}  # Store previous day bucket data for deltas
+        previous_day_data = ZERO_DAY
+        previous_buckets_data = defaultdict(lambda: ZERO_BUCKET)  # Previous day bucket data for deltas
         
         # Month totals for summary
         month_totals = {
@@ -2614,7 +3210,13 @@ def api_current_month_daily():
         }
         
         # Get list of available buckets from the campaign mapping
-        available_buckets = list(BUCKET_PRIORITY)
+        available_buckets = AVAILABLE_BUCKETS
+        
+        # Weekend flags for the whole month, derived from the 1st's weekday
+        first_weekday = month_start.weekday()
+        is_weekend = [(first_weekday + i) % 7 >= 5 for i in range(month_end.day)]
+        # Demo totals for days without data, drawn for the whole month at once
+        demo_day_totals = demo_data.get_demo_day_totals(month_end.day)
         
         # Process each day of the month
         for day_num in range(1, month_end.day + 1):
@@ -2629,7 +3231,7 @@ def api_current_month_daily():
                     'dayName': current_date.strftime('%a'),
                     'isToday': False,
                     'isFuture': True,
-                    'isWeekend': current_date.weekday() >= 5,
+                    'isWeekend': is_weekend[day_num - 1],
                     'spend': 0,
                     'leads': 0,
                     'inPractice': 0,
@@ -2696,53 +3298,42 @@ def api_current_month_daily():
                 # Process each bucket for this day
                 day_buckets = []
                 for bucket in buckets:
-                    bucket_name = bucket['name']
+                    (bucket_name, cost, leads, in_practice, unqualified,
+                     cases, retainers, cpl, cpa, cpr) = BUCKET_METRIC_FIELDS(bucket)
                     
                     # Calculate bucket metrics
                     bucket_metrics = {
                         'name': bucket_name,
-                        'spend': bucket['cost'],
-                        'leads': bucket['leads'],
-                        'inPractice': bucket['inPractice'],
-                        'unqualified': bucket['unqualified'],
-                        'cases': bucket['cases'],
-                        'retainers': bucket['retainers'],
-                        'cpl': bucket['costPerLead'] if bucket.get('costPerLead') else 0,
-                        'cpa': bucket['cpa'] if bucket.get('cpa') else 0,
-                        'cpr': bucket['costPerRetainer'] if bucket.get('costPerRetainer') else 0,
-                        'convRate': bucket['conversionRate'] if bucket.get('conversionRate') else 0
+                        'spend': cost,
+                        'leads': leads,
+                        'inPractice': in_practice,
+                        'unqualified': unqualified,
+                        'cases': cases,
+                        'retainers': retainers,
+                        'cpl': cpl,
+                        'cpa': cpa,
+                        'cpr': cpr,
+                        'convRate': bucket['conversionRate']
                     }
                     
-                    # Calculate bucket deltas if we have previous day data
-                    if bucket_name in previous_buckets_data:
-                        prev_bucket = previous_buckets_data[bucket_name]
-                        
-                        # Spend delta (absolute dollar amount)
-                        bucket_metrics['spendDelta'] = bucket_metrics['spend'] - prev_bucket['spend']
-                        
-                        # Other deltas
-                        bucket_metrics['leadsDelta'] = bucket_metrics['leads'] - prev_bucket['leads']
-                        bucket_metrics['inPracticeDelta'] = bucket_metrics['inPractice'] - prev_bucket['inPractice']
-                        bucket_metrics['casesDelta'] = bucket_metrics['cases'] - prev_bucket['cases']
-                        bucket_metrics['retainersDelta'] = bucket_metrics['retainers'] - prev_bucket['retainers']
-                        
-                        # CPL delta
-                        if prev_bucket['cpl'] > 0:
-                            bucket_metrics['cplDelta'] = round(((bucket_metrics['cpl'] - prev_bucket['cpl']) / prev_bucket['cpl']) * 100, 1)
-                        else:
-                            bucket_metrics['cplDelta'] = 0
-                        
-                        # Conversion rate delta
-                        bucket_metrics['convDelta'] = round((bucket_metrics['convRate'] - prev_bucket['convRate']) * 100, 1)
-                    else:
-                        # First day of month - no deltas
-                        bucket_metrics['spendDelta'] = 0
-                        bucket_metrics['leadsDelta'] = 0
-                        bucket_metrics['inPracticeDelta'] = 0
-                        bucket_metrics['casesDelta'] = 0
-                        bucket_metrics['retainersDelta'] = 0
-                        bucket_metrics['cplDelta'] = 0
-                        bucket_metrics['convDelta'] = 0
+                    # Calculate bucket deltas (unseen buckets compare against ZERO_BUCKET,
+                    # the first day with bucket data is zeroed after the loop)
+                    prev_bucket = previous_buckets_data[bucket_name]
+                    
+                    # Spend delta (absolute dollar amount)
+                    bucket_metrics['spendDelta'] = bucket_metrics['spend'] - prev_bucket['spend']
+                    
+                    # Other deltas
+                    bucket_metrics['leadsDelta'] = bucket_metrics['leads'] - prev_bucket['leads']
+                    bucket_metrics['inPracticeDelta'] = bucket_metrics['inPractice'] - prev_bucket['inPractice']
+                    bucket_metrics['casesDelta'] = bucket_metrics['cases'] - prev_bucket['cases']
+                    bucket_metrics['retainersDelta'] = bucket_metrics['retainers'] - prev_bucket['retainers']
+                    
+                    # CPL delta
+                    bucket_metrics['cplDelta'] = round(((bucket_metrics['cpl'] - prev_bucket['cpl']) / prev_bucket['cpl']) * 100, 1) if prev_bucket['cpl'] > 0 else 0
+                    
+                    # Conversion rate delta
+                    bucket_metrics['convDelta'] = round((bucket_metrics['convRate'] - prev_bucket['convRate']) * 100, 1)
                     
                     day_buckets.append(bucket_metrics)
                     
@@ -2752,13 +3343,14 @@ def api_current_month_daily():
                 day_data['buckets'] = day_buckets
             else:
                 # Use demo data or zeros
+                demo_totals = demo_day_totals[day_num - 1]
                 day_data = {
-                    'spend': random.randint(20000, 50000) if not ads_manager.connected else 0,
-                    'leads': random.randint(15, 40) if not litify_manager.connected else 0,
-                    'inPractice': random.randint(12, 35) if not litify_manager.connected else 0,
-                    'unqualified': random.randint(2, 8) if not litify_manager.connected else 0,
-                    'cases': random.randint(3, 10) if not litify_manager.connected else 0,
-                    'retainers': random.randint(4, 12) if not litify_manager.connected else 0,
+                    'spend': demo_totals['spend'] if not ads_manager.connected else 0,
+                    'leads': demo_totals['leads'] if not litify_manager.connected else 0,
+                    'inPractice': demo_totals['inPractice'] if not litify_manager.connected else 0,
+                    'unqualified': demo_totals['unqualified'] if not litify_manager.connected else 0,
+                    'cases': demo_totals['cases'] if not litify_manager.connected else 0,
+                    'retainers': demo_totals['retainers'] if not litify_manager.connected else 0,
                     'buckets': []  # No bucket data for demo
                 }
             
@@ -2783,66 +3375,43 @@ def api_current_month_daily():
             else:
                 day_data['convRate'] = 0
             
-            # Calculate deltas (day-over-day changes)
-            if previous_day_data:
-                # Spend delta 
-                day_data['spendDelta'] = day_data['spend'] - previous_day_data['spend']
-                
-                # Leads delta (absolute)
-                day_data['leadsDelta'] = day_data['leads'] - previous_day_data['leads']
-                
-                # In Practice delta (absolute)
-                day_data['inPracticeDelta'] = day_data['inPractice'] - previous_day_data['inPractice']
-                
-                # Unqualified delta (absolute)
-                day_data['unqualifiedDelta'] = day_data['unqualified'] - previous_day_data['unqualified']
-                
-                # Cases delta (absolute)
-                day_data['casesDelta'] = day_data['cases'] - previous_day_data['cases']
-                
-                # Retainers delta (absolute)
-                day_data['retainersDelta'] = day_data['retainers'] - previous_day_data['retainers']
-                
-                # CPL delta (percentage)
-                if previous_day_data['cpl'] > 0:
-                    day_data['cplDelta'] = round(((day_data['cpl'] - previous_day_data['cpl']) / previous_day_data['cpl']) * 100, 1)
-                else:
-                    day_data['cplDelta'] = 0
-                
-                # CPA delta (percentage)
-                if previous_day_data['cpa'] > 0:
-                    day_data['cpaDelta'] = round(((day_data['cpa'] - previous_day_data['cpa']) / previous_day_data['cpa']) * 100, 1)
-                else:
-                    day_data['cpaDelta'] = 0
-                
-                # CPR delta (percentage)
-                if previous_day_data['cpr'] > 0:
-                    day_data['cprDelta'] = round(((day_data['cpr'] - previous_day_data['cpr']) / previous_day_data['cpr']) * 100, 1)
-                else:
-                    day_data['cprDelta'] = 0
-                
-                # Conversion rate delta (percentage points)
-                day_data['convDelta'] = round((day_data['convRate'] - previous_day_data['convRate']) * 100, 1)
-            else:
-                # First day of month - no previous day to compare
-                day_data['spendDelta'] = 0
-                day_data['leadsDelta'] = 0
-                day_data['inPracticeDelta'] = 0
-                day_data['unqualifiedDelta'] = 0
-                day_data['casesDelta'] = 0
-                day_data['retainersDelta'] = 0
-                day_data['cplDelta'] = 0
-                day_data['cpaDelta'] = 0
-                day_data['cprDelta'] = 0
-                day_data['convDelta'] = 0
+            # Calculate deltas (day-over-day changes; day 1 compares against ZERO_DAY
+            # and is zeroed after the loop)
+            prev = previous_day_data
             
-            # Add metadata
-            day_data['date'] = date_str
-            day_data['dayNum'] = day_num
-            day_data['dayName'] = current_date.strftime('%a')
-            day_data['isToday'] = current_date == today
-            day_data['isFuture'] = False
-            day_data['isWeekend'] = current_date.weekday() >= 5
+            # Spend delta 
+            day_data['spendDelta'] = day_data['spend'] - prev['spend']
+            
+            # Leads delta (absolute)
+            day_data['leadsDelta'] = day_data['leads'] - prev['leads']
+            
+            # In Practice delta (absolute)
+            day_data['inPracticeDelta'] = day_data['inPractice'] - prev['inPractice']
+            
+            # Unqualified delta (absolute)
+            day_data['unqualifiedDelta'] = day_data['unqualified'] - prev['unqualified']
+            
+            # Cases delta (absolute)
+            day_data['casesDelta'] = day_data['cases'] - prev['cases']
+            
+            # Retainers delta (absolute)
+            day_data['retainersDelta'] = day_data['retainers'] - prev['retainers']
+            
+            # CPL / CPA / CPR deltas (percentage)
+            day_data['cplDelta'] = round(((day_data['cpl'] - prev['cpl']) / prev['cpl']) * 100, 1) if prev['cpl'] > 0 else 0
+            day_data['cpaDelta'] = round(((day_data['cpa'] - prev['cpa']) / prev['cpa']) * 100, 1) if prev['cpa'] > 0 else 0
+            day_data['cprDelta'] = round(((day_data['cpr'] - prev['cpr']) / prev['cpr']) * 100, 1) if prev['cpr'] > 0 else 0
+            
+            # Conversion rate delta (percentage points)
+            day_data['convDelta'] = round((day_data['convRate'] - prev['convRate']) * 100, 1)
+            
+            # Add metadata
+            day_data['date'] = date_str
+            day_data['dayNum'] = day_num
+            day_data['dayName'] = current_date.strftime('%a')
+            day_data['isToday'] = current_date == today
+            day_data['isFuture'] = False
+            day_data['isWeekend'] = is_weekend[day_num - 1]
             
             # Update month totals
             month_totals['total_spend'] += day_data['spend']
@@ -2902,6 +3471,14 @@ def api_current_month_daily():
             # Store for next iteration's delta calculation
             previous_day_data = day_data
         
+        # First day of month (and first day with bucket data) has nothing to compare against
+        if daily_data:
+            daily_data[0].update(dict.fromkeys(DAY_DELTA_FIELDS, 0))
+        first_bucket_day = next((d for d in daily_data if d['buckets']), None)
+        if first_bucket_day:
+            for bucket_metrics in first_bucket_day['buckets']:
+                bucket_metrics.update(dict.fromkeys(BUCKET_DELTA_FIELDS, 0))
+        
         # Calculate month summary with today's deltas
         days_elapsed = min(today.day, month_end.day)
         today_data = daily_data[today.day - 1] if today.day <= len(daily_data) else None
@@ -2944,7 +3521,7 @@ def api_current_month_daily():
             'worst_days': worst_days,
             'available_buckets': available_buckets,  # Include available buckets for filtering
             'data_source': data_source,
-            'timestamp': datetime.now(PACIFIC_TZ).isoformat()
+            'timestamp': now_pt.isoformat()
         })
         
     except Exception as e:
@@ -2953,415 +3530,519 @@ def api_current_month_daily():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
     
-# Add this endpoint to your app.py - it fetches day by day with progress updates
+def group_campaigns_by_day(campaigns):
+    """
+    Group per-day campaign rows (fetched with by_date=True) by their 'date' field
+    Returns None if any row is missing the date so callers can fall back to per-day fetches
+    """
+    campaigns_by_day = defaultdict(list)
+    for campaign in campaigns:
+        day = campaign.get('date')
+        if not day:
+            return None
+        campaigns_by_day[day].append(campaign)
+    return campaigns_by_day
 
-@app.route('/api/current-month-daily-optimized')
-def api_current_month_daily_optimized():
+def group_leads_by_day(leads, start_date, end_date):
     """
-    Accurate day-by-day fetching with real-time progress updates
-    Shows exactly which date is being processed - Pacific Time support
+    Split a range of Litify leads into what a single-day fetch would return for each day (PT)
+    A lead lands on the day it was created (counted as a lead) and, if it was signed on a
+    later day in the range, on that day too as a conversion from a previous period
+    Returns None if any lead has no usable created date so callers can fall back to per-day fetches
     """
-    try:
-        import calendar
-        from datetime import datetime, date, timedelta
-        
-        # Initialize managers if needed
-        if not ads_manager.client:
-            ads_manager.initialize()
-        if not litify_manager.client:
-            litify_manager.initialize()
-        
-        # Get exclusion filter parameters
-        include_spam = request.args.get('include_spam', 'false').lower() == 'true'
-        include_abandoned = request.args.get('include_abandoned', 'false').lower() == 'true'
-        include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
-        
-        # Get current month date range in Pacific Time
-        now_pt = datetime.now(PACIFIC_TZ)
-        month_start = date(now_pt.year, now_pt.month, 1)
-        month_end = date(now_pt.year, now_pt.month, calendar.monthrange(now_pt.year, now_pt.month)[1])
-        today = now_pt.date()
-        
-        logger.info(f"🚀 Starting ACCURATE day-by-day fetch for {month_start} to {today}")
-        
-        # Initialize daily data structure
-        daily_data = []
-        previous_day_data = None
-        previous_buckets_data = {}
-        
-        # Month totals for summary
-        month_totals = {
-            'total_spend': 0,
-            'total_leads': 0,
-            'total_cases': 0,
-            'total_retainers': 0,
-            'total_in_practice': 0,
-            'total_unqualified': 0
+    leads_by_day = defaultdict(list)
+    for lead in leads:
+        created_raw = lead.get('created_date') or ''
+        try:
+            created_dt = datetime.fromisoformat(created_raw.replace('Z', '+00:00').replace('+0000', '+00:00'))
+        except ValueError:
+            return None
+        if created_dt.tzinfo is None:
+            return None
+        created_day = created_dt.astimezone(PACIFIC_TZ).strftime('%Y-%m-%d')
+        signed_day = lead.get('retainer_signed_date') or ''
+        
+        if start_date <= created_day <= end_date:
+            leads_by_day[created_day].append(dict(
+                lead,
+                from_previous_period=False,
+                count_for_leads=True,
+                is_new_today=True
+            ))
+        
+        if start_date <= signed_day <= end_date and signed_day != created_day:
+            leads_by_day[signed_day].append(dict(
+                lead,
+                from_previous_period=True,
+                count_for_leads=False,
+                is_new_today=False
+            ))
+    return leads_by_day
+
+# Longer ranges (quarter/year-to-date) pick best/worst days with pandas instead of Python scans
+PANDAS_BEST_WORST_MIN_DAYS = 92
+
+def find_best_worst_days_pandas(daily_data):
+    """
+    pandas version of find_best_worst_days for long ranges
+    Rows are only used to find positions; returned values come from daily_data itself
+    """
+    df = pd.DataFrame(daily_data, columns=['isFuture', 'leads', 'cpl', 'convRate', 'inPractice', 'spend', 'retainers'])
+    past = df[~df['isFuture']]
+    valid = past[past['leads'] > 0]
+    with_cpl = valid[valid['cpl'] > 0]
+    with_conv = past[past['convRate'] > 0]
+    with_in_practice = past[past['inPractice'] > 0]
+    with_spend = past[past['spend'] > 0]
+    
+    def pick(days, column, fields, largest):
+        if days.empty:
+            return None
+        day = daily_data[days[column].idxmax() if largest else days[column].idxmin()]
+        return {field: day[field] for field in fields}
+    
+    best_days = {
+        'highest_leads': pick(valid, 'leads', ('date', 'leads', 'spend'), True),
+        'best_conversion': pick(with_conv, 'convRate', ('date', 'convRate', 'retainers'), True),
+        'lowest_cpl': pick(with_cpl, 'cpl', ('date', 'cpl', 'leads'), False)
+    }
+    worst_days = {
+        'highest_cpl': pick(with_cpl, 'cpl', ('date', 'cpl', 'leads'), True),
+        'lowest_conversion': pick(with_in_practice, 'convRate', ('date', 'convRate', 'retainers'), False),
+        'inefficient': None
+    }
+    
+    if not with_spend.empty:
+        efficiency = with_spend['retainers'] / (with_spend['spend'] / 10000)
+        inefficient = daily_data[efficiency.idxmin()]
+        worst_days['inefficient'] = {
+            'date': inefficient['date'],
+            'spend': inefficient['spend'],
+            'retainers': inefficient['retainers'],
+            'efficiency': inefficient['retainers'] / (inefficient['spend'] / 10000)
         }
-        
-        # Best/worst tracking
-        best_days = {
-            'highest_leads': None,
-            'best_conversion': None,
-            'lowest_cpl': None
+    
+    return best_days, worst_days
+
+def find_best_worst_days(daily_data):
+    """
+    Pick best/worst days from a completed daily_data list in a single pass per metric
+    Only days with data qualify; future and empty days are skipped
+    """
+    if PANDAS_AVAILABLE and len(daily_data) >= PANDAS_BEST_WORST_MIN_DAYS:
+        return find_best_worst_days_pandas(daily_data)
+    
+    valid = [d for d in daily_data if not d['isFuture'] and d['leads'] > 0]
+    with_cpl = [d for d in valid if d['cpl'] > 0]
+    with_conv = [d for d in daily_data if not d['isFuture'] and d['convRate'] > 0]
+    with_in_practice = [d for d in daily_data if not d['isFuture'] and d['inPractice'] > 0]
+    with_spend = [d for d in daily_data if not d['isFuture'] and d['spend'] > 0]
+    
+    def efficiency(d):
+        return d['retainers'] / (d['spend'] / 10000)
+    
+    def pick(days, fields, choose, key):
+        day = choose(days, key=key, default=None)
+        if day is None:
+            return None
+        return {field: day[field] for field in fields}
+    
+    best_days = {
+        'highest_leads': pick(valid, ('date', 'leads', 'spend'), max, lambda d: d['leads']),
+        'best_conversion': pick(with_conv, ('date', 'convRate', 'retainers'), max, lambda d: d['convRate']),
+        'lowest_cpl': pick(with_cpl, ('date', 'cpl', 'leads'), min, lambda d: d['cpl'])
+    }
+    worst_days = {
+        'highest_cpl': pick(with_cpl, ('date', 'cpl', 'leads'), max, lambda d: d['cpl']),
+        'lowest_conversion': pick(with_in_practice, ('date', 'convRate', 'retainers'), min, lambda d: d['convRate']),
+        'inefficient': None
+    }
+    
+    inefficient = min(with_spend, key=efficiency, default=None)
+    if inefficient is not None:
+        worst_days['inefficient'] = {
+            'date': inefficient['date'],
+            'spend': inefficient['spend'],
+            'retainers': inefficient['retainers'],
+            'efficiency': efficiency(inefficient)
         }
-        worst_days = {
-            'highest_cpl': None,
-            'lowest_conversion': None,
-            'inefficient': None
+    
+    return best_days, worst_days
+
+def build_empty_day(current_date, today, is_weekend):
+    """Zero-valued day entry for days with no data (including future days)"""
+    return {
+        'date': current_date.strftime('%Y-%m-%d'),
+        'dayNum': current_date.day,
+        'dayName': current_date.strftime('%a'),
+        'isToday': current_date == today,
+        'isFuture': current_date > today,
+        'isWeekend': is_weekend,
+        'spend': 0,
+        'leads': 0,
+        'inPractice': 0,
+        'unqualified': 0,
+        'cases': 0,
+        'retainers': 0,
+        'cpl': 0,
+        'cpa': 0,
+        'cpr': 0,
+        'convRate': 0,
+        'buckets': [],
+        'spendDelta': None,
+        'leadsDelta': None,
+        'casesDelta': None,
+        'retainersDelta': None,
+        'cplDelta': None,
+        'cpaDelta': None,
+        'cprDelta': None,
+        'convDelta': None
+    }
+
+def build_month_summary(month_totals, daily_data, today, month_end):
+    """Month-to-date summary with today's deltas"""
+    days_elapsed = min(today.day, month_end.day)
+    today_data = daily_data[today.day - 1] if today.day <= len(daily_data) else None
+    
+    return {
+        'totalSpend': month_totals['total_spend'],
+        'totalLeads': month_totals['total_leads'],
+        'totalCases': month_totals['total_cases'],
+        'totalRetainers': month_totals['total_retainers'],
+        'avgCPL': round(month_totals['total_spend'] / month_totals['total_leads'], 2) if month_totals['total_leads'] > 0 else 0,
+        'avgCPA': round(month_totals['total_spend'] / month_totals['total_cases'], 2) if month_totals['total_cases'] > 0 else 0,
+        'avgCPR': round(month_totals['total_spend'] / month_totals['total_retainers'], 2) if month_totals['total_retainers'] > 0 else 0,
+        'convRate': round(month_totals['total_cases'] / month_totals['total_leads'], 3) if month_totals['total_leads'] > 0 else 0,
+        'dailyAvgSpend': round(month_totals['total_spend'] / days_elapsed, 2) if days_elapsed > 0 else 0,
+        'dailyAvgLeads': round(month_totals['total_leads'] / days_elapsed, 1) if days_elapsed > 0 else 0,
+        # Today's deltas
+        'spendDelta': today_data['spendDelta'] if today_data else 0,
+        'leadsDelta': today_data['leadsDelta'] if today_data else 0,
+        'casesDelta': today_data['casesDelta'] if today_data else 0,
+        'retainersDelta': today_data['retainersDelta'] if today_data else 0,
+        'cplDelta': today_data['cplDelta'] if today_data else 0,
+        'cpaDelta': today_data['cpaDelta'] if today_data else 0,
+        'convDelta': today_data['convDelta'] if today_data else 0
+    }
+
+def iter_current_month_daily(include_spam=False, include_abandoned=False, include_duplicate=False):
+    """
+    Accurate day-by-day fetching for the current month - Pacific Time support
+    Yields ('day', day_data) in dayNum order right after each day is processed
+    (deltas only need the previous day), then a single ('summary', {...}) with
+    month_summary, best/worst days and data source
+    """
+    # Initialize managers if needed
+    if not ads_manager.client:
+        ads_manager.initialize()
+    if not litify_manager.client:
+        litify_manager.initialize()
+    
+    # Get current month date range in Pacific Time
+    now_pt = datetime.now(PACIFIC_TZ)
+    month_start = date(now_pt.year, now_pt.month, 1)
+    month_end = date(now_pt.year, now_pt.month, get_month_end_day(now_pt.year, now_pt.month))
+    today = now_pt.date()
+    
+    logger.info(f"🚀 Starting ACCURATE day-by-day fetch for {month_start} to {today}")
+    
+    # Initialize daily data structure
+    daily_data = []
+    previous_day_data = None
+    previous_buckets_data = {}
+    
+    # Month totals for summary
+    month_totals = {
+        'total_spend': 0,
+        'total_leads': 0,
+        'total_cases': 0,
+        'total_retainers': 0,
+        'total_in_practice': 0,
+        'total_unqualified': 0
+    }
+    
+    # Get available buckets
+    available_buckets = AVAILABLE_BUCKETS
+    
+    # Weekend flags for the whole month, derived from the 1st's weekday
+    first_weekday = month_start.weekday()
+    is_weekend = [(first_weekday + i) % 7 >= 5 for i in range(month_end.day)]
+    
+    # Nothing connected - every day is empty, so skip the fetch and the per-day loop
+    if not ads_manager.connected and not litify_manager.connected:
+        logger.info("⚠️ No data sources connected - returning empty month")
+        daily_data = [
+            build_empty_day(month_start + timedelta(days=i), today, is_weekend[i])
+            for i in range(month_end.day)
+        ]
+        for day_data in daily_data:
+            yield 'day', day_data
+        
+        best_days, worst_days = find_best_worst_days(daily_data)
+        yield 'summary', {
+            'month_summary': build_month_summary(month_totals, daily_data, today, month_end),
+            'best_days': best_days,
+            'worst_days': worst_days,
+            'available_buckets': available_buckets,
+            'data_source': 'Demo Data',
+            'accuracy': 'HIGH',
+            'timestamp': now_pt.isoformat()
         }
+        return
+    
+    # ====================
+    # FETCH THE WHOLE RANGE ONCE, THEN BUCKET BY DAY
+    # ====================
+    range_start = month_start.strftime('%Y-%m-%d')
+    range_end = today.strftime('%Y-%m-%d')
+    
+    # None means the range fetch couldn't be split per day - fall back to per-day calls
+    campaigns_by_day = None
+    leads_by_day = None
+    
+    if ads_manager.connected:
+        range_campaigns = ads_manager.fetch_campaigns(range_start, range_end, active_only=False, by_date=True)
+        if range_campaigns is not None:
+            campaigns_by_day = group_campaigns_by_day(range_campaigns)
+            if campaigns_by_day is not None:
+                logger.info(f"  ✔️ Fetched {len(range_campaigns)} campaign-days for {range_start} to {range_end}")
+    
+    if litify_manager.connected:
+        range_leads = litify_manager.fetch_detailed_leads(
+            range_start, range_end, limit=500 * today.day,
+            include_spam=include_spam,
+            include_abandoned=include_abandoned,
+            include_duplicate=include_duplicate
+        )
+        if range_leads is not None:
+            leads_by_day = group_leads_by_day(range_leads, range_start, range_end)
+            if leads_by_day is not None:
+                logger.info(f"  ✔️ Fetched {len(range_leads)} Litify leads for {range_start} to {range_end}")
+    
+    # ====================
+    # PROCESS DATA DAY BY DAY WITH PROGRESS
+    # ====================
+    total_days = today.day
+    
+    for day_num in range(1, month_end.day + 1):
+        current_date = date(now_pt.year, now_pt.month, day_num)
+        date_str = current_date.strftime('%Y-%m-%d')
         
-        # Get available buckets
-        available_buckets = list(BUCKET_PRIORITY)
+        # Skip future dates
+        if current_date > today:
+            daily_data.append(build_empty_day(current_date, today, is_weekend[day_num - 1]))
+            yield 'day', daily_data[-1]
+            continue
         
-        # ====================
-        # FETCH DATA DAY BY DAY WITH PROGRESS
-        # ====================
-        total_days = today.day
+        # Log progress for this day
+        progress_pct = round((day_num / total_days) * 100)
+        logger.info(f"📅 Processing {date_str} ({day_num}/{total_days} - {progress_pct}%)")
         
-        for day_num in range(1, month_end.day + 1):
-            current_date = date(now_pt.year, now_pt.month, day_num)
-            date_str = current_date.strftime('%Y-%m-%d')
+        # Fetch data for this specific day
+        campaigns = None
+        litify_leads = []
+        
+        # Google Ads campaigns for this day
+        if campaigns_by_day is not None:
+            campaigns = campaigns_by_day.get(date_str)
+        elif ads_manager.connected:
+            campaigns = ads_manager.fetch_campaigns(date_str, date_str, active_only=False)
+            if campaigns:
+                logger.info(f"  ✔️ Fetched {len(campaigns)} campaigns for {date_str}")
+        
+        # Litify leads for this day
+        if leads_by_day is not None:
+            litify_leads = leads_by_day.get(date_str, [])
+        elif litify_manager.connected:
+            litify_leads = litify_manager.fetch_detailed_leads(
+                date_str, date_str, limit=500,
+                include_spam=include_spam,
+                include_abandoned=include_abandoned,
+                include_duplicate=include_duplicate
+            )
+            if litify_leads:
+                logger.info(f"  ✔️ Fetched {len(litify_leads)} Litify leads for {date_str}")
+        
+        # Process data for this day and get bucket breakdown
+        if campaigns or litify_leads:
+            campaigns_to_process = campaigns if campaigns else []
+            buckets, _, _, _ = process_campaigns_to_buckets_with_litify(
+                campaigns_to_process, litify_leads
+            )
             
-            # Skip future dates
-            if current_date > today:
-                daily_data.append({
-                    'date': date_str,
-                    'dayNum': day_num,
-                    'dayName': current_date.strftime('%a'),
-                    'isToday': False,
-                    'isFuture': True,
-                    'isWeekend': current_date.weekday() >= 5,
-                    'spend': 0,
-                    'leads': 0,
-                    'inPractice': 0,
-                    'unqualified': 0,
-                    'cases': 0,
-                    'retainers': 0,
-                    'cpl': 0,
-                    'cpa': 0,
-                    'cpr': 0,
-                    'convRate': 0,
-                    'buckets': [],
-                    'spendDelta': None,
-                    'leadsDelta': None,
-                    'casesDelta': None,
-                    'retainersDelta': None,
-                    'cplDelta': None,
-                    'cpaDelta': None,
-                    'cprDelta': None,
-                    'convDelta': None
-                })
-                continue
+            # Calculate day totals
+            day_data = {
+                'date': date_str,
+                'dayNum': day_num,
+                'dayName': current_date.strftime('%a'),
+                'isToday': current_date == today,
+                'isFuture': False,
+                'isWeekend': is_weekend[day_num - 1],
+                'spend': sum(b['cost'] for b in buckets),
+                'leads': sum(b['leads'] for b in buckets),
+                'inPractice': sum(b['inPractice'] for b in buckets),
+                'unqualified': sum(b['unqualified'] for b in buckets),
+                'cases': sum(b['cases'] for b in buckets),
+                'retainers': sum(b['retainers'] for b in buckets),
+                'buckets': []
+            }
             
-            # Log progress for this day
-            progress_pct = round((day_num / total_days) * 100)
-            logger.info(f"📅 Processing {date_str} ({day_num}/{total_days} - {progress_pct}%)")
+            # Calculate metrics
+            if day_data['leads'] > 0:
+                day_data['cpl'] = round(day_data['spend'] / day_data['leads'], 2)
+            else:
+                day_data['cpl'] = 0
             
-            # Fetch data for this specific day
-            campaigns = None
-            litify_leads = []
+            if day_data['cases'] > 0:
+                day_data['cpa'] = round(day_data['spend'] / day_data['cases'], 2)
+            else:
+                day_data['cpa'] = 0
             
-            # Fetch Google Ads campaigns for this day
-            if ads_manager.connected:
-                campaigns = ads_manager.fetch_campaigns(date_str, date_str, active_only=False)
-                if campaigns:
-                    logger.info(f"  ✔️ Fetched {len(campaigns)} campaigns for {date_str}")
+            if day_data['retainers'] > 0:
+                day_data['cpr'] = round(day_data['spend'] / day_data['retainers'], 2)
+            else:
+                day_data['cpr'] = 0
             
-            # Fetch Litify leads for this day
-            if litify_manager.connected:
-                litify_leads = litify_manager.fetch_detailed_leads(
-                    date_str, date_str, limit=500,
-                    include_spam=include_spam,
-                    include_abandoned=include_abandoned,
-                    include_duplicate=include_duplicate
+            if day_data['inPractice'] > 0:
+                day_data['convRate'] = round(
+                    (day_data['retainers'] / day_data['inPractice']) * 100, 1
                 )
-                if litify_leads:
-                    logger.info(f"  ✔️ Fetched {len(litify_leads)} Litify leads for {date_str}")
+            else:
+                day_data['convRate'] = 0
             
-            # Process data for this day and get bucket breakdown
-            if campaigns or litify_leads:
-                campaigns_to_process = campaigns if campaigns else []
-                buckets, _, _, _ = process_campaigns_to_buckets_with_litify(
-                    campaigns_to_process, litify_leads
-                )
-                
-                # Calculate day totals
-                day_data = {
-                    'date': date_str,
-                    'dayNum': day_num,
-                    'dayName': current_date.strftime('%a'),
-                    'isToday': current_date == today,
-                    'isFuture': False,
-                    'isWeekend': current_date.weekday() >= 5,
-                    'spend': sum(b['cost'] for b in buckets),
-                    'leads': sum(b['leads'] for b in buckets),
-                    'inPractice': sum(b['inPractice'] for b in buckets),
-                    'unqualified': sum(b['unqualified'] for b in buckets),
-                    'cases': sum(b['cases'] for b in buckets),
-                    'retainers': sum(b['retainers'] for b in buckets),
-                    'buckets': []
-                }
-                
-                # Calculate metrics
-                if day_data['leads'] > 0:
-                    day_data['cpl'] = round(day_data['spend'] / day_data['leads'], 2)
-                else:
-                    day_data['cpl'] = 0
-                
-                if day_data['cases'] > 0:
-                    day_data['cpa'] = round(day_data['spend'] / day_data['cases'], 2)
-                else:
-                    day_data['cpa'] = 0
+            # Process each bucket for this day
+            for bucket in buckets:
+                (bucket_name, cost, leads, in_practice, unqualified,
+                 cases, retainers, cpl, cpa, cpr) = BUCKET_METRIC_FIELDS(bucket)
                 
-                if day_data['retainers'] > 0:
-                    day_data['cpr'] = round(day_data['spend'] / day_data['retainers'], 2)
-                else:
-                    day_data['cpr'] = 0
-                
-                if day_data['inPractice'] > 0:
-                    day_data['convRate'] = round(
-                        (day_data['retainers'] / day_data['inPractice']) * 100, 1
-                    )
-                else:
-                    day_data['convRate'] = 0
+                # Calculate bucket metrics
+                bucket_metrics = BucketMetrics(
+                    bucket_name, cost, leads, in_practice, unqualified,
+                    cases, retainers, cpl, cpa, cpr,
+                    round((retainers / in_practice * 100) if in_practice > 0 else 0, 1)
+                )
                 
-                # Process each bucket for this day
-                for bucket in buckets:
-                    bucket_name = bucket['name']
-                    
-                    # Calculate bucket metrics
-                    bucket_metrics = {
-                        'name': bucket_name,
-                        'spend': bucket['cost'],
-                        'leads': bucket['leads'],
-                        'inPractice': bucket['inPractice'],
-                        'unqualified': bucket['unqualified'],
-                        'cases': bucket['cases'],
-                        'retainers': bucket['retainers'],
-                        'cpl': bucket.get('costPerLead', 0),
-                        'cpa': bucket.get('cpa', 0),
-                        'cpr': bucket.get('costPerRetainer', 0),
-                        'convRate': round(
-                            (bucket['retainers'] / bucket['inPractice'] * 100) 
-                            if bucket['inPractice'] > 0 else 0, 1
+                # Calculate bucket deltas
+                prev_bucket = previous_buckets_data.get(bucket_name)
+                if prev_bucket is not None:
+                    if prev_bucket.spend > 0:
+                        bucket_metrics.spendDelta = round(
+                            ((bucket_metrics.spend - prev_bucket.spend) / 
+                             prev_bucket.spend * 100), 1
                         )
-                    }
-                    
-                    # Calculate bucket deltas
-                    prev_bucket = previous_buckets_data.get(bucket_name)
-                    if prev_bucket:
-                        if prev_bucket['spend'] > 0:
-                            bucket_metrics['spendDelta'] = round(
-                                ((bucket_metrics['spend'] - prev_bucket['spend']) / 
-                                 prev_bucket['spend'] * 100), 1
-                            )
-                        else:
-                            bucket_metrics['spendDelta'] = 0
-                        bucket_metrics['leadsDelta'] = bucket_metrics['leads'] - prev_bucket['leads']
                     else:
-                        bucket_metrics['spendDelta'] = None
-                        bucket_metrics['leadsDelta'] = None
-                    
-                    day_data['buckets'].append(bucket_metrics)
-                    previous_buckets_data[bucket_name] = bucket_metrics
+                        bucket_metrics.spendDelta = 0
+                    bucket_metrics.leadsDelta = bucket_metrics.leads - prev_bucket.leads
                 
-                # Calculate deltas vs previous day
-                if previous_day_data:
-                    if previous_day_data['spend'] > 0:
-                        day_data['spendDelta'] = round(
-                            ((day_data['spend'] - previous_day_data['spend']) / 
-                             previous_day_data['spend'] * 100), 1
-                        )
-                    else:
-                        day_data['spendDelta'] = 0
-                    
-                    day_data['leadsDelta'] = day_data['leads'] - previous_day_data['leads']
-                    day_data['casesDelta'] = day_data['cases'] - previous_day_data['cases']
-                    day_data['retainersDelta'] = day_data['retainers'] - previous_day_data['retainers']
-                    
-                    if previous_day_data['cpl'] > 0:
-                        day_data['cplDelta'] = round(
-                            ((day_data['cpl'] - previous_day_data['cpl']) / 
-                             previous_day_data['cpl'] * 100), 1
-                        )
-                    else:
-                        day_data['cplDelta'] = 0
-                    
-                    if previous_day_data['cpa'] > 0:
-                        day_data['cpaDelta'] = round(
-                            ((day_data['cpa'] - previous_day_data['cpa']) / 
-                             previous_day_data['cpa'] * 100), 1
-                        )
-                    else:
-                        day_data['cpaDelta'] = 0
-                    
-                    if previous_day_data['cpr'] > 0:
-                        day_data['cprDelta'] = round(
-                            ((day_data['cpr'] - previous_day_data['cpr']) / 
-                             previous_day_data['cpr'] * 100), 1
-                        )
-                    else:
-                        day_data['cprDelta'] = 0
-                    
-                    day_data['convDelta'] = round(
-                        day_data['convRate'] - previous_day_data['convRate'], 1
+                day_data['buckets'].append(bucket_metrics)
+                previous_buckets_data[bucket_name] = bucket_metrics
+            
+            # Calculate deltas vs previous day
+            if previous_day_data:
+                if previous_day_data['spend'] > 0:
+                    day_data['spendDelta'] = round(
+                        ((day_data['spend'] - previous_day_data['spend']) / 
+                         previous_day_data['spend'] * 100), 1
                     )
                 else:
-                    # First day - no deltas
-                    day_data['spendDelta'] = None
-                    day_data['leadsDelta'] = None
-                    day_data['casesDelta'] = None
-                    day_data['retainersDelta'] = None
-                    day_data['cplDelta'] = None
-                    day_data['cpaDelta'] = None
-                    day_data['cprDelta'] = None
-                    day_data['convDelta'] = None
-                
-                # Update month totals
-                month_totals['total_spend'] += day_data['spend']
-                month_totals['total_leads'] += day_data['leads']
-                month_totals['total_cases'] += day_data['cases']
-                month_totals['total_retainers'] += day_data['retainers']
-                month_totals['total_in_practice'] += day_data['inPractice']
-                month_totals['total_unqualified'] += day_data['unqualified']
+                    day_data['spendDelta'] = 0
                 
-                # Track best/worst days
-                if day_data['leads'] > 0:
-                    if not best_days['highest_leads'] or day_data['leads'] > best_days['highest_leads']['leads']:
-                        best_days['highest_leads'] = {
-                            'date': date_str,
-                            'leads': day_data['leads'],
-                            'spend': day_data['spend']
-                        }
-                    
-                    if day_data['cpl'] > 0:
-                        if not best_days['lowest_cpl'] or day_data['cpl'] < best_days['lowest_cpl']['cpl']:
-                            best_days['lowest_cpl'] = {
-                                'date': date_str,
-                                'cpl': day_data['cpl'],
-                                'leads': day_data['leads']
-                            }
-                        
-                        if not worst_days['highest_cpl'] or day_data['cpl'] > worst_days['highest_cpl']['cpl']:
-                            worst_days['highest_cpl'] = {
-                                'date': date_str,
-                                'cpl': day_data['cpl'],
-                                'leads': day_data['leads']
-                            }
-                
-                if day_data['convRate'] > 0:
-                    if not best_days['best_conversion'] or day_data['convRate'] > best_days['best_conversion']['convRate']:
-                        best_days['best_conversion'] = {
-                            'date': date_str,
-                            'convRate': day_data['convRate'],
-                            'retainers': day_data['retainers']
-                        }
+                day_data['leadsDelta'] = day_data['leads'] - previous_day_data['leads']
+                day_data['casesDelta'] = day_data['cases'] - previous_day_data['cases']
+                day_data['retainersDelta'] = day_data['retainers'] - previous_day_data['retainers']
                 
-                if day_data['inPractice'] > 0:  # Only count days with in-practice leads
-                    if not worst_days['lowest_conversion'] or day_data['convRate'] < worst_days['lowest_conversion']['convRate']:
-                        worst_days['lowest_conversion'] = {
-                            'date': date_str,
-                            'convRate': day_data['convRate'],
-                            'retainers': day_data['retainers']
-                        }
+                for metric in ('cpl', 'cpa', 'cpr'):
+                    if previous_day_data[metric] > 0:
+                        day_data[f'{metric}Delta'] = round(
+                            ((day_data[metric] - previous_day_data[metric]) / 
+                             previous_day_data[metric] * 100), 1
+                        )
+                    else:
+                        day_data[f'{metric}Delta'] = 0
                 
-                # Track inefficient days (high spend, low retainers)
-                if day_data['spend'] > 0:
-                    efficiency = day_data['retainers'] / (day_data['spend'] / 10000)
-                    if not worst_days['inefficient'] or efficiency < worst_days['inefficient']['efficiency']:
-                        worst_days['inefficient'] = {
-                            'date': date_str,
-                            'spend': day_data['spend'],
-                            'retainers': day_data['retainers'],
-                            'efficiency': efficiency
-                        }
+                day_data['convDelta'] = round(
+                    day_data['convRate'] - previous_day_data['convRate'], 1
+                )
             else:
-                # No data for this day
-                day_data = {
-                    'date': date_str,
-                    'dayNum': day_num,
-                    'dayName': current_date.strftime('%a'),
-                    'isToday': current_date == today,
-                    'isFuture': False,
-                    'isWeekend': current_date.weekday() >= 5,
-                    'spend': 0,
-                    'leads': 0,
-                    'inPractice': 0,
-                    'unqualified': 0,
-                    'cases': 0,
-                    'retainers': 0,
-                    'cpl': 0,
-                    'cpa': 0,
-                    'cpr': 0,
-                    'convRate': 0,
-                    'buckets': [],
-                    'spendDelta': None,
-                    'leadsDelta': None,
-                    'casesDelta': None,
-                    'retainersDelta': None,
-                    'cplDelta': None,
-                    'cpaDelta': None,
-                    'cprDelta': None,
-                    'convDelta': None
-                }
-            
-            # Add to daily data list
-            daily_data.append(day_data)
-            
-            # Store for next iteration's delta calculation
-            previous_day_data = day_data
+                # First day - no deltas
+                for field in ('spendDelta', 'leadsDelta', 'casesDelta', 'retainersDelta',
+                              'cplDelta', 'cpaDelta', 'cprDelta', 'convDelta'):
+                    day_data[field] = None
             
-            logger.info(f"  💰 Day total: ${day_data['spend']:,.2f} spend, {day_data['leads']} leads")
+            # Update month totals
+            month_totals['total_spend'] += day_data['spend']
+            month_totals['total_leads'] += day_data['leads']
+            month_totals['total_cases'] += day_data['cases']
+            month_totals['total_retainers'] += day_data['retainers']
+            month_totals['total_in_practice'] += day_data['inPractice']
+            month_totals['total_unqualified'] += day_data['unqualified']
+        else:
+            # No data for this day
+            day_data = build_empty_day(current_date, today, is_weekend[day_num - 1])
         
-        # Calculate month summary with today's deltas
-        days_elapsed = min(today.day, month_end.day)
-        today_data = daily_data[today.day - 1] if today.day <= len(daily_data) else None
+        logger.info(f"  💰 Day total: ${day_data['spend']:,.2f} spend, {day_data['leads']} leads")
         
-        month_summary = {
-            'totalSpend': month_totals['total_spend'],
-            'totalLeads': month_totals['total_leads'],
-            'totalCases': month_totals['total_cases'],
-            'totalRetainers': month_totals['total_retainers'],
-            'avgCPL': round(month_totals['total_spend'] / month_totals['total_leads'], 2) if month_totals['total_leads'] > 0 else 0,
-            'avgCPA': round(month_totals['total_spend'] / month_totals['total_cases'], 2) if month_totals['total_cases'] > 0 else 0,
-            'avgCPR': round(month_totals['total_spend'] / month_totals['total_retainers'], 2) if month_totals['total_retainers'] > 0 else 0,
-            'convRate': round(month_totals['total_cases'] / month_totals['total_leads'], 3) if month_totals['total_leads'] > 0 else 0,
-            'dailyAvgSpend': round(month_totals['total_spend'] / days_elapsed, 2) if days_elapsed > 0 else 0,
-            'dailyAvgLeads': round(month_totals['total_leads'] / days_elapsed, 1) if days_elapsed > 0 else 0,
-            # Today's deltas
-            'spendDelta': today_data['spendDelta'] if today_data else 0,
-            'leadsDelta': today_data['leadsDelta'] if today_data else 0,
-            'casesDelta': today_data['casesDelta'] if today_data else 0,
-            'retainersDelta': today_data['retainersDelta'] if today_data else 0,
-            'cplDelta': today_data['cplDelta'] if today_data else 0,
-            'cpaDelta': today_data['cpaDelta'] if today_data else 0,
-            'convDelta': today_data['convDelta'] if today_data else 0
-        }
+        # Bucket metrics stay as BucketMetrics in previous_buckets_data; plain dicts for JSON
+        day_data['buckets'] = [asdict(b) for b in day_data['buckets']]
         
-        # Check data source
-        data_source = 'Demo Data'
-        if ads_manager.connected and litify_manager.connected:
-            data_source = 'Live Data (Accurate)'
-        elif ads_manager.connected:
-            data_source = 'Partial Data (Google Ads)'
-        elif litify_manager.connected:
-            data_source = 'Partial Data (Litify)'
+        # Add to daily data list and hand it to the caller right away
+        daily_data.append(day_data)
+        yield 'day', day_data
         
-        logger.info(f"✅ ACCURATE day-by-day fetch complete!")
-        logger.info(f"   Total days processed: {today.day}")
-        logger.info(f"   Month totals: ${month_totals['total_spend']:,.2f} spend, {month_totals['total_leads']} leads")
+        # Store for next iteration's delta calculation
+        previous_day_data = day_data
+    
+    # Pick best/worst days in one pass over the completed month
+    best_days, worst_days = find_best_worst_days(daily_data)
+    
+    # Calculate month summary with today's deltas
+    month_summary = build_month_summary(month_totals, daily_data, today, month_end)
+    
+    # Check data source
+    data_source = 'Demo Data'
+    if ads_manager.connected and litify_manager.connected:
+        data_source = 'Live Data (Accurate)'
+    elif ads_manager.connected:
+        data_source = 'Partial Data (Google Ads)'
+    elif litify_manager.connected:
+        data_source = 'Partial Data (Litify)'
+    
+    logger.info(f"✅ ACCURATE day-by-day fetch complete!")
+    logger.info(f"   Total days processed: {today.day}")
+    logger.info(f"   Month totals: ${month_totals['total_spend']:,.2f} spend, {month_totals['total_leads']} leads")
+    
+    
+    yield 'summary', {
+        'month_summary': month_summary,
+        'best_days': best_days,
+        'worst_days': worst_days,
+        'available_buckets': available_buckets,
+        'data_source': data_source,
+        'accuracy': 'HIGH',  # This is accurate day-by-day data
+        'timestamp': now_pt.isoformat()
+    }
+
+@app.route('/api/current-month-daily-optimized')
+def api_current_month_daily_optimized():
+    """
+    Accurate day-by-day fetching with real-time progress updates
+    Shows exactly which date is being processed - Pacific Time support
+    """
+    try:
+        # Get exclusion filter parameters
+        include_spam = request.args.get('include_spam', 'false').lower() == 'true'
+        include_abandoned = request.args.get('include_abandoned', 'false').lower() == 'true'
+        include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
         
-        return jsonify({
-            'daily_data': daily_data,
-            'month_summary': month_summary,
-            'best_days': best_days,
-            'worst_days': worst_days,
-            'available_buckets': available_buckets,
-            'data_source': data_source,
-            'accuracy': 'HIGH',  # This is accurate day-by-day data
-            'timestamp': datetime.now(PACIFIC_TZ).isoformat()
-        })
+        daily_data = []
+        summary = {}
+        for kind, payload in iter_current_month_daily(include_spam, include_abandoned, include_duplicate):
+            if kind == 'day':
+                daily_data.append(payload)
+            else:
+                summary = payload
+        
+        return jsonify({'daily_data': daily_data, **summary})
         
     except Exception as e:
         logger.error(f"Error in accurate current month daily API: {str(e)}")
@@ -3369,6 +4050,44 @@ def api_current_month_daily_optimized():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/current-month-daily-stream')
+def api_current_month_daily_stream():
+    """
+    Streaming version of /api/current-month-daily-optimized (NDJSON)
+    Emits one {"type": "day", "data": {...}} line per day as it completes,
+    followed by a final {"type": "summary", ...} line
+    """
+    # Get exclusion filter parameters
+    include_spam = request.args.get('include_spam', 'false').lower() == 'true'
+    include_abandoned = request.args.get('include_abandoned', 'false').lower() == 'true'
+    include_duplicate = request.args.get('include_duplicate', 'false').lower() == 'true'
+    
+    def generate():
+        try:
+            for kind, payload in iter_current_month_daily(include_spam, include_abandoned, include_duplicate):
+                if kind == 'day':
+                    yield json.dumps({'type': 'day', 'data': payload}) + '\n'
+                else:
+                    yield json.dumps({'type': 'summary', **payload}) + '\n'
+        except Exception as e:
+            logger.error(f"Error in streaming current month daily API: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            yield json.dumps({'type': 'error', 'error': str(e)}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def fetch_debug_campaigns(now_pt, days=7):
+    """
+    Fetch all campaigns (including paused and LSA) for the last `days` days up to today PT
+    The debug endpoints share this window so repeated diagnostics hit the same
+    fetch_campaigns cache entry instead of issuing new Google Ads queries
+    """
+    end_date = now_pt.strftime('%Y-%m-%d')
+    start_date = (now_pt - timedelta(days=days)).strftime('%Y-%m-%d')
+    campaigns = ads_manager.fetch_campaigns(start_date, end_date, active_only=False)
+    return start_date, end_date, campaigns
+
 @app.route('/api/debug/lsa-discovery')
 def debug_lsa_discovery():
     """
@@ -3388,14 +4107,9 @@ def debug_lsa_discovery():
         
         logger.info("🔍 Starting LSA discovery across all accounts...")
         
-        # Get date range for last 30 days in Pacific Time
+        # Fetch all campaigns including LSA for the last 30 days in Pacific Time
         end_date_pt = datetime.now(PACIFIC_TZ)
-        start_date_pt = end_date_pt - timedelta(days=30)
-        end_date = end_date_pt.strftime('%Y-%m-%d')
-        start_date = start_date_pt.strftime('%Y-%m-%d')
-        
-        # Fetch all campaigns including LSA
-        campaigns = ads_manager.fetch_campaigns(start_date, end_date, active_only=False)
+        start_date, end_date, campaigns = fetch_debug_campaigns(end_date_pt, days=30)
         
         if not campaigns:
             return jsonify({
@@ -3405,8 +4119,7 @@ def debug_lsa_discovery():
             }), 404
         
         # Filter for LSA campaigns
-        lsa_campaigns = [c for c in campaigns if c.get('channel_type') == 'LOCAL_SERVICES' or 
-                         'LocalServicesCampaign' in c.get('name', '')]
+        lsa_campaigns = [c for c in campaigns if is_lsa_campaign(c)]
         
         # Organize LSA by region
         lsa_by_region = {
@@ -3437,7 +4150,7 @@ def debug_lsa_discovery():
         # Prepare output
         output = {
             'success': True,
-            'timestamp': datetime.now(PACIFIC_TZ).isoformat(),
+            'timestamp': end_date_pt.isoformat(),
             'accounts_checked': ads_manager.customer_ids,
             'is_mcc': ads_manager.is_mcc,
             'summary': {
@@ -3517,16 +4230,15 @@ def debug_lsa_discovery():
         for region, region_campaigns in lsa_by_region.items():
             if region != 'Unknown' and region_campaigns:
                 bucket_name = state_names.get(region, region) + " LSA"
-                suggested_mapping[bucket_name] = list(set([c.get('name', '') for c in region_campaigns]))
+                suggested_mapping[bucket_name] = list(dict.fromkeys(c.get('name', '') for c in region_campaigns))
         
         output['suggested_campaign_mapping'] = suggested_mapping
         
         # Save to file
-        filename = f"lsa_discovery_{datetime.now(PACIFIC_TZ).strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"lsa_discovery_{end_date_pt.strftime('%Y%m%d_%H%M%S')}.json"
         filepath = os.path.join(os.getcwd(), filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(output, f, indent=2)
+        write_json_file(filepath, output)
         
         logger.info(f"✅ LSA discovery complete. Found {len(lsa_campaigns)} LSA campaigns")
         logger.info(f"📂 Report saved to {filename}")
@@ -3536,13 +4248,13 @@ def debug_lsa_discovery():
         return jsonify(output)
         
     except Exception as e:
-        logger.error(f"Error in LSA discovery: {str(e)}")
         import traceback
-        traceback.print_exc()
+        tb = traceback.format_exc()
+        logger.error("Error in LSA discovery: %s\n%s", e, tb)
         return jsonify({
             'success': False,
             'error': str(e),
-            'traceback': traceback.format_exc()
+            'traceback': tb
         }), 500
 
 @app.route('/api/debug/lsa-spend-check')
@@ -3552,9 +4264,7 @@ def debug_lsa_spend_check():
     """
     try:
         # Force refresh cache first
-        global CACHE_DATA, CACHE_TIME
-        CACHE_DATA = None
-        CACHE_TIME = None
+        DASHBOARD_CACHE.clear()
         
         # Initialize if needed
         if not ads_manager.client:
@@ -3568,17 +4278,12 @@ def debug_lsa_spend_check():
         
         # Get today's date for testing in Pacific Time
         today_pt = datetime.now(PACIFIC_TZ)
-        today = today_pt.strftime('%Y-%m-%d')
         
-        # Fetch campaigns for today (or last 7 days for more data)
-        end_date = today
-        start_date = (today_pt - timedelta(days=7)).strftime('%Y-%m-%d')
+        # Fetch ALL campaigns including LSA for the last 7 days
+        start_date, end_date, campaigns = fetch_debug_campaigns(today_pt)
         
         logger.info(f"🔍 Checking LSA spend from {start_date} to {end_date} PT")
         
-        # Fetch ALL campaigns including LSA
-        campaigns = ads_manager.fetch_campaigns(start_date, end_date, active_only=False)
-        
         if not campaigns:
             return jsonify({
                 'success': False,
@@ -3586,97 +4291,100 @@ def debug_lsa_spend_check():
                 'date_range': {'start': start_date, 'end': end_date}
             }), 404
         
-        # Separate LSA and regular campaigns
+        # One pass over the campaigns: split LSA/regular, total spend and group LSA by
+        # customer_id; the top 5 LSA campaigns by spend are picked afterwards as samples
+        lsa_count = 0
+        regular_count = 0
+        total_lsa_spend = 0
+        total_regular_spend = 0
+        lsa_by_account = {}
         lsa_campaigns = []
-        regular_campaigns = []
         
         for campaign in campaigns:
-            if campaign.get('is_lsa') or 'LocalServicesCampaign' in campaign.get('name', ''):
-                lsa_campaigns.append(campaign)
-            else:
-                regular_campaigns.append(campaign)
-        
-        # Group LSA campaigns by customer_id
-        lsa_by_account = {}
-        for campaign in lsa_campaigns:
-            customer_id = campaign.get('customer_id', 'unknown')
-            if customer_id not in lsa_by_account:
-                lsa_by_account[customer_id] = {
-                    'campaigns': [],
-                    'total_spend': 0,
-                    'customer_name': campaign.get('customer_name', 'Unknown')
-                }
-            lsa_by_account[customer_id]['campaigns'].append({
-                'name': campaign.get('name', ''),
-                'spend': campaign.get('cost', 0),
-                'status': campaign.get('status', '')
+            name = campaign.get('name', '')
+            cost = campaign.get('cost', 0)
+            
+            if not is_lsa_campaign(campaign):
+                regular_count += 1
+                total_regular_spend += cost
+                continue
+            
+            lsa_count += 1
+            total_lsa_spend += cost
+            
+            account = lsa_by_account.setdefault(campaign.get('customer_id', 'unknown'), {
+                'campaigns': [],
+                'total_spend': 0,
+                'customer_name': campaign.get('customer_name', 'Unknown')
             })
-            lsa_by_account[customer_id]['total_spend'] += campaign.get('cost', 0)
-        
-        # Map LSA campaigns to buckets using the processing function
-        test_leads = []  # Empty leads for this test
-        buckets, unmapped, _, _ = process_campaigns_to_buckets_with_litify(campaigns, test_leads)
+            account['campaigns'].append(LSACampaignSpend(name, cost, campaign.get('status', '')))
+            account['total_spend'] += cost
+            lsa_campaigns.append(campaign)
+        
+        # Top 5 LSA campaigns by spend (partial heap selection, no full sort)
+        sample_lsa_campaigns = [{
+            'name': campaign.get('name', ''),
+            'customer_id': campaign.get('customer_id', ''),
+            'customer_name': campaign.get('customer_name', ''),
+            'spend': campaign['cost'],
+            'status': campaign.get('status', '')
+        } for campaign in heapq.nlargest(5, lsa_campaigns, key=operator.itemgetter('cost'))]
+        
+        # Map LSA campaigns to buckets using the processing function (no leads for this test)
+        _, unmapped, lsa_bucket_view = process_campaigns_to_buckets_cached(campaigns)
         
         # Extract LSA bucket data
-        lsa_buckets_data = {}
-        for bucket in buckets:
-            if 'LSA' in bucket.get('name', ''):
-                lsa_buckets_data[bucket['name']] = {
-                    'campaigns': bucket.get('campaigns', []),
-                    'spend': bucket.get('cost', 0),
-                    'campaign_count': len(bucket.get('campaigns', []))
-                }
+        lsa_buckets_data = {
+            name: {
+                'campaigns': bucket.get('campaigns', []),
+                'spend': bucket.get('cost', 0),
+                'campaign_count': len(bucket.get('campaigns', []))
+            }
+            for name, bucket in lsa_bucket_view.items()
+        }
         
         # Create diagnostic output
-        output = {
-            'success': True,
-            'timestamp': datetime.now(PACIFIC_TZ).isoformat(),
-            'date_range': {
-                'start': start_date,
-                'end': end_date
-            },
-            'summary': {
-                'total_campaigns': len(campaigns),
-                'lsa_campaigns': len(lsa_campaigns),
-                'regular_campaigns': len(regular_campaigns),
-                'total_lsa_spend': sum(c.get('cost', 0) for c in lsa_campaigns),
-                'total_regular_spend': sum(c.get('cost', 0) for c in regular_campaigns),
-                'accounts_checked': ads_manager.customer_ids
-            },
-            'lsa_by_account': lsa_by_account,
-            'lsa_buckets': lsa_buckets_data,
-            'unmapped_lsa': [c.get('name', '') for c in unmapped if 'LocalServicesCampaign' in c],
-            'sample_lsa_campaigns': [
-                {
-                    'name': c.get('name', ''),
-                    'customer_id': c.get('customer_id', ''),
-                    'customer_name': c.get('customer_name', ''),
-                    'spend': c.get('cost', 0),
-                    'status': c.get('status', '')
-                }
-                for c in lsa_campaigns[:5]  # First 5 LSA campaigns
-            ]
+        summary = {
+            'total_campaigns': len(campaigns),
+            'lsa_campaigns': lsa_count,
+            'regular_campaigns': regular_count,
+            'total_lsa_spend': total_lsa_spend,
+            'total_regular_spend': total_regular_spend,
+            'accounts_checked': ads_manager.customer_ids
         }
         
-        # Log the findings
-        logger.info(f"✅ LSA Spend Check Complete:")
-        logger.info(f"   - Found {len(lsa_campaigns)} LSA campaigns")
-        logger.info(f"   - Total LSA spend: ${output['summary']['total_lsa_spend']:,.2f}")
-        logger.info(f"   - LSA accounts: {len(lsa_by_account)}")
-        
-        for bucket_name, data in lsa_buckets_data.items():
-            logger.info(f"   - {bucket_name}: ${data['spend']:,.2f} ({data['campaign_count']} campaigns)")
-        
-        return jsonify(output)
+        # Log the findings (skip building the messages when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join([
+                "✅ LSA Spend Check Complete:",
+                f"   - Found {lsa_count} LSA campaigns",
+                f"   - Total LSA spend: ${total_lsa_spend:,.2f}",
+                f"   - LSA accounts: {len(lsa_by_account)}",
+                *(f"   - {bucket_name}: ${data['spend']:,.2f} ({data['campaign_count']} campaigns)"
+                  for bucket_name, data in lsa_buckets_data.items()),
+            ]))
+        
+        # Stream the report section by section; the per-account and sample
+        # sections can be large and never need to sit in one encoded blob
+        return stream_json_response((
+            ('success', True),
+            ('timestamp', today_pt.isoformat()),
+            ('date_range', {'start': start_date, 'end': end_date}),
+            ('summary', summary),
+            ('lsa_by_account', lsa_by_account),
+            ('lsa_buckets', lsa_buckets_data),
+            ('unmapped_lsa', [name for name in unmapped if name.startswith(LSA_CAMPAIGN_PREFIX)]),
+            ('sample_lsa_campaigns', sample_lsa_campaigns),  # Top 5 LSA campaigns by spend
+        ))
         
     except Exception as e:
-        logger.error(f"Error in LSA spend check: {str(e)}")
         import traceback
-        traceback.print_exc()
+        tb = traceback.format_exc()
+        logger.error("Error in LSA spend check: %s\n%s", e, tb)
         return jsonify({
             'success': False,
             'error': str(e),
-            'traceback': traceback.format_exc()
+            'traceback': tb
         }), 500
 
 
@@ -3686,69 +4394,68 @@ def debug_bucket_check():
     Check what's actually in CAMPAIGN_BUCKETS and how LSA campaigns are being processed
     """
     try:
+        # Capture request time once (Pacific Time)
+        now_pt = datetime.now(PACIFIC_TZ)
+        
         # Force reload campaign mappings from file
         load_campaign_mappings()
         
         # Check what's in CAMPAIGN_BUCKETS
-        lsa_buckets = {}
-        for bucket_name, campaigns in CAMPAIGN_BUCKETS.items():
-            if 'LSA' in bucket_name:
-                lsa_buckets[bucket_name] = campaigns
+        lsa_buckets = {b: CAMPAIGN_BUCKETS[b] for b in LSA_BUCKET_NAMES}
         
         # Fetch current campaigns to test processing
         if ads_manager.connected:
-            today_pt = datetime.now(PACIFIC_TZ)
-            today = today_pt.strftime('%Y-%m-%d')
-            week_ago = (today_pt - timedelta(days=7)).strftime('%Y-%m-%d')
-            campaigns = ads_manager.fetch_campaigns(week_ago, today, active_only=False)
+            _, _, campaigns = fetch_debug_campaigns(now_pt)
         else:
             campaigns = []
         
         # Find LSA campaigns in fetched data
-        fetched_lsa = []
-        for campaign in campaigns:
-            if campaign.get('is_lsa') or 'LocalServicesCampaign' in campaign.get('name', ''):
-                fetched_lsa.append({
-                    'name': campaign.get('name', ''),
-                    'customer_id': campaign.get('customer_id', ''),
-                    'customer_name': campaign.get('customer_name', ''),
-                    'cost': campaign.get('cost', 0)
-                })
+        fetched_lsa = [
+            {
+                'name': campaign.get('name', ''),
+                'customer_id': campaign.get('customer_id', ''),
+                'customer_name': campaign.get('customer_name', ''),
+                'cost': campaign.get('cost', 0)
+            }
+            for campaign in campaigns
+            if is_lsa_campaign(campaign)
+        ]
         
         # Test the processing function with empty leads
-        test_buckets, unmapped, _, _ = process_campaigns_to_buckets_with_litify(campaigns, [])
+        _, unmapped, lsa_bucket_view = process_campaigns_to_buckets_cached(campaigns)
         
         # Extract processed LSA bucket data
-        processed_lsa_buckets = {}
-        for bucket in test_buckets:
-            if 'LSA' in bucket.get('name', ''):
-                processed_lsa_buckets[bucket['name']] = {
-                    'campaigns': bucket.get('campaigns', []),
-                    'cost': bucket.get('cost', 0),
-                    'count': len(bucket.get('campaigns', []))
-                }
+        processed_lsa_buckets = {
+            name: {
+                'campaigns': bucket.get('campaigns', []),
+                'cost': bucket.get('cost', 0),
+                'count': len(bucket.get('campaigns', []))
+            }
+            for name, bucket in lsa_bucket_view.items()
+        }
         
         return jsonify({
             'success': True,
-            'timestamp': datetime.now(PACIFIC_TZ).isoformat(),
+            'timestamp': now_pt.isoformat(),
             'diagnostics': {
                 'campaign_buckets_file': 'campaign_mappings.json exists' if os.path.exists('campaign_mappings.json') else 'NOT FOUND',
                 'lsa_buckets_in_memory': lsa_buckets,
                 'lsa_campaigns_fetched': fetched_lsa,
                 'lsa_buckets_after_processing': processed_lsa_buckets,
-                'bucket_priority_includes_lsa': [b for b in BUCKET_PRIORITY if 'LSA' in b],
-                'unmapped_lsa': [c for c in unmapped if 'LocalServicesCampaign' in c]
+                'bucket_priority_includes_lsa': [b for b in BUCKET_PRIORITY if b.endswith(' LSA')],
+                'unmapped_lsa': [name for name in unmapped if name.startswith(LSA_CAMPAIGN_PREFIX)]
             },
             'recommendations': []
         })
         
     except Exception as e:
-        logger.error(f"Error in bucket check: {str(e)}")
         import traceback
+        tb = traceback.format_exc()
+        logger.error("Error in bucket check: %s\n%s", e, tb)
         return jsonify({
             'success': False,
             'error': str(e),
-            'traceback': traceback.format_exc()
+            'traceback': tb
         }), 500
 
 
@@ -3758,16 +4465,13 @@ def fix_lsa_mapping():
     Fix LSA mapping by ensuring all LSA campaigns are in CAMPAIGN_BUCKETS
     """
     try:
-        global CAMPAIGN_BUCKETS, CACHE_DATA, CACHE_TIME
-        
         # Clear cache
-        CACHE_DATA = None
-        CACHE_TIME = None
+        DASHBOARD_CACHE.clear()
+        clear_debug_bucket_cache()
         
-        # Load current mappings
+        # Load current mappings (re-parsed only if the file changed)
         if os.path.exists('campaign_mappings.json'):
-            with open('campaign_mappings.json', 'r') as f:
-                CAMPAIGN_BUCKETS = json.load(f)
+            load_campaign_mappings()
         
         # Ensure LSA buckets exist and have the correct campaigns
         lsa_campaign_names = {
@@ -3795,30 +4499,42 @@ def fix_lsa_mapping():
                 logger.info(f"Added new bucket: {bucket_name}")
             else:
                 # Merge campaigns, avoiding duplicates
-                existing = set(CAMPAIGN_BUCKETS[bucket_name])
+                existing = CAMPAIGN_BUCKET_SETS[bucket_name]
                 for campaign in campaign_list:
                     if campaign not in existing:
+                        existing.add(campaign)
                         CAMPAIGN_BUCKETS[bucket_name].append(campaign)
                         updated = True
                         logger.info(f"Added {campaign} to {bucket_name}")
         
-        # Ensure all LSA buckets are in BUCKET_PRIORITY
+        # Ensure all LSA buckets are in BUCKET_PRIORITY, each right after the
+        # corresponding Prospecting bucket (or at the end if there is none)
+        existing_buckets = set(BUCKET_PRIORITY)
+        insert_after = {}
+        append_at_end = []
         for bucket in ["California LSA", "Arizona LSA", "Georgia LSA", "Texas LSA"]:
-            if bucket not in BUCKET_PRIORITY:
-                # Add after the corresponding Prospecting bucket
-                state = bucket.replace(" LSA", "")
-                prospecting_bucket = f"{state} Prospecting"
-                if prospecting_bucket in BUCKET_PRIORITY:
-                    idx = BUCKET_PRIORITY.index(prospecting_bucket)
-                    BUCKET_PRIORITY.insert(idx + 1, bucket)
+            if bucket not in existing_buckets:
+                prospecting_bucket = bucket.replace(" LSA", " Prospecting")
+                if prospecting_bucket in existing_buckets:
+                    insert_after[prospecting_bucket] = bucket
                 else:
-                    BUCKET_PRIORITY.append(bucket)
+                    append_at_end.append(bucket)
                 logger.info(f"Added {bucket} to BUCKET_PRIORITY")
         
+        if insert_after or append_at_end:
+            # Rebuild in one pass (in place - other code holds a reference to the list)
+            reordered = []
+            for bucket in BUCKET_PRIORITY:
+                reordered.append(bucket)
+                if bucket in insert_after:
+                    reordered.append(insert_after[bucket])
+            BUCKET_PRIORITY[:] = reordered + append_at_end
+        
+        rebuild_campaign_index()
+        
         # Save updated mappings
         if updated:
-            with open('campaign_mappings.json', 'w') as f:
-                json.dump(CAMPAIGN_BUCKETS, f, indent=2)
+            save_mappings()
             logger.info("✅ Updated campaign_mappings.json with LSA campaigns")
         
         return jsonify({
@@ -3842,9 +4558,9 @@ def debug_timezone_check():
     Debug route to verify timezone settings and date conversions
     """
     try:
-        # Get various time representations
-        now_utc = datetime.now(pytz.UTC)
+        # Get various time representations (UTC/PT are the same instant)
         now_pt = datetime.now(PACIFIC_TZ)
+        now_utc = now_pt.astimezone(pytz.UTC)
         now_naive = datetime.now()
         
         # Test date range conversion
@@ -3893,19 +4609,16 @@ def debug_clear_cache():
     Debug route to clear all caches
     """
     try:
-        global CACHE_DATA, CACHE_TIME
-        
         # Clear main cache
-        CACHE_DATA = None
-        CACHE_TIME = None
+        DASHBOARD_CACHE.clear()
         
-        # Clear global cache
-        if hasattr(global_cache, 'clear'):
-            global_cache.clear()
+        # Clear memoized debug bucket results
+        clear_debug_bucket_cache()
         
-        # Clear daily cache
-        if hasattr(daily_cache, 'clear'):
-            daily_cache.clear()
+        # Clear the shared SmartCache instances
+        global_cache.clear()
+        daily_cache.clear()
+        failed_fetch_cache.clear()
         
         logger.info("🧹 All caches cleared")
         
@@ -3927,8 +4640,12 @@ def debug_test_apis():
     """
     Debug route to test API connections and basic functionality
     """
+    # Capture request time once (Pacific Time)
+    now_pt = datetime.now(PACIFIC_TZ)
+    today = now_pt.strftime('%Y-%m-%d')
+    
     results = {
-        'timestamp': datetime.now(PACIFIC_TZ).isoformat(),
+        'timestamp': now_pt.isoformat(),
         'timezone': 'Pacific Time (America/Los_Angeles)',
         'google_ads': {
             'available': GOOGLE_ADS_AVAILABLE,
@@ -3944,125 +4661,139 @@ def debug_test_apis():
         }
     }
     
-    # Test Google Ads
+    # Initialize connections first; the test fetches below run concurrently
     if GOOGLE_ADS_AVAILABLE:
         if not ads_manager.client:
             ads_manager.initialize()
         
         results['google_ads']['connected'] = ads_manager.connected
         results['google_ads']['error'] = ads_manager.error
-        
-        if ads_manager.connected:
-            try:
-                # Try to fetch today's campaigns
-                today = datetime.now(PACIFIC_TZ).strftime('%Y-%m-%d')
-                campaigns = ads_manager.fetch_campaigns(today, today, active_only=True)
-                results['google_ads']['test_result'] = {
-                    'campaigns_found': len(campaigns) if campaigns else 0,
-                    'customer_ids': ads_manager.customer_ids,
-                    'is_mcc': ads_manager.is_mcc
-                }
-            except Exception as e:
-                results['google_ads']['test_result'] = f"Error: {str(e)}"
     
-    # Test Litify
     if SALESFORCE_AVAILABLE:
         if not litify_manager.client:
             litify_manager.initialize()
         
         results['litify']['connected'] = litify_manager.connected
         results['litify']['error'] = litify_manager.error
-        
-        if litify_manager.connected:
-            try:
-                # Try to fetch today's leads
-                today = datetime.now(PACIFIC_TZ).strftime('%Y-%m-%d')
-                leads = litify_manager.fetch_detailed_leads(today, today, limit=10)
-                results['litify']['test_result'] = {
-                    'leads_found': len(leads) if leads else 0,
-                    'instance_url': litify_manager.instance_url,
-                    'case_types_cached': len(litify_manager.case_type_cache)
-                }
-            except Exception as e:
-                results['litify']['test_result'] = f"Error: {str(e)}"
+    
+    test_ads = GOOGLE_ADS_AVAILABLE and ads_manager.connected
+    test_litify = SALESFORCE_AVAILABLE and litify_manager.connected
+    
+    if test_ads or test_litify:
+        # The two round-trips are independent, so issue them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ads_future = executor.submit(ads_manager.fetch_campaigns, today, today, active_only=True) if test_ads else None
+            litify_future = executor.submit(litify_manager.fetch_detailed_leads, today, today, limit=10) if test_litify else None
+            
+            # Test Google Ads - today's campaigns
+            if ads_future:
+                try:
+                    campaigns = ads_future.result()
+                    results['google_ads']['test_result'] = {
+                        'campaigns_found': len(campaigns) if campaigns else 0,
+                        'customer_ids': ads_manager.customer_ids,
+                        'is_mcc': ads_manager.is_mcc
+                    }
+                except Exception as e:
+                    results['google_ads']['test_result'] = f"Error: {str(e)}"
+            
+            # Test Litify - today's leads
+            if litify_future:
+                try:
+                    leads = litify_future.result()
+                    results['litify']['test_result'] = {
+                        'leads_found': len(leads) if leads else 0,
+                        'instance_url': litify_manager.instance_url,
+                        'case_types_cached': len(litify_manager.case_type_cache)
+                    }
+                except Exception as e:
+                    results['litify']['test_result'] = f"Error: {str(e)}"
     
     return jsonify(results)
 
 # ========== MAIN EXECUTION ==========
 
 if __name__ == '__main__':
-    logger.info("=" * 60)
-    logger.info("🚀 Starting Sweet James Dashboard with Exclusion Filters")
-    logger.info("🕐 Timezone: Pacific Time (America/Los_Angeles)")
-    logger.info("=" * 60)
+    logger.info("\n".join([
+        "=" * 60,
+        "🚀 Starting Sweet James Dashboard with Exclusion Filters",
+        "🕐 Timezone: Pacific Time (America/Los_Angeles)",
+        "=" * 60,
+    ]))
     
     logger.info("Initializing API connections...")
     
     if ads_manager.initialize():
         logger.info("✅ Google Ads API connected")
         if ads_manager.is_mcc:
-            logger.info(f"   Using MCC account: {ads_manager.mcc_id}")
-            logger.info(f"   Child accounts: {len(ads_manager.child_accounts)}")
-        logger.info(f"   Customer IDs: {ads_manager.customer_ids}")
+            logger.info("   Using MCC account: %s", ads_manager.mcc_id)
+            logger.info("   Child accounts: %s", len(ads_manager.child_accounts))
+        logger.info("   Customer IDs: %s", ads_manager.customer_ids)
     else:
-        logger.warning(f"⚠️ Google Ads API not connected: {ads_manager.error}")
+        logger.warning("⚠️ Google Ads API not connected: %s", ads_manager.error)
     
     if litify_manager.initialize():
         logger.info("✅ Litify API connected")
-        logger.info(f"   Cached {len(litify_manager.case_type_cache)} case types")
-        logger.info(f"   Salesforce instance: {litify_manager.instance_url}")
+        logger.info("   Cached %s case types", len(litify_manager.case_type_cache))
+        logger.info("   Salesforce instance: %s", litify_manager.instance_url)
     else:
-        logger.warning(f"⚠️ Litify API not connected: {litify_manager.error}")
+        logger.warning("⚠️ Litify API not connected: %s", litify_manager.error)
     
     port = int(os.getenv('PORT', 8080))
-    logger.info("=" * 60)
-    logger.info("📍 ENDPOINTS:")
-    logger.info(f"Dashboard: http://localhost:{port}")
-    logger.info(f"Campaign Mapping: http://localhost:{port}/campaign-mapping")
-    logger.info(f"Forecasting: http://localhost:{port}/forecasting")
-    logger.info(f"Comparison Dashboard: http://localhost:{port}/comparison-dashboard")
-    logger.info(f"Current Month Performance: http://localhost:{port}/current-month-performance")
-    logger.info(f"Annual Analytics: http://localhost:{port}/annual-analytics")
-    logger.info(f"API Status: http://localhost:{port}/api/status")
-    logger.info("=" * 60)
-    logger.info("🕐 TIMEZONE INFO:")
-    logger.info("All date ranges are now in Pacific Time (PT)")
-    logger.info("Query times: 12:00 AM PT to 11:59:59 PM PT")
-    logger.info("Current PT time: " + datetime.now(PACIFIC_TZ).strftime('%Y-%m-%d %H:%M:%S %Z'))
-    logger.info("=" * 60)
-    logger.info("📊 FIELD NAME CORRECTIONS:")
-    logger.info("Custom fields (NO litify_pm__ prefix):")
-    logger.info("    - Retainer_Signed_Date__c (DATE field)")
-    logger.info("    - Client_Name__c")
-    logger.info("    - isDroppedatIntake__c")
-    logger.info("Standard Litify fields (WITH litify_pm__ prefix):")
-    logger.info("    - litify_pm__Status__c")
-    logger.info("    - litify_pm__Display_Name__c")
-    logger.info("    - litify_pm__UTM_Campaign__c")
-    logger.info("    - litify_pm__Case_Type__c")
-    logger.info("    - litify_pm__Matter__c")
-    logger.info("DATETIME fields (use UTC conversion):")
-    logger.info("    - CreatedDate")
-    logger.info("=" * 60)
-    logger.info("✅ CONVERSION CRITERIA:")
-    logger.info("A retainer/conversion is counted when:")
-    logger.info("    - Retainer Signed Date is not empty")
-    logger.info("    - Status NOT 'Converted DAI' or 'Referred Out'")   
-    logger.info("    - isDroppedatIntake = False")
-    logger.info("    - Display Name != 'test'")
-    logger.info("Unqualified = In practice but NOT converted")
-    logger.info("Cases = Grouped by Matter ID (or companion ID, or solo)")
-    logger.info("Retainers = Total converted intakes")
-    logger.info("=" * 60)
-    logger.info("🔧 DEBUG ENDPOINTS:")
-    logger.info(f"Test APIs: http://localhost:{port}/api/debug/test-apis")
-    logger.info(f"Timezone Check: http://localhost:{port}/api/debug/timezone-check")
-    logger.info(f"Campaign Dump: http://localhost:{port}/api/debug/campaigns-dump")
-    logger.info(f"LSA Discovery: http://localhost:{port}/api/debug/lsa-discovery")
-    logger.info(f"LSA Spend Check: http://localhost:{port}/api/debug/lsa-spend-check")
-    logger.info(f"Bucket Check: http://localhost:{port}/api/debug/bucket-check")
-    logger.info(f"Clear Cache: POST http://localhost:{port}/api/debug/clear-cache")
-    logger.info(f"Fix LSA Mapping: POST http://localhost:{port}/api/fix-lsa-mapping")
-    logger.info("=" * 60)
+    base_url = f"http://localhost:{port}"
+    rule = "=" * 60
+    
+    # Emit the startup banner as a single log record
+    logger.info("\n".join([
+        rule,
+        "📍 ENDPOINTS:",
+        f"Dashboard: {base_url}",
+        f"Campaign Mapping: {base_url}/campaign-mapping",
+        f"Forecasting: {base_url}/forecasting",
+        f"Comparison Dashboard: {base_url}/comparison-dashboard",
+        f"Current Month Performance: {base_url}/current-month-performance",
+        f"Annual Analytics: {base_url}/annual-analytics",
+        f"API Status: {base_url}/api/status",
+        rule,
+        "🕐 TIMEZONE INFO:",
+        "All date ranges are now in Pacific Time (PT)",
+        "Query times: 12:00 AM PT to 11:59:59 PM PT",
+        "Current PT time: " + datetime.now(PACIFIC_TZ).strftime('%Y-%m-%d %H:%M:%S %Z'),
+        rule,
+        "📊 FIELD NAME CORRECTIONS:",
+        "Custom fields (NO litify_pm__ prefix):",
+        "    - Retainer_Signed_Date__c (DATE field)",
+        "    - Client_Name__c",
+        "    - isDroppedatIntake__c",
+        "Standard Litify fields (WITH litify_pm__ prefix):",
+        "    - litify_pm__Status__c",
+        "    - litify_pm__Display_Name__c",
+        "    - litify_pm__UTM_Campaign__c",
+        "    - litify_pm__Case_Type__c",
+        "    - litify_pm__Matter__c",
+        "DATETIME fields (use UTC conversion):",
+        "    - CreatedDate",
+        rule,
+        "✅ CONVERSION CRITERIA:",
+        "A retainer/conversion is counted when:",
+        "    - Retainer Signed Date is not empty",
+        "    - Status NOT 'Converted DAI' or 'Referred Out'",
+        "    - isDroppedatIntake = False",
+        "    - Display Name != 'test'",
+        "Unqualified = In practice but NOT converted",
+        "Cases = Grouped by Matter ID (or companion ID, or solo)",
+        "Retainers = Total converted intakes",
+        rule,
+        "🔧 DEBUG ENDPOINTS:",
+        f"Test APIs: {base_url}/api/debug/test-apis",
+        f"Timezone Check: {base_url}/api/debug/timezone-check",
+        f"Campaign Dump: {base_url}/api/debug/campaigns-dump",
+        f"LSA Discovery: {base_url}/api/debug/lsa-discovery",
+        f"LSA Spend Check: {base_url}/api/debug/lsa-spend-check",
+        f"Bucket Check: {base_url}/api/debug/bucket-check",
+        f"Clear Cache: POST {base_url}/api/debug/clear-cache",
+        f"Fix LSA Mapping: POST {base_url}/api/fix-lsa-mapping",
+        rule,
+    ]))
     
     app.run(debug=True, host='0.0.0.0', port=port)
\ No newline at end of file
@@ -4,8 +4,15 @@ Demo Data Module for Sweet James Dashboard
 Contains all demo/sample data for testing when APIs are not connected
 """
 
-from datetime import datetime, timedelta
-import random
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from itertools import cycle, islice
+from types import MappingProxyType
+import calendar
+import numpy as np
+
+# Shared generator for demo randomness drawn in batches
+_RNG = np.random.default_rng()
 
 # Campaign Bucket Mapping Configuration (for demo purposes)
 DEMO_CAMPAIGN_BUCKETS = {
@@ -52,8 +59,10 @@ DEMO_CAMPAIGN_BUCKETS = {
     "Texas LSA": ["LocalServicesCampaign:TX"]
 }
 
-# Demo UTM to Bucket Mapping
-DEMO_UTM_TO_BUCKET_MAPPING = {
+# Demo UTM to Bucket Mapping (read-only - copy it before editing)
+# UTM spellings differ from the Google Ads campaign names, so this can't be
+# derived from DEMO_CAMPAIGN_BUCKETS
+DEMO_UTM_TO_BUCKET_MAPPING = MappingProxyType({
     # California Brand
     "CA-EN-Brand": "California Brand",
     
@@ -93,7 +102,7 @@ DEMO_UTM_TO_BUCKET_MAPPING = {
     
     # GMB and other sources
     "GMB - Newport Beach": "California Prospecting",
-}
+})
 
 # Demo campaign names
 DEMO_CAMPAIGNS = [
@@ -127,8 +136,82 @@ DEMO_CAMPAIGNS = [
     "LocalServicesCampaign:TX"
 ]
 
+# Bucket priority for demo data
+DEMO_BUCKET_PRIORITY = [
+    "California Brand", "California Prospecting", "California LSA",
+    "Arizona Brand", "Arizona Prospecting", "Arizona LSA",
+    "Georgia Brand", "Georgia Prospecting", "Georgia LSA",
+    "Texas Brand", "Texas Prospecting", "Texas LSA"
+]
+
+# Demo buckets whose numbers don't depend on the exclusion filters
+# (shared between calls - treat as read-only)
+DEMO_STATIC_BUCKETS = (
+    {
+        'name': 'California LSA',
+        'state': 'California',
+        'campaigns': ['CA-NB-LSA', 'CA-LA-LSA'],
+        'cost': 85000,
+        'leads': 150,
+        'inPractice': 135,
+        'inPracticePercent': 0.900,
+        'unqualified': 20,
+        'unqualifiedPercent': 0.148,
+        'costPerLead': 567,
+        'cases': 35,
+        'cpa': 2429,
+        'retainers': 50,
+        'pendingRetainers': 8,
+        'totalRetainers': 58,
+        'costPerRetainer': 1466,
+        'conversionRate': 0.430
+    },
+    {
+        'name': 'Arizona Brand',
+        'state': 'Arizona',
+        'campaigns': ['AZ-EN-Brand'],
+        'cost': 50000,
+        'leads': 80,
+        'inPractice': 65,
+        'inPracticePercent': 0.813,
+        'unqualified': 20,
+        'unqualifiedPercent': 0.308,
+        'costPerLead': 625,
+        'cases': 15,
+        'cpa': 3333,
+        'retainers': 20,
+        'pendingRetainers': 2,
+        'totalRetainers': 22,
+        'costPerRetainer': 2273,
+        'conversionRate': 0.338
+    },
+    {
+        'name': 'Arizona Prospecting',
+        'state': 'Arizona',
+        'campaigns': ['GS_NonBrand - AZ', 'PMAX_AZ'],
+        'cost': 120000,
+        'leads': 200,
+        'inPractice': 150,
+        'inPracticePercent': 0.750,
+        'unqualified': 50,
+        'unqualifiedPercent': 0.333,
+        'costPerLead': 600,
+        'cases': 25,
+        'cpa': 4800,
+        'retainers': 35,
+        'pendingRetainers': 3,
+        'totalRetainers': 38,
+        'costPerRetainer': 3158,
+        'conversionRate': 0.253
+    }
+)
+
+@lru_cache(maxsize=8)
 def get_demo_bucket_data(include_spam=False, include_abandoned=False, include_duplicate=False):
-    """Return comprehensive demo data with realistic LSA numbers and exclusion filters"""
+    """
+    Return comprehensive demo data with realistic LSA numbers and exclusion filters
+    Pure in its three flags, so each of the 8 combinations is built once and shared - treat as read-only
+    """
     # Adjust lead counts based on inclusion filters
     base_leads = 220
     if include_spam:
@@ -137,14 +220,7 @@ def get_demo_bucket_data(include_spam=False, include_abandoned=False, include_du
         base_leads += 8
     if include_duplicate:
         base_leads += 7
-    
-    # Define bucket priority for demo data
-    bucket_priority = [
-        "California Brand", "California Prospecting", "California LSA",
-        "Arizona Brand", "Arizona Prospecting", "Arizona LSA",
-        "Georgia Brand", "Georgia Prospecting", "Georgia LSA",
-        "Texas Brand", "Texas Prospecting", "Texas LSA"
-    ]
+    ca_prospecting_leads = 380 + (15 if include_spam else 0) + (10 if include_abandoned else 0) + (8 if include_duplicate else 0)
     
     return {
         'buckets': [
@@ -172,12 +248,12 @@ def get_demo_bucket_data(include_spam=False, include_abandoned=False, include_du
                 'state': 'California',
                 'campaigns': ['GS_NonBrand - CA', 'CA-Pmax-EN-MVA'],
                 'cost': 180000,
-                'leads': 380 + (15 if include_spam else 0) + (10 if include_abandoned else 0) + (8 if include_duplicate else 0),
+                'leads': ca_prospecting_leads,
                 'inPractice': 300,
-                'inPracticePercent': 300/(380 + (15 if include_spam else 0) + (10 if include_abandoned else 0) + (8 if include_duplicate else 0)),
+                'inPracticePercent': 300/ca_prospecting_leads,
                 'unqualified': 75,  
                 'unqualifiedPercent': 0.250,  
-                'costPerLead': 180000/(380 + (15 if include_spam else 0) + (10 if include_abandoned else 0) + (8 if include_duplicate else 0)),
+                'costPerLead': 180000/ca_prospecting_leads,
                 'cases': 70,  
                 'cpa': 2571,
                 'retainers': 90,  
@@ -186,68 +262,12 @@ def get_demo_bucket_data(include_spam=False, include_abandoned=False, include_du
                 'costPerRetainer': 1895,
                 'conversionRate': 0.317  
             },
-            {
-                'name': 'California LSA',
-                'state': 'California',
-                'campaigns': ['CA-NB-LSA', 'CA-LA-LSA'],
-                'cost': 85000,
-                'leads': 150,
-                'inPractice': 135,
-                'inPracticePercent': 0.900,
-                'unqualified': 20,
-                'unqualifiedPercent': 0.148,
-                'costPerLead': 567,
-                'cases': 35,
-                'cpa': 2429,
-                'retainers': 50,
-                'pendingRetainers': 8,
-                'totalRetainers': 58,
-                'costPerRetainer': 1466,
-                'conversionRate': 0.430
-            },
-            {
-                'name': 'Arizona Brand',
-                'state': 'Arizona',
-                'campaigns': ['AZ-EN-Brand'],
-                'cost': 50000,
-                'leads': 80,
-                'inPractice': 65,
-                'inPracticePercent': 0.813,
-                'unqualified': 20,
-                'unqualifiedPercent': 0.308,
-                'costPerLead': 625,
-                'cases': 15,
-                'cpa': 3333,
-                'retainers': 20,
-                'pendingRetainers': 2,
-                'totalRetainers': 22,
-                'costPerRetainer': 2273,
-                'conversionRate': 0.338
-            },
-            {
-                'name': 'Arizona Prospecting',
-                'state': 'Arizona',
-                'campaigns': ['GS_NonBrand - AZ', 'PMAX_AZ'],
-                'cost': 120000,
-                'leads': 200,
-                'inPractice': 150,
-                'inPracticePercent': 0.750,
-                'unqualified': 50,
-                'unqualifiedPercent': 0.333,
-                'costPerLead': 600,
-                'cases': 25,
-                'cpa': 4800,
-                'retainers': 35,
-                'pendingRetainers': 3,
-                'totalRetainers': 38,
-                'costPerRetainer': 3158,
-                'conversionRate': 0.253
-            }
+            *DEMO_STATIC_BUCKETS
         ],
         'unmapped_campaigns': [],
         'unmapped_utms': [],
         'litify_leads': [],
-        'available_buckets': bucket_priority,
+        'available_buckets': DEMO_BUCKET_PRIORITY,
         'excluded_lead_counts': {
             'spam': 25 if include_spam else 0,
             'abandoned': 18 if include_abandoned else 0,
@@ -256,15 +276,25 @@ def get_demo_bucket_data(include_spam=False, include_abandoned=False, include_du
         }
     }
 
+# Salesforce intake URL for a demo lead id
+DEMO_SALESFORCE_INTAKE_URL = 'https://sweetjames.lightning.force.com/lightning/r/litify_pm__Intake__c/DEMO{:04d}/view'
+# Formatted ids/URLs for the first demo leads (demo lead counts stay far below this)
+DEMO_LEAD_IDS = tuple(f'DEMO{i:04d}' for i in range(512))
+DEMO_LEAD_SALESFORCE_URLS = tuple(DEMO_SALESFORCE_INTAKE_URL.format(i) for i in range(len(DEMO_LEAD_IDS)))
+
+# Values the demo leads rotate through
+DEMO_LEAD_STATUSES = ('Open', 'Working', 'Under Review', 'Retainer Sent', 'Signed', 'Unqualified', 'Converted DAI', 'Referred Out')
+DEMO_CASE_TYPES = ('Motor Vehicle Accident', 'Slip and Fall', 'Dog Bite', 'Premises Liability', 'Wrongful Death',
+                   'Product Liability', 'Spam', 'Abandoned', 'Duplicate')
+DEMO_UTM_CAMPAIGNS = ('CA-EN-Brand', 'CA-Pmax-EN-MVA', 'gs_nonbrand-ca', 'gs_brand-az', 'pmax_az', 'gs_brand-ga',
+                      'CA-NB-LSA', 'CA-LA-LSA', 'AZ-PX-LSA', 'GA-RO-LSA')
+# Case types that are never in practice (spam, abandoned, duplicate)
+DEMO_EXCLUDED_CASE_TYPES = frozenset({'Spam', 'Abandoned', 'Duplicate'})
+# Regular demo leads only use the first 6 (non-excluded) case types
+DEMO_IN_PRACTICE_CASE_TYPES = DEMO_CASE_TYPES[:6]
+
 def get_demo_litify_leads(utm_to_bucket_mapping, include_spam=False, include_abandoned=False, include_duplicate=False):
     """Return demo Litify leads data with bucket mapping and exclusion filters"""
-    demo_leads = []
-    statuses = ['Open', 'Working', 'Under Review', 'Retainer Sent', 'Signed', 'Unqualified', 'Converted DAI', 'Referred Out']
-    case_types = ['Motor Vehicle Accident', 'Slip and Fall', 'Dog Bite', 'Premises Liability', 'Wrongful Death', 
-                  'Product Liability', 'Spam', 'Abandoned', 'Duplicate']
-    utm_campaigns = ['CA-EN-Brand', 'CA-Pmax-EN-MVA', 'gs_nonbrand-ca', 'gs_brand-az', 'pmax_az', 'gs_brand-ga', 
-                     'CA-NB-LSA', 'CA-LA-LSA', 'AZ-PX-LSA', 'GA-RO-LSA']
-    
     # Create some cases with companions (using matter_id to group them)
     case_groups = [
         {'matter_id': 'MATTER001', 'case_id': 'CASE001', 'num_companions': 3, 'converted': True},
@@ -283,414 +313,408 @@ def get_demo_litify_leads(utm_to_bucket_mapping, include_spam=False, include_aba
         {'case_type': 'Abandoned', 'include': include_abandoned},
     ]
     
-    lead_id = 0
-    
-    # Add excluded type leads
-    for excluded_data in excluded_leads_data:
-        if not excluded_data['include']:
-            continue  # Skip if not included
-            
-        lead_time = datetime.now() - timedelta(hours=lead_id*2)
-        case_type = excluded_data['case_type']
-        in_practice = False  # Excluded types are not in practice
-        utm_campaign = utm_campaigns[lead_id % len(utm_campaigns)]
-        bucket = utm_to_bucket_mapping.get(utm_campaign, '')
-        
-        demo_leads.append({
-            'id': f'DEMO{lead_id:04d}',
-            'salesforce_url': f'https://sweetjames.lightning.force.com/lightning/r/litify_pm__Intake__c/DEMO{lead_id:04d}/view',
-            'created_date': lead_time.isoformat(),
-            'status': 'Unqualified',
-            'client_name': f'{case_type} Lead {lead_id+1}',
-            'is_converted': False,
-            'is_pending': False,
-            'case_type': case_type,
-            'in_practice': in_practice,
-            'utm_campaign': utm_campaign,
-            'bucket': bucket,
-            'is_excluded_type': True,
-            'has_companion': False,
-            'matter_id': '',
-            'companion_case_id': '',
-            'is_dropped': False,
-        })
-        lead_id += 1
-    
-    # Add regular demo leads
-    for case_group in case_groups:
-        # Main lead
-        lead_time = datetime.now() - timedelta(hours=lead_id*2)
-        status = 'Signed' if case_group['converted'] else statuses[lead_id % len(statuses)]
-        case_type = case_types[lead_id % 6]  # Only use first 6 (non-excluded) case types
-        utm_campaign = utm_campaigns[lead_id % len(utm_campaigns)]
-        bucket = utm_to_bucket_mapping.get(utm_campaign, '')
-        
-        # Determine in_practice based on case type (exclude spam, abandoned, duplicate)
-        in_practice = case_type not in ['Spam', 'Abandoned', 'Duplicate']
-        is_converted = case_group['converted']
-        is_pending = status == 'Retainer Sent'
-        is_dropped = False
+    # Bucket for each UTM campaign and in-practice flag for each case type, looked up once
+    utm_buckets = [utm_to_bucket_mapping.get(utm_campaign, '') for utm_campaign in DEMO_UTM_CAMPAIGNS]
+    # Determine in_practice based on case type (exclude spam, abandoned, duplicate)
+    in_practice_by_case_type = [case_type not in DEMO_EXCLUDED_CASE_TYPES for case_type in DEMO_IN_PRACTICE_CASE_TYPES]
+    
+    # Skip excluded types that are not included
+    excluded_case_types = [d['case_type'] for d in excluded_leads_data if d['include']]
+    
+    # One slot per regular lead: each case group's main lead followed by its companions
+    lead_slots = [
+        (case_group['matter_id'], case_group['case_id'], case_group['converted'],
+         comp_idx > 0, case_group['num_companions'] > 0)
+        for case_group in case_groups
+        for comp_idx in range(1 + case_group['num_companions'])
+    ]
+    
+    # Lead N is created N*2 hours ago - one clock read, all timestamps formatted up front
+    now = datetime.now()
+    total_leads = len(excluded_case_types) + len(lead_slots)
+    created_dates = [(now - timedelta(hours=i * 2)).isoformat() for i in range(total_leads)]
+    if total_leads <= len(DEMO_LEAD_IDS):
+        lead_ids, salesforce_urls = DEMO_LEAD_IDS, DEMO_LEAD_SALESFORCE_URLS
+    else:
+        lead_ids = [f'DEMO{i:04d}' for i in range(total_leads)]
+        salesforce_urls = [DEMO_SALESFORCE_INTAKE_URL.format(i) for i in range(total_leads)]
+    
+    # Categorical columns rotate through their value lists by lead_id; expand them
+    # once with cycle() instead of taking lead_id modulo per lead
+    lead_statuses = list(islice(cycle(DEMO_LEAD_STATUSES), total_leads))
+    lead_case_types = list(islice(cycle(zip(DEMO_IN_PRACTICE_CASE_TYPES, in_practice_by_case_type)), total_leads))
+    lead_utms = list(islice(cycle(zip(DEMO_UTM_CAMPAIGNS, utm_buckets)), total_leads))
+    
+    # Add excluded type leads (they come first, so lead_id is their position)
+    demo_leads = [{
+        'id': lead_ids[lead_id],
+        'salesforce_url': salesforce_urls[lead_id],
+        'created_date': created_dates[lead_id],
+        'status': 'Unqualified',
+        'client_name': f'{case_type} Lead {lead_id+1}',
+        'is_converted': False,
+        'is_pending': False,
+        'case_type': case_type,
+        'in_practice': False,  # Excluded types are not in practice
+        'utm_campaign': lead_utms[lead_id][0],
+        'bucket': lead_utms[lead_id][1],
+        'is_excluded_type': True,
+        'has_companion': False,
+        'matter_id': '',
+        'companion_case_id': '',
+        'is_dropped': False,
+    } for lead_id, case_type in enumerate(excluded_case_types)]
+    
+    # Add regular demo leads (main leads and companions share one dict layout)
+    for lead_id, (matter_id, case_id, converted, is_companion, has_companion) in enumerate(lead_slots, start=len(demo_leads)):
+        status = 'Signed' if converted else lead_statuses[lead_id]
+        case_type, in_practice = lead_case_types[lead_id]
+        utm_campaign, bucket = lead_utms[lead_id]
+        if is_companion:
+            companion_case_id = case_id
+        else:
+            companion_case_id = f"CASE{lead_id+1:03d}" if has_companion else ''
         
         demo_leads.append({
-            'id': f'DEMO{lead_id:04d}',
-            'salesforce_url': f'https://sweetjames.lightning.force.com/lightning/r/litify_pm__Intake__c/DEMO{lead_id:04d}/view',
-            'created_date': lead_time.isoformat(),
+            'id': lead_ids[lead_id],
+            'salesforce_url': salesforce_urls[lead_id],
+            'created_date': created_dates[lead_id],
             'status': status,
-            'client_name': f'Demo Client {lead_id+1}',
-            'is_converted': is_converted,
-            'is_pending': is_pending,
+            'client_name': f"Demo {'Companion' if is_companion else 'Client'} {lead_id+1}",
+            'is_converted': converted,
+            'is_pending': status == 'Retainer Sent',
             'case_type': case_type,
             'in_practice': in_practice,
             'utm_campaign': utm_campaign,
             'bucket': bucket,
             'is_excluded_type': False,
-            'has_companion': case_group['num_companions'] > 0,
-            'matter_id': case_group['matter_id'],
-            'companion_case_id': f"CASE{lead_id+1:03d}" if case_group['num_companions'] > 0 else '',
-            'is_dropped': is_dropped,
+            'has_companion': has_companion,
+            'matter_id': matter_id,
+            'companion_case_id': companion_case_id,
+            'is_dropped': False,
         })
-        lead_id += 1
-        
-        # Add companion leads
-        for comp_idx in range(case_group['num_companions']):
-            lead_time = datetime.now() - timedelta(hours=lead_id*2)
-            status = 'Signed' if case_group['converted'] else statuses[lead_id % len(statuses)]
-            case_type = case_types[lead_id % 6]
-            utm_campaign = utm_campaigns[lead_id % len(utm_campaigns)]
-            bucket = utm_to_bucket_mapping.get(utm_campaign, '')
-            
-            in_practice = case_type not in ['Spam', 'Abandoned', 'Duplicate']
-            is_converted = case_group['converted']
-            is_pending = status == 'Retainer Sent'
-            
-            demo_leads.append({
-                'id': f'DEMO{lead_id:04d}',
-                'salesforce_url': f'https://sweetjames.lightning.force.com/lightning/r/litify_pm__Intake__c/DEMO{lead_id:04d}/view',
-                'created_date': lead_time.isoformat(),
-                'status': status,
-                'client_name': f'Demo Companion {lead_id+1}',
-                'is_converted': is_converted,
-                'is_pending': is_pending,
-                'case_type': case_type,
-                'in_practice': in_practice,
-                'utm_campaign': utm_campaign,
-                'bucket': bucket,
-                'is_excluded_type': False,
-                'has_companion': True,
-                'matter_id': case_group['matter_id'],
-                'companion_case_id': case_group['case_id'],
-                'is_dropped': is_dropped,
-            })
-            lead_id += 1
     
     return demo_leads
 
-def get_demo_pacing_data():
-    """Return demo pacing data for states"""
-    return {
-        'states': {
-            'CA': {
-                'spend': 450000,
-                'leads': 650,
-                'cases': 140,
-                'retainers': 160
-            },
-            'AZ': {
-                'spend': 200000,
-                'leads': 180,
-                'cases': 40,
-                'retainers': 45
-            },
-            'GA': {
-                'spend': 75000,
-                'leads': 110,
-                'cases': 24,
-                'retainers': 28
-            },
-            'TX': {
-                'spend': 0,
-                'leads': 0,
-                'cases': 0,
-                'retainers': 0
-            }
+# Demo pacing numbers per state
+DEMO_PACING_DATA = {
+    'states': {
+        'CA': {
+            'spend': 450000,
+            'leads': 650,
+            'cases': 140,
+            'retainers': 160
+        },
+        'AZ': {
+            'spend': 200000,
+            'leads': 180,
+            'cases': 40,
+            'retainers': 45
+        },
+        'GA': {
+            'spend': 75000,
+            'leads': 110,
+            'cases': 24,
+            'retainers': 28
+        },
+        'TX': {
+            'spend': 0,
+            'leads': 0,
+            'cases': 0,
+            'retainers': 0
         }
     }
+}
+
+def get_demo_pacing_data():
+    """Return demo pacing data for states (shared dict - treat as read-only)"""
+    return DEMO_PACING_DATA
+
+# (field, low, high) inclusive bounds of the random demo monthly summary values
+DEMO_MONTHLY_SUMMARY_RANGES = (
+    ('spend', 500000, 1500000),
+    ('leads', 400, 800),
+    ('cases', 80, 200),
+    ('retainers', 100, 250),
+    ('in_practice', 350, 700),
+    ('unqualified', 50, 150),
+)
+
+def get_demo_monthly_summaries(n_months):
+    """Generate n_months demo monthly summaries for annual analytics from one batched draw"""
+    fields, lows, highs = zip(*DEMO_MONTHLY_SUMMARY_RANGES)
+    draws = _RNG.integers(lows, highs, (n_months, len(fields)), endpoint=True).tolist()
+    return [
+        {**dict(zip(fields, row)), 'cpl': 0, 'cpa': 0, 'cpr': 0, 'conversion_rate': 0}
+        for row in draws
+    ]
+
+# (field, low, high) inclusive bounds of the random demo daily totals (current month view)
+DEMO_DAY_TOTAL_RANGES = (
+    ('spend', 20000, 50000),
+    ('leads', 15, 40),
+    ('inPractice', 12, 35),
+    ('unqualified', 2, 8),
+    ('cases', 3, 10),
+    ('retainers', 4, 12),
+)
+
+def get_demo_day_totals(n_days):
+    """Generate n_days demo daily totals for the current month view from one batched draw"""
+    fields, lows, highs = zip(*DEMO_DAY_TOTAL_RANGES)
+    draws = _RNG.integers(lows, highs, (n_days, len(fields)), endpoint=True).tolist()
+    return [dict(zip(fields, row)) for row in draws]
 
 def get_demo_monthly_summary():
     """Generate demo monthly summary data for annual analytics"""
-    return {
-        'spend': random.randint(500000, 1500000),
-        'leads': random.randint(400, 800),
-        'cases': random.randint(80, 200),
-        'retainers': random.randint(100, 250),
-        'in_practice': random.randint(350, 700),
-        'unqualified': random.randint(50, 150),
-        'cpl': 0,
-        'cpa': 0,
-        'cpr': 0,
-        'conversion_rate': 0
+    return get_demo_monthly_summaries(1)[0]
+
+# Demo forecast numbers
+DEMO_FORECAST_DATA = {
+    'current_month_actual': {
+        'spend': 750000,
+        'leads': 550,
+        'retainers': 120,
+        'cases': 95
+    },
+    'projection': {
+        'total_spend': 1200000,
+        'total_leads': 880,
+        'total_retainers': 192,
+        'total_cases': 152
+    },
+    'daily_average': {
+        'spend': 38710,
+        'leads': 28,
+        'retainers': 6,
+        'cases': 5
+    },
+    'remaining': {
+        'days': 15,
+        'spend': 450000,
+        'leads': 330,
+        'retainers': 72,
+        'cases': 57
     }
+}
 
 def get_demo_forecast_data():
-    """Return demo forecast data"""
-    return {
-        'current_month_actual': {
-            'spend': 750000,
-            'leads': 550,
-            'retainers': 120,
-            'cases': 95
-        },
-        'projection': {
-            'total_spend': 1200000,
-            'total_leads': 880,
-            'total_retainers': 192,
-            'total_cases': 152
-        },
-        'daily_average': {
-            'spend': 38710,
-            'leads': 28,
-            'retainers': 6,
-            'cases': 5
-        },
-        'remaining': {
-            'days': 15,
-            'spend': 450000,
-            'leads': 330,
-            'retainers': 72,
-            'cases': 57
-        }
-    }
+    """Return demo forecast data (shared dict - treat as read-only)"""
+    return DEMO_FORECAST_DATA
 
 
 # Add this function to your demo_data.py file
 
-def get_demo_current_month_daily():
+# Buckets in the demo current-month daily view and their share of each day's spend/leads
+DEMO_DAILY_BUCKET_ALLOCATIONS = (
+    ("California Brand", 0.25),
+    ("California Prospecting", 0.20),
+    ("California LSA", 0.15),
+    ("Arizona Brand", 0.15),
+    ("Arizona LSA", 0.10),
+    ("Georgia Brand", 0.08),
+    ("Georgia LSA", 0.05),
+    ("Texas Brand", 0.02),
+)
+DEMO_DAILY_BUCKET_NAMES = tuple(name for name, _ in DEMO_DAILY_BUCKET_ALLOCATIONS)
+DEMO_DAILY_BUCKET_ALLOCATION = np.array([share for _, share in DEMO_DAILY_BUCKET_ALLOCATIONS])
+
+def _ratio(numerator, denominator, digits, scale=1):
+    """Elementwise round(numerator / denominator * scale, digits), 0 where the denominator is 0"""
+    # Masked float division in place of a per-element branch - no gather/scatter copies
+    out = np.divide(numerator, denominator, out=np.zeros(np.shape(denominator)),
+                    where=denominator > 0, dtype=np.float64)
+    if scale != 1:
+        out *= scale
+    return np.round(out, digits, out=out)
+
+def _cost_metrics(spend, leads, cases, retainers, in_practice):
+    """CPL, CPA, CPR and conversion rate (%) for same-shaped metric arrays"""
+    return (
+        _ratio(spend, leads, 2),
+        _ratio(spend, cases, 2),
+        _ratio(spend, retainers, 2),
+        _ratio(retainers, in_practice, 1, scale=100),
+    )
+
+def _pct_change(values):
+    """Day-over-day % change along axis 0, rounded to 1 decimal (0 where the previous day is 0)"""
+    out = np.zeros(np.shape(values))
+    out[1:] = _ratio(values[1:] - values[:-1], values[:-1], 1, scale=100)
+    return out
+
+def _with_first_none(values):
+    """Array -> list with the first day's delta(s) replaced by None (no previous day)"""
+    first = None if values.ndim == 1 else [None] * values.shape[1]
+    values = values.tolist()
+    values[0] = first
+    return values
+
+def iter_demo_current_month_daily():
     """
     Generate demo data for current month daily performance
-    Used as fallback when APIs are not available
+    Yields ('day', day_data) for every day of the month, then a single
+    ('summary', {...}) with month_summary, best/worst days and data source
+    Day and bucket metrics are generated as NumPy arrays (days x buckets) and
+    only turned into per-day dicts as each day is yielded
     """
-    from datetime import datetime, date, timedelta
-    import calendar
-    import random
-    
+    # One clock read for the whole month: today, the calendar and the response timestamp
     now = datetime.now()
-    month_start = date(now.year, now.month, 1)
     month_end = date(now.year, now.month, calendar.monthrange(now.year, now.month)[1])
     today = now.date()
+    today_data = None
+    
+    available_buckets = list(DEMO_DAILY_BUCKET_NAMES)
+    n_buckets = len(DEMO_DAILY_BUCKET_NAMES)
+    
+    # Days up to today - calendar fields are computed once per day here
+    n_days = min(today.day, month_end.day)
+    dates = [date(now.year, now.month, day_num) for day_num in range(1, n_days + 1)]
+    date_strs = [d.strftime('%Y-%m-%d') for d in dates]
+    day_names = [d.strftime('%a') for d in dates]
+    weekend = np.fromiter((d.weekday() >= 5 for d in dates), dtype=bool, count=n_days)
+    rng = _RNG
+    
+    # Lower metrics on weekends
+    weekend_factor = np.where(weekend, 0.7, 1.0)
+    
+    # All randomness comes from three batched draws (one per shape/kind) whose
+    # trailing axis holds one column per factor, each with its own range
+    base_spend, base_leads = rng.integers((45000, 35), (75000, 65), (n_days, 2), endpoint=True).T
+    in_practice_rate, retainer_rate, case_rate = rng.uniform(
+        (0.7, 0.20, 0.75), (0.9, 0.35, 0.95), (n_days, 3)).T
+    bucket_spend_var, bucket_leads_var, bucket_in_practice_rate, bucket_retainer_rate = rng.uniform(
+        (0.8, 0.7, 0.7, 0.20), (1.2, 1.3, 0.9, 0.35), (n_days, n_buckets, 4)).transpose(2, 0, 1)
+    
+    # Day-level metrics (one entry per day)
+    spend = base_spend * weekend_factor
+    leads = base_leads * weekend_factor
+    in_practice = (leads * in_practice_rate).astype(np.int64)
+    retainers = (in_practice * retainer_rate).astype(np.int64)
+    cases = (retainers * case_rate).astype(np.int64)
+    unqualified = in_practice - retainers
+    
+    cpl, cpa, cpr, conv_rate = _cost_metrics(spend, leads, cases, retainers, in_practice)
+    
+    # Bucket breakdown (days x buckets)
+    bucket_spend = spend[:, None] * DEMO_DAILY_BUCKET_ALLOCATION * bucket_spend_var
+    bucket_leads = (leads[:, None] * DEMO_DAILY_BUCKET_ALLOCATION * bucket_leads_var).astype(np.int64)
+    bucket_in_practice = (bucket_leads * bucket_in_practice_rate).astype(np.int64)
+    bucket_retainers = (bucket_in_practice * bucket_retainer_rate).astype(np.int64)
+    bucket_spend_rounded = np.round(bucket_spend, 2)
+    # Bucket CPA uses the unrounded 85% case estimate
+    bucket_cpl, bucket_cpa, bucket_cpr, bucket_conv_rate = _cost_metrics(
+        bucket_spend, bucket_leads, bucket_retainers * 0.85, bucket_retainers, bucket_in_practice)
+    
+    bucket_columns = {
+        'spend': bucket_spend_rounded.tolist(),
+        'leads': bucket_leads.tolist(),
+        'inPractice': bucket_in_practice.tolist(),
+        'unqualified': (bucket_in_practice - bucket_retainers).tolist(),
+        'cases': (bucket_retainers * 0.85).astype(np.int64).tolist(),
+        'retainers': bucket_retainers.tolist(),
+        'cpl': bucket_cpl.tolist(),
+        'cpa': bucket_cpa.tolist(),
+        'cpr': bucket_cpr.tolist(),
+        'convRate': bucket_conv_rate.tolist(),
+        'spendDelta': _with_first_none(_pct_change(bucket_spend_rounded)),
+        'leadsDelta': _with_first_none(np.diff(bucket_leads, axis=0, prepend=0)),
+    }
+    
+    day_columns = {
+        'spend': spend.tolist(),
+        'leads': leads.tolist(),
+        'inPractice': in_practice.tolist(),
+        'unqualified': unqualified.tolist(),
+        'cases': cases.tolist(),
+        'retainers': retainers.tolist(),
+        'cpl': cpl.tolist(),
+        'cpa': cpa.tolist(),
+        'cpr': cpr.tolist(),
+        'convRate': conv_rate.tolist(),
+    }
+    
+    # Deltas vs previous day (None on the first day)
+    day_deltas = {
+        'spendDelta': _with_first_none(_pct_change(spend)),
+        'leadsDelta': _with_first_none(np.diff(leads, prepend=0)),
+        'casesDelta': _with_first_none(np.diff(cases, prepend=0)),
+        'retainersDelta': _with_first_none(np.diff(retainers, prepend=0)),
+        'cplDelta': _with_first_none(_pct_change(cpl)),
+        'cpaDelta': _with_first_none(_pct_change(cpa)),
+        'convDelta': _with_first_none(np.round(np.diff(conv_rate, prepend=0), 1)),
+    }
     
-    daily_data = []
     month_totals = {
-        'total_spend': 0,
-        'total_leads': 0,
-        'total_cases': 0,
-        'total_retainers': 0,
-        'total_in_practice': 0,
-        'total_unqualified': 0
+        'total_spend': spend.sum().item(),
+        'total_leads': leads.sum().item(),
+        'total_cases': cases.sum().item(),
+        'total_retainers': retainers.sum().item(),
+        'total_in_practice': in_practice.sum().item(),
+        'total_unqualified': unqualified.sum().item()
     }
     
+    # Best/worst days - one masked argmax/argmin per metric (first day wins ties)
+    def pick_day(values, eligible, largest, fields):
+        if not eligible.any():
+            return None
+        masked = np.where(eligible, values, -np.inf if largest else np.inf)
+        idx = int(np.argmax(masked) if largest else np.argmin(masked))
+        return {'date': date_strs[idx], **{key: column[idx] for key, column in fields.items()}}
+    
+    has_leads = leads > 0
+    has_conversions = conv_rate > 0
+    efficiency = np.divide(retainers, spend / 10000, out=np.zeros(n_days), where=spend > 0)
+    
     best_days = {
-        'highest_leads': None,
-        'best_conversion': None,
-        'lowest_cpl': None
+        'highest_leads': pick_day(leads, has_leads, True,
+                                  {'leads': day_columns['leads'], 'spend': day_columns['spend']}),
+        'best_conversion': pick_day(conv_rate, has_conversions, True,
+                                    {'convRate': day_columns['convRate'], 'retainers': day_columns['retainers']}),
+        'lowest_cpl': pick_day(cpl, has_leads, False,
+                               {'cpl': day_columns['cpl'], 'leads': day_columns['leads']}),
     }
+    # Inefficient days (high spend, low returns)
     worst_days = {
-        'highest_cpl': None,
-        'lowest_conversion': None,
-        'inefficient': None
+        'highest_cpl': pick_day(cpl, has_leads, True,
+                                {'cpl': day_columns['cpl'], 'leads': day_columns['leads']}),
+        'lowest_conversion': pick_day(conv_rate, has_conversions, False,
+                                      {'convRate': day_columns['convRate'], 'retainers': day_columns['retainers']}),
+        'inefficient': pick_day(efficiency, np.ones(n_days, dtype=bool), False,
+                                {'spend': day_columns['spend'], 'retainers': day_columns['retainers'],
+                                 'efficiency': efficiency.tolist()}),
     }
     
-    available_buckets = [
-        "California Brand",
-        "California Prospecting",
-        "California LSA",
-        "Arizona Brand",
-        "Arizona LSA",
-        "Georgia Brand",
-        "Georgia LSA",
-        "Texas Brand"
-    ]
-    
-    previous_day_data = None
-    
-    # Generate data for each day up to today
-    for day_num in range(1, min(today.day + 1, month_end.day + 1)):
-        current_date = date(now.year, now.month, day_num)
-        date_str = current_date.strftime('%Y-%m-%d')
-        
-        # Generate random but realistic data
-        is_weekend = current_date.weekday() >= 5
-        
-        # Lower metrics on weekends
-        weekend_factor = 0.7 if is_weekend else 1.0
-        
-        # Base metrics with some randomness
-        spend = random.randint(45000, 75000) * weekend_factor
-        leads = random.randint(35, 65) * weekend_factor
-        in_practice = int(leads * random.uniform(0.7, 0.9))
-        retainers = int(in_practice * random.uniform(0.20, 0.35))
-        cases = int(retainers * random.uniform(0.75, 0.95))
-        unqualified = in_practice - retainers
+    # Assemble the per-day dicts the API returns
+    weekend = weekend.tolist()
+    for idx, current_date in enumerate(dates):
+        date_str = date_strs[idx]
         
         day_data = {
             'date': date_str,
-            'dayNum': day_num,
-            'dayName': current_date.strftime('%a'),
+            'dayNum': idx + 1,
+            'dayName': day_names[idx],
             'isToday': current_date == today,
             'isFuture': False,
-            'isWeekend': is_weekend,
-            'spend': spend,
-            'leads': leads,
-            'inPractice': in_practice,
-            'unqualified': unqualified,
-            'cases': cases,
-            'retainers': retainers,
-            'cpl': round(spend / leads, 2) if leads > 0 else 0,
-            'cpa': round(spend / cases, 2) if cases > 0 else 0,
-            'cpr': round(spend / retainers, 2) if retainers > 0 else 0,
-            'convRate': round((retainers / in_practice) * 100, 1) if in_practice > 0 else 0,
-            'buckets': []
-        }
-        
-        # Generate bucket breakdown
-        bucket_allocations = {
-            "California Brand": 0.25,
-            "California Prospecting": 0.20,
-            "California LSA": 0.15,
-            "Arizona Brand": 0.15,
-            "Arizona LSA": 0.10,
-            "Georgia Brand": 0.08,
-            "Georgia LSA": 0.05,
-            "Texas Brand": 0.02
+            'isWeekend': weekend[idx],
         }
+        for key, column in day_columns.items():
+            day_data[key] = column[idx]
+        day_data['buckets'] = [
+            {'name': bucket_name, **{key: column[idx][b] for key, column in bucket_columns.items()}}
+            for b, bucket_name in enumerate(DEMO_DAILY_BUCKET_NAMES)
+        ]
+        for key, column in day_deltas.items():
+            day_data[key] = column[idx]
         
-        for bucket_name, allocation in bucket_allocations.items():
-            bucket_spend = spend * allocation * random.uniform(0.8, 1.2)
-            bucket_leads = int(leads * allocation * random.uniform(0.7, 1.3))
-            bucket_in_practice = int(bucket_leads * random.uniform(0.7, 0.9))
-            bucket_retainers = int(bucket_in_practice * random.uniform(0.20, 0.35))
-            
-            bucket_data = {
-                'name': bucket_name,
-                'spend': round(bucket_spend, 2),
-                'leads': bucket_leads,
-                'inPractice': bucket_in_practice,
-                'unqualified': bucket_in_practice - bucket_retainers,
-                'cases': int(bucket_retainers * 0.85),
-                'retainers': bucket_retainers,
-                'cpl': round(bucket_spend / bucket_leads, 2) if bucket_leads > 0 else 0,
-                'cpa': round(bucket_spend / (bucket_retainers * 0.85), 2) if bucket_retainers > 0 else 0,
-                'cpr': round(bucket_spend / bucket_retainers, 2) if bucket_retainers > 0 else 0,
-                'convRate': round((bucket_retainers / bucket_in_practice) * 100, 1) if bucket_in_practice > 0 else 0
-            }
-            
-            # Add deltas for buckets
-            if previous_day_data:
-                prev_bucket = next((b for b in previous_day_data.get('buckets', []) if b['name'] == bucket_name), None)
-                if prev_bucket:
-                    bucket_data['spendDelta'] = round(
-                        ((bucket_data['spend'] - prev_bucket['spend']) / prev_bucket['spend'] * 100) 
-                        if prev_bucket['spend'] > 0 else 0, 1
-                    )
-                    bucket_data['leadsDelta'] = bucket_data['leads'] - prev_bucket['leads']
-                else:
-                    bucket_data['spendDelta'] = None
-                    bucket_data['leadsDelta'] = None
-            else:
-                bucket_data['spendDelta'] = None
-                bucket_data['leadsDelta'] = None
-            
-            day_data['buckets'].append(bucket_data)
-        
-        # Calculate deltas vs previous day
-        if previous_day_data:
-            day_data['spendDelta'] = round(
-                ((day_data['spend'] - previous_day_data['spend']) / previous_day_data['spend'] * 100) 
-                if previous_day_data['spend'] > 0 else 0, 1
-            )
-            day_data['leadsDelta'] = day_data['leads'] - previous_day_data['leads']
-            day_data['casesDelta'] = day_data['cases'] - previous_day_data['cases']
-            day_data['retainersDelta'] = day_data['retainers'] - previous_day_data['retainers']
-            day_data['cplDelta'] = round(
-                ((day_data['cpl'] - previous_day_data['cpl']) / previous_day_data['cpl'] * 100) 
-                if previous_day_data['cpl'] > 0 else 0, 1
-            )
-            day_data['cpaDelta'] = round(
-                ((day_data['cpa'] - previous_day_data['cpa']) / previous_day_data['cpa'] * 100) 
-                if previous_day_data['cpa'] > 0 else 0, 1
-            )
-            day_data['convDelta'] = round(day_data['convRate'] - previous_day_data['convRate'], 1)
-        else:
-            day_data['spendDelta'] = None
-            day_data['leadsDelta'] = None
-            day_data['casesDelta'] = None
-            day_data['retainersDelta'] = None
-            day_data['cplDelta'] = None
-            day_data['cpaDelta'] = None
-            day_data['convDelta'] = None
-        
-        # Update totals
-        month_totals['total_spend'] += day_data['spend']
-        month_totals['total_leads'] += day_data['leads']
-        month_totals['total_cases'] += day_data['cases']
-        month_totals['total_retainers'] += day_data['retainers']
-        month_totals['total_in_practice'] += day_data['inPractice']
-        month_totals['total_unqualified'] += day_data['unqualified']
-        
-        # Track best/worst days
-        if day_data['leads'] > 0:
-            if not best_days['highest_leads'] or day_data['leads'] > best_days['highest_leads']['leads']:
-                best_days['highest_leads'] = {
-                    'date': date_str,
-                    'leads': day_data['leads'],
-                    'spend': day_data['spend']
-                }
-            
-            if not best_days['lowest_cpl'] or day_data['cpl'] < best_days['lowest_cpl']['cpl']:
-                best_days['lowest_cpl'] = {
-                    'date': date_str,
-                    'cpl': day_data['cpl'],
-                    'leads': day_data['leads']
-                }
-            
-            if not worst_days['highest_cpl'] or day_data['cpl'] > worst_days['highest_cpl']['cpl']:
-                worst_days['highest_cpl'] = {
-                    'date': date_str,
-                    'cpl': day_data['cpl'],
-                    'leads': day_data['leads']
-                }
-        
-        if day_data['convRate'] > 0:
-            if not best_days['best_conversion'] or day_data['convRate'] > best_days['best_conversion']['convRate']:
-                best_days['best_conversion'] = {
-                    'date': date_str,
-                    'convRate': day_data['convRate'],
-                    'retainers': day_data['retainers']
-                }
-            
-            if not worst_days['lowest_conversion'] or day_data['convRate'] < worst_days['lowest_conversion']['convRate']:
-                worst_days['lowest_conversion'] = {
-                    'date': date_str,
-                    'convRate': day_data['convRate'],
-                    'retainers': day_data['retainers']
-                }
-        
-        # Track inefficient days (high spend, low returns)
-        efficiency_score = day_data['retainers'] / (day_data['spend'] / 10000) if day_data['spend'] > 0 else 0
-        if not worst_days['inefficient'] or efficiency_score < worst_days['inefficient']['efficiency']:
-            worst_days['inefficient'] = {
-                'date': date_str,
-                'spend': day_data['spend'],
-                'retainers': day_data['retainers'],
-                'efficiency': efficiency_score
-            }
-        
-        daily_data.append(day_data)
-        previous_day_data = day_data
+        if day_data['isToday']:
+            today_data = day_data
+        yield 'day', day_data
     
     # Add future days as empty
     for day_num in range(today.day + 1, month_end.day + 1):
         current_date = date(now.year, now.month, day_num)
-        daily_data.append({
+        yield 'day', {
             'date': current_date.strftime('%Y-%m-%d'),
             'dayNum': day_num,
             'dayName': current_date.strftime('%a'),
@@ -715,11 +739,10 @@ def get_demo_current_month_daily():
             'cplDelta': None,
             'cpaDelta': None,
             'convDelta': None
-        })
+        }
     
     # Calculate month summary
     days_elapsed = today.day
-    today_data = daily_data[today.day - 1] if today.day <= len(daily_data) else None
     
     month_summary = {
         'totalSpend': month_totals['total_spend'],
@@ -741,8 +764,7 @@ def get_demo_current_month_daily():
         'convDelta': today_data['convDelta'] if today_data else 0
     }
     
-    return {
-        'daily_data': daily_data,
+    yield 'summary', {
         'month_summary': month_summary,
         'best_days': best_days,
         'worst_days': worst_days,
@@ -753,5 +775,20 @@ def get_demo_current_month_daily():
             'api_calls_saved': 0,
             'cache_stats': {'hits': 0, 'misses': 0, 'hit_rate': '0%'}
         },
-        'timestamp': datetime.now().isoformat()
-    }
\ No newline at end of file
+        'timestamp': now.isoformat()
+    }
+
+def get_demo_current_month_daily():
+    """
+    Generate demo data for current month daily performance
+    Used as fallback when APIs are not available
+    Collects iter_demo_current_month_daily() into a single response dict
+    """
+    daily_data = []
+    summary = {}
+    for kind, payload in iter_demo_current_month_daily():
+        if kind == 'day':
+            daily_data.append(payload)
+        else:
+            summary = payload
+    return {'daily_data': daily_data, **summary}
@@ -6,14 +6,22 @@ OPTIMIZED FOR DAY-BY-DAY FETCHING
 """
 
 import os
+import re
+import sys
+import io
+import csv
+import atexit
 import json
 import logging
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from functools import wraps
-from threading import Thread, Lock
+from threading import Thread, Lock, Event, current_thread
+from contextlib import contextmanager
 import concurrent.futures
-from collections import defaultdict
+import heapq
+import itertools
+from collections import OrderedDict
 import hashlib
 import calendar
 
@@ -32,6 +40,37 @@ except ImportError:
     COMPRESS_AVAILABLE = False
     logger.warning("flask-compress not available - compression disabled")
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available - using standard json encoder")
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Performance configuration - OPTIMIZED FOR DAILY DATA
 PERFORMANCE_CONFIG = {
     'cache_ttl': 600,  # Increased to 10 minutes for daily data
@@ -39,96 +78,238 @@ PERFORMANCE_CONFIG = {
     'daily_cache_ttl': 1800,  # 30 minutes for single-day fetches
     'background_refresh': True,
     'compression_level': 6,
+    # zstd level for clients that accept it, and the smallest body worth compressing
+    'zstd_level': 3,
+    'compression_min_size': 1024,
     'query_batch_size': 200,
     'parallel_fetch': True,
     'api_timeout': 30,
+    # Share global_cache/daily_cache across worker processes through Redis when set
+    # (run Redis with maxmemory-policy allkeys-lfu so it evicts the least-used entries)
+    'redis_url': os.environ.get('REDIS_URL'),
+    # Independently locked partitions per in-process cache
+    'cache_shards': 16,
+    # Worker threads in the shared parallel fetch pool
+    'fetch_workers': 16,
+    # Days warm_cache_for_month fetches at once (kept low for the APIs' rate limits)
+    'warm_cache_workers': 4,
+    # Seconds a failed upstream fetch is remembered before the API is tried again
+    'failed_fetch_ttl': 30,
+    # Cache TTL for Litify date ranges that ended before today (Pacific) - closed ranges rarely change
+    'closed_range_cache_ttl': 86400,
+    # Litify date ranges at least this many days long are queried as Bulk API 2.0 jobs,
+    # which are given bulk_query_timeout seconds to finish instead of api_timeout
+    'bulk_query_min_days': 92,
+    'bulk_query_timeout': 300,
 }
 
-class SmartCache:
-    """Smart caching with TTL and size limits"""
+class CacheShard:
+    """
+    One partition of a SmartCache: its own lock, LRU entries and hit/miss counters,
+    refresh-ahead loaders by key and the keys whose reload is in progress, plus the
+    tag index (tag -> keys, key -> tags) used by clear_tag
+    """
+    __slots__ = ('cache', 'lock', 'hits', 'misses', 'loaders', 'refreshing', 'tags', 'key_tags')
     
-    def __init__(self, ttl=300, max_size=100):
-        self.cache = {}
-        self.ttl = ttl
-        self.max_size = max_size
+    def __init__(self):
+        # Ordered least -> most recently used
+        self.cache = OrderedDict()
         self.lock = Lock()
         self.hits = 0
         self.misses = 0
+        self.loaders = {}
+        self.refreshing = set()
+        self.tags = {}
+        self.key_tags = {}
+    
+    def untag(self, key):
+        """Drop a key from the tag index (call with the lock held)"""
+        for tag in self.key_tags.pop(key, ()):
+            keys = self.tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self.tags[tag]
+    
+    def forget(self, key):
+        """Drop a removed key's loader and tags (call with the lock held)"""
+        self.loaders.pop(key, None)
+        self.untag(key)
+
+class SmartCache:
+    """
+    Smart caching with TTL and size limits (least recently used entries evicted first)
+    Entries are spread over shards by key hash so concurrent requests only contend on
+    the shard they touch; each shard holds up to max_size / shards entries.
+    With refresh_ahead_ratio set, a hit on an entry older than ttl * refresh_ahead_ratio
+    that has a loader (see set_loader) still returns the cached value but reloads it in
+    the background, so it is replaced before it expires
+    Entry ages are measured on time.monotonic(), so wall-clock adjustments don't expire
+    or extend them
+    """
+    
+    def __init__(self, ttl=300, max_size=100, shards=None, refresh_ahead_ratio=None):
+        shards = shards or PERFORMANCE_CONFIG.get('cache_shards', 16)
+        self.shards = [CacheShard() for _ in range(shards)]
+        self.shard_max_size = max(1, -(-max_size // shards))
+        self.ttl = ttl
+        self.max_size = max_size
+        self.refresh_ahead_ratio = refresh_ahead_ratio
         
     def _make_key(self, key_parts):
-        """Create a hash key from parts"""
-        key_str = json.dumps(key_parts, sort_keys=True)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        """Create a dict key from parts (a tuple of the parts, which are all hashable)"""
+        return tuple(key_parts) if isinstance(key_parts, list) else key_parts
+    
+    def _shard_for(self, key):
+        """Shard holding a (made) key"""
+        return self.shards[hash(key) % len(self.shards)]
     
     def get(self, key_parts):
         """Get item from cache"""
-        with self.lock:
-            key = self._make_key(key_parts)
-            
-            if key in self.cache:
-                item, timestamp = self.cache[key]
-                if time.time() - timestamp < self.ttl:
-                    self.hits += 1
+        key = self._make_key(key_parts)
+        shard = self._shard_for(key)
+        with shard.lock:
+            if key in shard.cache:
+                item, timestamp, ttl = shard.cache[key]
+                age = time.monotonic() - timestamp
+                if age < ttl:
+                    shard.hits += 1
+                    shard.cache.move_to_end(key)
+                    if self.refresh_ahead_ratio and age >= ttl * self.refresh_ahead_ratio:
+                        loader = shard.loaders.get(key)
+                        # One reload per key at a time
+                        if loader and key not in shard.refreshing:
+                            shard.refreshing.add(key)
+                            FETCH_EXECUTOR.submit(self._refresh_ahead, key_parts, key, loader)
                     return item
-                else:
-                    del self.cache[key]
+                # Expired entries stay (until evicted) as get_stale fallbacks
             
-            self.misses += 1
+            shard.misses += 1
             return None
     
-    def set(self, key_parts, value):
-        """Set item in cache"""
-        with self.lock:
-            key = self._make_key(key_parts)
+    def get_bytes(self, key_parts):
+        """Get an item set as already-encoded JSON bytes (the same as get in-process)"""
+        return self.get(key_parts)
+    
+    def get_stale(self, key_parts):
+        """
+        Get the last cached value for a key even if its TTL has passed (None if never cached)
+        For serving last-known-good data when an upstream fetch fails
+        """
+        key = self._make_key(key_parts)
+        shard = self._shard_for(key)
+        with shard.lock:
+            entry = shard.cache.get(key)
+            return entry[0] if entry else None
+    
+    def set(self, key_parts, value, ttl=None, tags=None):
+        """
+        Set item in cache, fresh for ttl seconds (default: the cache TTL)
+        tags: labels clear_tag can remove the entry by (None keeps the entry's current tags)
+        """
+        key = self._make_key(key_parts)
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.cache[key] = (value, time.monotonic(), ttl or self.ttl)
+            shard.cache.move_to_end(key)
             
-            # Remove oldest items if cache is full
-            if len(self.cache) >= self.max_size:
-                oldest_key = min(self.cache, key=lambda k: self.cache[k][1])
-                del self.cache[oldest_key]
+            if tags is not None:
+                shard.untag(key)
+                if tags:
+                    shard.key_tags[key] = tuple(tags)
+                    for tag in tags:
+                        shard.tags.setdefault(tag, set()).add(key)
             
-            self.cache[key] = (value, time.time())
+            # Remove the shard's least recently used item if it is full
+            if len(shard.cache) > self.shard_max_size:
+                evicted_key, _ = shard.cache.popitem(last=False)
+                shard.forget(evicted_key)
+    
+    def set_loader(self, key_parts, loader):
+        """
+        Register loader() as the way to rebuild a key's value for refresh-ahead
+        (a loader that raises or returns None leaves the cached value as it was)
+        """
+        key = self._make_key(key_parts)
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.loaders[key] = loader
+    
+    def _refresh_ahead(self, key_parts, key, loader):
+        """Reload one entry in the background"""
+        shard = self._shard_for(key)
+        try:
+            value = loader()
+            if value is not None:
+                # Keep the entry's own TTL
+                with shard.lock:
+                    entry = shard.cache.get(key)
+                self.set(key_parts, value, ttl=entry[2] if entry else None)
+        except Exception as e:
+            logger.error(f"Error refreshing cache entry {key_parts}: {e}")
+        finally:
+            with shard.lock:
+                shard.refreshing.discard(key)
     
     def clear(self):
         """Clear all cache"""
-        with self.lock:
-            self.cache.clear()
-            self.hits = 0
-            self.misses = 0
+        for shard in self.shards:
+            with shard.lock:
+                shard.cache.clear()
+                shard.loaders.clear()
+                shard.tags.clear()
+                shard.key_tags.clear()
+                shard.hits = 0
+                shard.misses = 0
     
     def clear_pattern(self, pattern):
         """Clear cache entries matching a pattern"""
-        with self.lock:
-            keys_to_remove = []
-            for key_parts in self.cache.keys():
-                if pattern in str(key_parts):
-                    keys_to_remove.append(key_parts)
-            
-            for key in keys_to_remove:
-                del self.cache[key]
-            
-            return len(keys_to_remove)
+        removed = 0
+        for shard in self.shards:
+            with shard.lock:
+                keys_to_remove = [key for key in shard.cache if pattern in str(key)]
+                for key in keys_to_remove:
+                    del shard.cache[key]
+                    shard.forget(key)
+                removed += len(keys_to_remove)
+        
+        return removed
+    
+    def clear_tag(self, tag):
+        """Clear the cache entries set with a tag; returns the number cleared"""
+        removed = 0
+        for shard in self.shards:
+            with shard.lock:
+                for key in shard.tags.get(tag, set()).copy():
+                    del shard.cache[key]
+                    shard.forget(key)
+                    removed += 1
+        
+        return removed
     
     def get_stats(self):
         """Get cache statistics"""
-        with self.lock:
-            total = self.hits + self.misses
-            hit_rate = (self.hits / total * 100) if total > 0 else 0
-            return {
-                'hits': self.hits,
-                'misses': self.misses,
-                'hit_rate': f"{hit_rate:.1f}%",
-                'size': len(self.cache),
-                'max_size': self.max_size
-            }
+        hits = sum(shard.hits for shard in self.shards)
+        misses = sum(shard.misses for shard in self.shards)
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': f"{hit_rate:.1f}%",
+            'size': sum(len(shard.cache) for shard in self.shards),
+            'max_size': self.max_size
+        }
 
 class DailyDataCache(SmartCache):
     """Special cache optimized for daily performance data"""
     
-    def __init__(self):
-        # Use longer TTL and bigger size for daily data
+    def __init__(self, refresh_ahead_ratio=0.75):
+        # Use longer TTL and bigger size for daily data; entries with a loader are
+        # reloaded in the background once they are refresh_ahead_ratio of the way to expiring
         super().__init__(
             ttl=PERFORMANCE_CONFIG.get('daily_cache_ttl', 1800),  # 30 minutes
-            max_size=250  # Enough for ~2 months of daily data
+            max_size=250,  # Enough for ~2 months of daily data
+            refresh_ahead_ratio=refresh_ahead_ratio
         )
     
     def get_day_key(self, date_str, data_type='combined'):
@@ -139,104 +320,458 @@ class DailyDataCache(SmartCache):
         """Get cached data for a specific day"""
         return self.get(self.get_day_key(date_str, data_type))
     
-    def set_day(self, date_str, data, data_type='combined'):
-        """Cache data for a specific day"""
-        self.set(self.get_day_key(date_str, data_type), data)
+    def set_day(self, date_str, data, data_type='combined', loader=None):
+        """Cache data for a specific day (loader: refresh-ahead loader, see set_loader)"""
+        key_parts = self.get_day_key(date_str, data_type)
+        # Tagged with its month for clear_month
+        self.set(key_parts, data, tags=(date_str[:7],))
+        if loader:
+            self.set_loader(key_parts, loader)
     
     def clear_month(self, year, month):
         """Clear all cached data for a specific month"""
         pattern = f"{year}-{month:02d}"
-        cleared = self.clear_pattern(pattern)
+        cleared = self.clear_tag(pattern)
         logger.info(f"Cleared {cleared} cached entries for {pattern}")
         return cleared
 
+class RedisCache(SmartCache):
+    """
+    SmartCache stored in Redis, so every worker process shares the same entries
+    Each entry is a hash (payload, timestamp, expires) under '<namespace>:<key parts joined by :>'
+    that is fresh until expires and kept stale_ttl seconds longer for get_stale;
+    size limits are left to Redis' own eviction policy
+    """
+    
+    def __init__(self, client, namespace, ttl=300, max_size=100, stale_ttl=86400):
+        SmartCache.__init__(self, ttl=ttl, max_size=max_size)
+        self.client = client
+        self.namespace = namespace
+        self.stale_ttl = stale_ttl
+    
+    def _make_key(self, key_parts):
+        """Readable Redis key from parts"""
+        return ':'.join([self.namespace, *map(str, key_parts)])
+    
+    def set_loader(self, key_parts, loader):
+        """No refresh-ahead for Redis entries - they expire (and are refetched) on their own"""
+    
+    def _read(self, key_parts):
+        """(payload, expires) of an entry, (None, 0) if missing or Redis fails"""
+        try:
+            payload, expires = self.client.hmget(self._make_key(key_parts), 'payload', 'expires')
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ Redis cache read failed: {e}")
+            return None, 0
+        return payload, float(expires or 0)
+    
+    def get(self, key_parts):
+        """Get item from cache (a Redis error counts as a miss)"""
+        payload = self.get_bytes(key_parts)
+        if payload is None:
+            return None
+        return from_json_bytes(payload)
+    
+    def get_bytes(self, key_parts):
+        """Get an item's stored JSON without decoding it (a Redis error counts as a miss)"""
+        payload, expires = self._read(key_parts)
+        
+        # Hit/miss counters live on the (otherwise empty) in-process shards
+        shard = self._shard_for(self._make_key(key_parts))
+        with shard.lock:
+            if payload is None or time.time() >= expires:
+                shard.misses += 1
+                return None
+            shard.hits += 1
+        return payload
+    
+    def get_stale(self, key_parts):
+        """Get the last cached value for a key even if its TTL has passed (None if gone)"""
+        payload, _ = self._read(key_parts)
+        if payload is None:
+            return None
+        return from_json_bytes(payload)
+    
+    def set(self, key_parts, value, ttl=None, tags=None):
+        """
+        Set item in cache, expiring after ttl seconds (default: the cache TTL)
+        bytes values are stored as they are (already-encoded JSON/msgpack - read back with get_bytes)
+        tags are not indexed - clear_tag matches them against the readable key instead
+        """
+        key = self._make_key(key_parts)
+        try:
+            payload = value if isinstance(value, bytes) else to_json_bytes(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Not caching {key}: {e}")
+            return
+        
+        ttl = ttl or self.ttl
+        now = time.time()
+        try:
+            with self.client.pipeline() as pipe:
+                pipe.hset(key, mapping={'payload': payload, 'timestamp': now, 'expires': now + ttl})
+                pipe.expire(key, ttl + self.stale_ttl)
+                pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ Redis cache write failed: {e}")
+    
+    def _delete_matching(self, match):
+        """Delete this namespace's keys matching a Redis glob; returns the number deleted (0 if Redis fails)"""
+        try:
+            keys = list(self.client.scan_iter(match=match, count=500))
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ Redis cache delete failed: {e}")
+            return 0
+        return len(keys)
+    
+    def clear(self):
+        """Clear all cache"""
+        self._delete_matching(f"{self.namespace}:*")
+        for shard in self.shards:
+            with shard.lock:
+                shard.hits = 0
+                shard.misses = 0
+    
+    def clear_pattern(self, pattern):
+        """Clear cache entries matching a pattern"""
+        return self._delete_matching(f"{self.namespace}:*{pattern}*")
+    
+    def clear_tag(self, tag):
+        """Clear cache entries whose key contains the tag"""
+        return self.clear_pattern(tag)
+    
+    def get_stats(self):
+        """Get cache statistics (size is None when Redis can't be reached)"""
+        stats = SmartCache.get_stats(self)
+        try:
+            stats['size'] = sum(1 for _ in self.client.scan_iter(match=f"{self.namespace}:*", count=500))
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ Redis cache size lookup failed: {e}")
+            stats['size'] = None
+        stats['backend'] = 'redis'
+        return stats
+
+class RedisDailyDataCache(RedisCache, DailyDataCache):
+    """DailyDataCache stored in Redis"""
+    
+    def __init__(self, client):
+        RedisCache.__init__(
+            self, client, 'daily',
+            ttl=PERFORMANCE_CONFIG.get('daily_cache_ttl', 1800),
+            max_size=250
+        )
+
+def connect_redis():
+    """Redis client for PERFORMANCE_CONFIG['redis_url'] (None when unset, not installed or unreachable)"""
+    redis_url = PERFORMANCE_CONFIG.get('redis_url')
+    if redis_url:
+        if not REDIS_AVAILABLE:
+            logger.warning("⚠️ REDIS_URL is set but redis is not installed - using in-process caches")
+        else:
+            try:
+                client = redis.Redis.from_url(redis_url)
+                client.ping()
+                return client
+            except redis.RedisError as e:
+                logger.warning(f"⚠️ Redis unavailable ({e}) - using in-process caches")
+    return None
+
+def create_caches():
+    """
+    Build (global_cache, daily_cache): Redis-backed when PERFORMANCE_CONFIG['redis_url']
+    is set and reachable, in-process otherwise
+    """
+    client = connect_redis()
+    if client:
+        logger.info("✅ Redis-backed caches enabled")
+        return (
+            RedisCache(client, 'global', ttl=PERFORMANCE_CONFIG['cache_ttl'],
+                       max_size=PERFORMANCE_CONFIG['max_cache_size']),
+            RedisDailyDataCache(client)
+        )
+    
+    return (
+        SmartCache(ttl=PERFORMANCE_CONFIG['cache_ttl'], max_size=PERFORMANCE_CONFIG['max_cache_size']),
+        # Special cache for daily data with longer TTL
+        DailyDataCache()
+    )
+
+def create_response_cache(namespace, ttl, max_size=50):
+    """
+    Cache for encoded (JSON/msgpack) responses (set bytes, read with get_bytes), shared across
+    worker processes through Redis like create_caches' caches, in-process otherwise
+    """
+    client = connect_redis()
+    if client:
+        return RedisCache(client, namespace, ttl=ttl, max_size=max_size)
+    return SmartCache(ttl=ttl, max_size=max_size)
+
 # Global cache instances
-global_cache = SmartCache(
-    ttl=PERFORMANCE_CONFIG['cache_ttl'],
-    max_size=PERFORMANCE_CONFIG['max_cache_size']
-)
+global_cache, daily_cache = create_caches()
 
-# Special cache for daily data with longer TTL
-daily_cache = DailyDataCache()
+# Negative cache: fetches that just failed, so requests during an outage don't each hit the
+# failing API again (in-process - only holds True markers, never data)
+failed_fetch_cache = SmartCache(ttl=PERFORMANCE_CONFIG['failed_fetch_ttl'], max_size=100)
 
 def time_it(func):
-    """Decorator to measure function execution time"""
+    """Decorator to measure function execution time (skipped when INFO logging is off)"""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+        # Monotonic clock - unaffected by system clock adjustments
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        duration = time.time() - start
-        logger.info(f"⏱️ {func.__name__} took {duration:.2f}s")
+        logger.info("⏱️ %s took %.2fs", func.__name__, time.perf_counter() - start)
         return result
     return wrapper
 
+class SingleFlight:
+    """One run per key at a time: callers arriving while a key's run is going wait for its outcome"""
+    
+    def __init__(self):
+        self.lock = Lock()
+        self.runs = {}  # key -> Future of the run in progress
+    
+    def run(self, key, func):
+        """func() for the first caller of a key; later concurrent callers get that call's result (or exception)"""
+        with self.lock:
+            future = self.runs.get(key)
+            leader = future is None
+            if leader:
+                future = self.runs[key] = concurrent.futures.Future()
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.runs[key]
+
+def coalesce_calls(func):
+    """
+    Decorator: concurrent calls with the same arguments share one run, so simultaneous
+    cache misses for the same data make one upstream fetch instead of one each
+    """
+    flights = SingleFlight()
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Calls with unhashable arguments can't be matched up - each just runs
+            return func(*args, **kwargs)
+        return flights.run(key, lambda: func(*args, **kwargs))
+    return wrapper
+
+# Appended to the ETag of a zstd-encoded body, so it doesn't share a validator with the identity body
+ZSTD_ETAG_SUFFIX = '-zstd'
+
+def etag_response(max_age=10):
+    """
+    Decorator for JSON views: tag 200 responses with a weak ETag (blake2b of the body) and
+    Cache-Control, and answer a matching If-None-Match with an empty 304
+    Weak because the body may still be re-encoded (zstd/gzip) after the view returns
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            from flask import make_response, request
+            response = make_response(func(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed:
+                return response
+            
+            etag = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+            # A client holding the zstd-encoded body revalidates with the zstd_compress_response tag
+            if request.if_none_match.contains_weak(etag + ZSTD_ETAG_SUFFIX):
+                etag += ZSTD_ETAG_SUFFIX
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = f'private, max-age={max_age}'
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+# Shared worker pool for parallel fetches (created once, reused by every request)
+FETCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=PERFORMANCE_CONFIG['fetch_workers'], thread_name_prefix='pp-fetch'
+)
+atexit.register(FETCH_EXECUTOR.shutdown, wait=False)
+
+@contextmanager
+def fetch_executor():
+    """
+    Executor for a parallel fetch: the shared FETCH_EXECUTOR, or a short-lived pool when
+    already running on one of its workers (a nested fetch waiting on the shared pool could
+    deadlock it once every worker is busy waiting)
+    """
+    if current_thread().name.startswith('pp-fetch'):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            yield executor
+    else:
+        yield FETCH_EXECUTOR
+
 def parallel_fetch(fetch_functions, timeout=30):
-    """Execute multiple fetch functions in parallel"""
+    """
+    Execute multiple fetch functions in parallel; returns {key: result}
+    (None where the function raised or hadn't finished within timeout seconds)
+    The last one runs on the calling thread, which would otherwise just sit waiting
+    on the pool - a two-source fetch only takes one pool worker. timeout only bounds
+    the pooled functions: the inline one always runs to completion
+    """
     results = {}
+    if not fetch_functions:
+        return results
+    
+    *pooled, (last_key, last_func) = fetch_functions.items()
+    deadline = time.monotonic() + timeout
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+    with fetch_executor() as executor:
         future_to_key = {}
         
-        for key, fetch_func in fetch_functions.items():
+        for key, fetch_func in pooled:
             future = executor.submit(fetch_func)
             future_to_key[future] = key
         
-        for future in concurrent.futures.as_completed(future_to_key, timeout=timeout):
-            key = future_to_key[future]
-            try:
-                results[key] = future.result()
-            except Exception as e:
-                logger.error(f"Error fetching {key}: {e}")
-                results[key] = None
+        try:
+            results[last_key] = last_func()
+        except Exception as e:
+            logger.error(f"Error fetching {last_key}: {e}")
+            results[last_key] = None
+        
+        remaining = max(deadline - time.monotonic(), 0)
+        try:
+            for future in concurrent.futures.as_completed(future_to_key, timeout=remaining):
+                key = future_to_key[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {key}: {e}")
+                    results[key] = None
+        except concurrent.futures.TimeoutError:
+            # Keep what finished; the stragglers come back as None
+            for future, key in future_to_key.items():
+                if key not in results:
+                    future.cancel()
+                    logger.error(f"⏱️ Timed out fetching {key} after {timeout}s")
+                    results[key] = None
     
     return results
 
+def parallel_map(func, items, timeout=30):
+    """
+    Call func(item) for each item in parallel; returns {item: result} in item order
+    (None where func raised or hadn't finished within timeout seconds)
+    """
+    with fetch_executor() as executor:
+        futures = [executor.submit(func, item) for item in items]
+        concurrent.futures.wait(futures, timeout=timeout)
+        
+        results = {}
+        for item, future in zip(items, futures):
+            if not future.done():
+                future.cancel()
+                logger.error(f"⏱️ Timed out fetching {item} after {timeout}s")
+                results[item] = None
+            elif future.exception() is not None:
+                logger.error(f"Error fetching {item}: {future.exception()}")
+                results[item] = None
+            else:
+                results[item] = future.result()
+        return results
+
 class BackgroundRefresher:
-    """Background cache refresher"""
+    """
+    Background cache refresher
+    Each registered function runs every refresh_interval seconds (or its own interval) on
+    FETCH_EXECUTOR, ordered by a next-run heap; stop() wakes the loop immediately
+    """
     
     def __init__(self, refresh_interval=240):  # 4 minutes
         self.refresh_interval = refresh_interval
-        self.refresh_funcs = []
-        self.running = False
+        # Heap of (next_run, registration order, func, args, kwargs, interval)
+        self.schedule = []
+        self.order = itertools.count()
+        # Registration order of functions still running, so a slow refresh isn't stacked up
+        self.in_flight = set()
+        self.lock = Lock()
+        self.stop_event = Event()
+        self.stop_event.set()
         self.thread = None
+    
+    @property
+    def running(self):
+        return not self.stop_event.is_set()
         
-    def register(self, func, args=(), kwargs={}):
-        """Register a function to refresh"""
-        self.refresh_funcs.append((func, args, kwargs))
+    def register(self, func, args=(), kwargs={}, interval=None):
+        """Register a function to refresh (first run one interval from now)"""
+        interval = interval or self.refresh_interval
+        with self.lock:
+            heapq.heappush(self.schedule, (time.monotonic() + interval, next(self.order), func, args, kwargs, interval))
     
     def start(self):
         """Start background refresh"""
         if not self.running:
-            self.running = True
+            self.stop_event.clear()
             self.thread = Thread(target=self._refresh_loop, daemon=True)
             self.thread.start()
             logger.info("🔄 Background cache refresh started")
     
     def stop(self):
         """Stop background refresh"""
-        self.running = False
+        self.stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
     
+    def _refresh(self, order, func, args, kwargs):
+        """Run one registered function"""
+        try:
+            func(*args, **kwargs)
+            logger.info(f"🔄 Refreshed {func.__name__}")
+        except Exception as e:
+            logger.error(f"Error refreshing {func.__name__}: {e}")
+        finally:
+            with self.lock:
+                self.in_flight.discard(order)
+    
     def _refresh_loop(self):
-        """Background refresh loop"""
-        while self.running:
-            time.sleep(self.refresh_interval)
+        """Background refresh loop (checks the schedule every second until stopped)"""
+        while not self.stop_event.wait(1.0):
+            now = time.monotonic()
+            due = []
+            with self.lock:
+                while self.schedule and self.schedule[0][0] <= now:
+                    _, order, func, args, kwargs, interval = heapq.heappop(self.schedule)
+                    heapq.heappush(self.schedule, (now + interval, order, func, args, kwargs, interval))
+                    if order not in self.in_flight:
+                        self.in_flight.add(order)
+                        due.append((order, func, args, kwargs))
             
-            for func, args, kwargs in self.refresh_funcs:
-                try:
-                    func(*args, **kwargs)
-                    logger.info(f"🔄 Refreshed {func.__name__}")
-                except Exception as e:
-                    logger.error(f"Error refreshing {func.__name__}: {e}")
+            for order, func, args, kwargs in due:
+                FETCH_EXECUTOR.submit(self._refresh, order, func, args, kwargs)
 
-def optimize_google_ads_fetch(ads_manager, start_date=None, end_date=None, active_only=True, force_refresh=False):
+@coalesce_calls
+def optimize_google_ads_fetch(ads_manager, start_date=None, end_date=None, active_only=True, force_refresh=False,
+                              by_date=False):
     """
     Optimized Google Ads fetch with caching and parallel processing.
     Now optimized for single-day fetches.
+    by_date=True returns one row per campaign per day with a 'date' field.
     """
+    single_day = start_date and end_date and start_date == end_date and not by_date
+    
     # Special handling for single-day fetches - use daily cache with longer TTL
-    if start_date and end_date and start_date == end_date:
+    if single_day:
         if not force_refresh:
             # Check daily cache first
             cached = daily_cache.get_day(start_date, f'google_ads_{active_only}')
@@ -245,7 +780,7 @@ def optimize_google_ads_fetch(ads_manager, start_date=None, end_date=None, activ
                 return cached
     
     # Regular cache for date ranges
-    cache_key = ['google_ads', start_date or 'none', end_date or 'none', active_only]
+    cache_key = ['google_ads', start_date or 'none', end_date or 'none', active_only, by_date]
     
     if not force_refresh:
         cached = global_cache.get(cache_key)
@@ -257,13 +792,14 @@ def optimize_google_ads_fetch(ads_manager, start_date=None, end_date=None, activ
         return None
     
     all_campaigns = []
+    query = google_ads_campaign_query(start_date, end_date, active_only, by_date)
     
     # Parallel fetch from multiple accounts if available
     if len(ads_manager.customer_ids) > 1:
         fetch_funcs = {}
         for customer_id in ads_manager.customer_ids:
             fetch_funcs[customer_id] = lambda cid=customer_id: fetch_single_account(
-                ads_manager, cid, start_date, end_date, active_only
+                ads_manager, cid, start_date, end_date, active_only, by_date, query=query
             )
         
         results = parallel_fetch(fetch_funcs, timeout=PERFORMANCE_CONFIG['api_timeout'])
@@ -279,7 +815,9 @@ def optimize_google_ads_fetch(ads_manager, start_date=None, end_date=None, activ
             ads_manager.customer_ids[0], 
             start_date, 
             end_date, 
-            active_only
+            active_only,
+            by_date,
+            query=query
         )
         if campaigns:
             all_campaigns = campaigns
@@ -288,38 +826,66 @@ def optimize_google_ads_fetch(ads_manager, start_date=None, end_date=None, activ
     global_cache.set(cache_key, all_campaigns)
     
     # If single day, also cache in daily cache with longer TTL
-    if start_date and end_date and start_date == end_date:
+    if single_day:
         daily_cache.set_day(start_date, all_campaigns, f'google_ads_{active_only}')
     
     return all_campaigns
 
-def fetch_single_account(ads_manager, customer_id, start_date, end_date, active_only):
-    """Helper function to fetch from a single Google Ads account"""
-    try:
-        ga_service = ads_manager.client.get_service("GoogleAdsService")
-        
-        # Build date filter
-        date_filter = ""
-        if start_date and end_date:
-            date_filter = f"AND segments.date BETWEEN '{start_date}' AND '{end_date}'"
-        elif start_date:
-            date_filter = f"AND segments.date >= '{start_date}'"
-        elif end_date:
-            date_filter = f"AND segments.date <= '{end_date}'"
-        else:
-            today = datetime.now().strftime('%Y-%m-%d')
-            date_filter = f"AND segments.date = '{today}'"
-        
-        status_filter = "AND campaign.status = 'ENABLED'" if active_only else ""
-        
-        # Optimized query with only needed fields
-        query = f"""
+def campaign_row_data(row, customer_id, customer_name, by_date=False):
+    """
+    Campaign dict for one Google Ads search_stream row (customer_name is per account,
+    so it is passed in rather than selected on every row)
+    Rows are retained in the caches - the repeated name/status/channel/account/date strings
+    are interned so every row shares one copy (per-day rows repeat each campaign name once a day)
+    """
+    campaign = row.campaign
+    metrics = row.metrics
+    channel_type = intern_value(campaign.advertising_channel_type.name) if hasattr(campaign, 'advertising_channel_type') else 'UNKNOWN'
+    campaign_data = {
+        'id': campaign.id,
+        'name': intern_value(campaign.name),
+        'status': intern_value(campaign.status.name),
+        'cost': metrics.cost_micros / 1_000_000,
+        'clicks': metrics.clicks,
+        'impressions': metrics.impressions,
+        'conversions': metrics.conversions,
+        'channel_type': channel_type,
+        'customer_id': customer_id,
+        'customer_name': customer_name,
+        'is_lsa': channel_type == 'LOCAL_SERVICES'
+    }
+    if by_date:
+        campaign_data['date'] = intern_value(row.segments.date)
+    return campaign_data
+
+def google_ads_campaign_query(start_date, end_date, active_only, by_date=False):
+    """GAQL for campaign metrics over a date range (the same for every account, so built once per fetch)"""
+    # Build date filter
+    date_filter = ""
+    if start_date and end_date:
+        date_filter = f"AND segments.date BETWEEN '{start_date}' AND '{end_date}'"
+    elif start_date:
+        date_filter = f"AND segments.date >= '{start_date}'"
+    elif end_date:
+        date_filter = f"AND segments.date <= '{end_date}'"
+    else:
+        today = datetime.now().strftime('%Y-%m-%d')
+        date_filter = f"AND segments.date = '{today}'"
+    
+    status_filter = "AND campaign.status = 'ENABLED'" if active_only else ""
+    
+    # Per-day rows need the date segment and can't be capped at 200
+    date_segment = "segments.date," if by_date else ""
+    limit_clause = "" if by_date else "LIMIT 200"
+    
+    # Optimized query with only needed fields
+    return f"""
             SELECT
                 campaign.id,
                 campaign.name,
                 campaign.status,
                 campaign.advertising_channel_type,
-                customer.descriptive_name,
+                {date_segment}
                 metrics.cost_micros,
                 metrics.clicks,
                 metrics.impressions,
@@ -329,41 +895,222 @@ def fetch_single_account(ads_manager, customer_id, start_date, end_date, active_
             {status_filter}
             {date_filter}
             ORDER BY metrics.cost_micros DESC
-            LIMIT 200
+            {limit_clause}
         """
+
+def fetch_single_account(ads_manager, customer_id, start_date, end_date, active_only, by_date=False, query=None):
+    """
+    Helper function to fetch from a single Google Ads account
+    `query` is the google_ads_campaign_query for these arguments when the caller already built it
+    """
+    failure_key = ['google_ads', customer_id, start_date or 'none', end_date or 'none', active_only, by_date]
+    if failed_fetch_cache.get(failure_key):
+        logger.info(f"⏭️ Skipping {customer_id} - fetch failed less than {failed_fetch_cache.ttl}s ago")
+        return []
+    
+    try:
+        if query is None:
+            query = google_ads_campaign_query(start_date, end_date, active_only, by_date)
+        
+        customer_name = ads_manager.get_account_name(customer_id)
+        response = ads_manager.get_ga_service().search_stream(customer_id=customer_id, query=query)
         
-        response = ga_service.search_stream(customer_id=customer_id, query=query)
-        
-        campaigns = []
-        for batch in response:
-            for row in batch.results:
-                campaign_data = {
-                    'id': row.campaign.id,
-                    'name': row.campaign.name,
-                    'status': row.campaign.status.name,
-                    'cost': row.metrics.cost_micros / 1_000_000,
-                    'clicks': row.metrics.clicks,
-                    'impressions': row.metrics.impressions,
-                    'conversions': row.metrics.conversions,
-                    'channel_type': row.campaign.advertising_channel_type.name if hasattr(row.campaign, 'advertising_channel_type') else 'UNKNOWN',
-                    'customer_id': customer_id,
-                    'customer_name': row.customer.descriptive_name if hasattr(row.customer, 'descriptive_name') else 'Unknown'
-                }
-                campaign_data['is_lsa'] = campaign_data['channel_type'] == 'LOCAL_SERVICES'
-                campaigns.append(campaign_data)
-        
-        return campaigns
+        return [campaign_row_data(row, customer_id, customer_name, by_date)
+                for batch in response for row in batch.results]
         
     except Exception as e:
         logger.error(f"Error fetching from {customer_id}: {e}")
+        failed_fetch_cache.set(failure_key, True)
         return []
 
+# Litify intake statuses that indicate successful conversion, and ones that never count as converted
+LITIFY_CONVERTED_STATUSES = frozenset(['Retained', 'Converted', 'Signed'])
+LITIFY_NON_CONVERTING_STATUSES = frozenset(['Converted DAI', 'Referred Out'])
+
+# SOQL for optimize_litify_fetch: intakes CREATED in a DATETIME range ({start}/{end} as
+# UTC ISO timestamps) and CONVERTED in a DATE range (Retainer_Signed_Date__c is a DATE field,
+# so {start}/{end} are plain YYYY-MM-DD); {case_type_filter} is litify_case_type_filter()
+# Only fields the lead processing reads are selected; the case type is selected as its Id and named
+# from LitifyManager.case_type_names (no relationship traversal per row)
+LITIFY_INTAKE_FIELDS = """
+            SELECT Id, Name, CreatedDate, 
+                litify_pm__Status__c,
+                litify_pm__Display_Name__c,
+                litify_pm__First_Name__c,
+                litify_pm__Last_Name__c,
+                Client_Name__c,
+                litify_pm__Case_Type__c,
+                Retainer_Signed_Date__c,
+                litify_pm__UTM_Campaign__c,
+                litify_pm__Matter__c,
+                litify_ext__Companion__c,
+                isDroppedatIntake__c
+            FROM litify_pm__Intake__c"""
+# The indexed date range leads each WHERE clause, ahead of the non-selective filters
+LITIFY_CREATED_QUERY = LITIFY_INTAKE_FIELDS + """
+            WHERE CreatedDate >= {start}
+            AND CreatedDate <= {end}
+            AND litify_pm__UTM_Campaign__c != null
+            {case_type_filter}
+            ORDER BY CreatedDate DESC
+            LIMIT {limit}
+        """
+LITIFY_CONVERTED_QUERY = LITIFY_INTAKE_FIELDS + """
+            WHERE Retainer_Signed_Date__c >= {start}
+            AND Retainer_Signed_Date__c <= {end}
+            AND litify_pm__UTM_Campaign__c != null
+            {case_type_filter}
+            ORDER BY Retainer_Signed_Date__c DESC
+            LIMIT {limit}
+        """
+
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def litify_case_type_filter(include_spam=False, include_abandoned=False, include_duplicate=False):
+    """
+    SOQL predicate dropping the Spam/Abandoned/Duplicate intakes that weren't asked for
+    ('' when all are included), so Salesforce never sends them
+    """
+    excluded = [case_type for case_type, include in (('Spam', include_spam),
+                                                     ('Abandoned', include_abandoned),
+                                                     ('Duplicate', include_duplicate))
+                if not include]
+    if not excluded:
+        return ''
+    quoted = ', '.join(f"'{case_type}'" for case_type in excluded)
+    return f"AND litify_pm__Case_Type__r.Name NOT IN ({quoted})"
+
+def soql_page_events(raw, page):
+    """ijson parse events of one SOQL result page, noting its nextRecordsUrl in page"""
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if prefix == 'nextRecordsUrl':
+            page['nextRecordsUrl'] = value
+        yield prefix, event, value
+
+def stream_salesforce_records(client, query):
+    """
+    Yield every record of a SOQL query, following nextRecordsUrl.
+    With ijson each page's records are parsed off the socket as they arrive, so neither
+    the raw body nor the parsed page is held whole; otherwise pages come from query_all_iter
+    """
+    if not IJSON_AVAILABLE:
+        yield from client.query_all_iter(query)
+        return
+    
+    url, params = f"{client.base_url}query/", {'q': query}
+    while url:
+        page = {}
+        with client.session.get(url, headers=client.headers, params=params, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield from ijson.items(soql_page_events(response.raw, page), 'records.item')
+        
+        next_records_url = page.get('nextRecordsUrl')
+        url = f"https://{client.sf_instance}{next_records_url}" if next_records_url else None
+        params = None
+
+def salesforce_records_by_id(client, query):
+    """
+    {Id: record} for every row of a SOQL query
+    Records are consumed as stream_salesforce_records yields them,
+    so no page-sized list (or the full query_all result) is built along the way
+    """
+    return {record['Id']: record for record in stream_salesforce_records(client, query)}
+
+# Checkbox fields of the intake queries (Bulk API CSV cells are the text 'true'/'false')
+LITIFY_BOOLEAN_FIELDS = frozenset({'isDroppedatIntake__c'})
+
+def bulk_csv_record(row):
+    """
+    A Bulk API 2.0 CSV row in the shape REST queries return it: empty cells as None,
+    checkboxes as bools and CreatedDate with the REST '+0000' offset instead of 'Z'
+    """
+    record = {field: value if value != '' else None for field, value in row.items()}
+    for field in LITIFY_BOOLEAN_FIELDS & record.keys():
+        record[field] = record[field] == 'true'
+    created = record.get('CreatedDate')
+    if created and created.endswith('Z'):
+        record['CreatedDate'] = created[:-1] + '+0000'
+    return record
+
+def salesforce_bulk_records_by_id(client, object_name, query):
+    """
+    {Id: record} for every row of a SOQL query run as a Bulk API 2.0 job, for ranges too large
+    for REST query paging. simple_salesforce's bulk2 submits the job, waits for it and pages
+    through the CSV results by locator; each page is parsed as it arrives.
+    Clients without bulk2 (simple_salesforce before 1.12.5) run the query over REST instead
+    """
+    if not hasattr(client, 'bulk2'):
+        logger.warning("⚠️ Salesforce client has no Bulk API 2.0 support - running the query over REST")
+        return salesforce_records_by_id(client, query)
+    
+    records = {}
+    for page in getattr(client.bulk2, object_name).query(query):
+        for row in csv.DictReader(io.StringIO(page)):
+            record = bulk_csv_record(row)
+            records[record['Id']] = record
+    return records
+
+def is_expired_session_error(error):
+    """
+    True for a Salesforce call rejected with 401 (expired or revoked session) - simple_salesforce
+    errors carry it as .status, requests HTTPErrors from stream_salesforce_records on .response
+    """
+    status = getattr(error, 'status', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status == 401
+
+def warn_if_query_truncated(label, records, limit):
+    """
+    Log a warning when a SOQL query returned exactly its LIMIT of rows - pagination
+    (query_all_iter) fetches every row the query selects, so hitting the LIMIT is the
+    only way records go missing
+    """
+    if limit and len(records) >= limit:
+        logger.warning(f"⚠️ Litify {label} query returned its full LIMIT of {limit} rows - "
+                       f"later records may have been cut off (raise the limit for this range)")
+
+def intern_value(value):
+    """
+    Shared copy of a low-cardinality string field (status, case type, UTM campaign)
+    Parsed Salesforce records carry their own copy of every value; interning them keeps one
+    per distinct value across the cached lead lists. Non-strings/empty values pass through.
+    """
+    return sys.intern(value) if value and isinstance(value, str) else value
+
+# (IN_PRACTICE_CASE_TYPES, EXCLUDED_CASE_TYPES, lookup_utm_bucket) from app, once imported
+LITIFY_APP_LOOKUPS = None
+
+def litify_app_lookups():
+    """
+    IN_PRACTICE_CASE_TYPES, EXCLUDED_CASE_TYPES and the UTM -> bucket lookup from app
+    (imported on first use - app imports this module - then reused; defaults without app)
+    """
+    global LITIFY_APP_LOOKUPS
+    if LITIFY_APP_LOOKUPS is None:
+        try:
+            from app import IN_PRACTICE_CASE_TYPES, EXCLUDED_CASE_TYPES, lookup_utm_bucket
+        except ImportError:
+            IN_PRACTICE_CASE_TYPES = frozenset([
+                'Pedestrian', 'Automobile Accident', 'Wrongful Death', 'Premise Liability',
+                'Public Entity', 'Personal injury', 'Habitability', 'Automobile Accident - Commercial',
+                'Bicycle', 'Animal Incident', 'Wildfire 2025', 'Motorcycle', 'Slip and Fall',
+                'Electric Scooter', 'Mold', 'Product Liability'
+            ])
+            EXCLUDED_CASE_TYPES = frozenset(['Spam', 'Abandoned', 'Duplicate'])
+            lookup_utm_bucket = lambda utm_campaign: ''
+        LITIFY_APP_LOOKUPS = (IN_PRACTICE_CASE_TYPES, EXCLUDED_CASE_TYPES, lookup_utm_bucket)
+    return LITIFY_APP_LOOKUPS
+
+@coalesce_calls
 def optimize_litify_fetch(litify_manager, start_date=None, end_date=None, limit=1000,
                          include_spam=False, include_abandoned=False, include_duplicate=False,
-                         force_refresh=False, count_by_conversion_date=True):
+                         force_refresh=False, count_by_conversion_date=True, demo_on_error=True):
     """
     Optimized Litify fetch with caching and batching.
     Now optimized for single-day fetches.
+    demo_on_error=False returns None instead of demo leads when the query fails.
     """
     from datetime import datetime
     import pytz
@@ -391,168 +1138,129 @@ def optimize_litify_fetch(litify_manager, start_date=None, end_date=None, limit=
     if not litify_manager.client or not litify_manager.connected:
         return litify_manager.get_demo_litify_leads(include_spam, include_abandoned, include_duplicate)
     
+    if failed_fetch_cache.get(cache_key):
+        logger.info(f"⏭️ Litify query failed less than {failed_fetch_cache.ttl}s ago")
+        if not demo_on_error:
+            return None
+        return litify_manager.get_demo_litify_leads(include_spam, include_abandoned, include_duplicate)
+    
     try:
         # Get Pacific timezone
         PACIFIC_TZ = pytz.timezone('America/Los_Angeles')
         
+        # Read the clock once for every missing bound
+        now_utc = datetime.now(pytz.UTC)
+        
+        # Dates go into SOQL as literals - only accept YYYY-MM-DD
+        for date_arg in (start_date, end_date):
+            if date_arg and not ISO_DATE_RE.fullmatch(date_arg):
+                raise ValueError(f"Invalid date {date_arg!r} (expected YYYY-MM-DD)")
+        
         # Parse dates properly
         if start_date:
             start_dt = datetime.strptime(start_date, '%Y-%m-%d')
             start_dt_pt = PACIFIC_TZ.localize(datetime.combine(start_dt.date(), datetime.min.time()))
             start_dt_utc = start_dt_pt.astimezone(pytz.UTC)
         else:
-            start_dt_utc = datetime.now(pytz.UTC).replace(hour=0, minute=0, second=0)
+            start_dt_utc = now_utc.replace(hour=0, minute=0, second=0)
             
         if end_date:
             end_dt = datetime.strptime(end_date, '%Y-%m-%d')
             end_dt_pt = PACIFIC_TZ.localize(datetime.combine(end_dt.date(), datetime.max.time()))
             end_dt_utc = end_dt_pt.astimezone(pytz.UTC)
         else:
-            end_dt_utc = datetime.now(pytz.UTC).replace(hour=23, minute=59, second=59)
+            end_dt_utc = now_utc.replace(hour=23, minute=59, second=59)
         
         # Format for SOQL queries
         datetime_start = start_dt_utc.strftime('%Y-%m-%dT%H:%M:%S.000Z')
         datetime_end = end_dt_utc.strftime('%Y-%m-%dT%H:%M:%S.999Z')
-        date_start = start_date if start_date else datetime.now().strftime('%Y-%m-%d')
-        date_end = end_date if end_date else datetime.now().strftime('%Y-%m-%d')
+        today = datetime.now().strftime('%Y-%m-%d') if not (start_date and end_date) else None
+        date_start = start_date or today
+        date_end = end_date or today
         
-        # Query 1: Leads CREATED in date range (for lead counts)
-        leads_query = f"""
-            SELECT Id, Name, CreatedDate, 
-                litify_pm__Status__c,
-                litify_pm__Display_Name__c,
-                litify_pm__First_Name__c,
-                litify_pm__Last_Name__c,
-                Client_Name__c,
-                litify_pm__Case_Type__c,
-                litify_pm__Case_Type__r.Name,
-                Retainer_Signed_Date__c,
-                litify_pm__UTM_Campaign__c,
-                litify_pm__Matter__c,
-                litify_ext__Companion__c,
-                isDroppedatIntake__c
-            FROM litify_pm__Intake__c
-            WHERE litify_pm__UTM_Campaign__c != null
-            AND CreatedDate >= {datetime_start}
-            AND CreatedDate <= {datetime_end}
-            ORDER BY CreatedDate DESC
-            LIMIT {limit}
-        """
+        # Leads CREATED in date range (for lead counts) and CONVERTED in it (for conversion metrics)
+        case_type_filter = litify_case_type_filter(include_spam, include_abandoned, include_duplicate)
+        leads_query = LITIFY_CREATED_QUERY.format(start=datetime_start, end=datetime_end, limit=int(limit),
+                                                  case_type_filter=case_type_filter)
+        conversions_query = LITIFY_CONVERTED_QUERY.format(start=date_start, end=date_end, limit=int(limit),
+                                                          case_type_filter=case_type_filter)
         
-        # Query 2: Leads CONVERTED in date range (for conversion metrics)
-        conversions_query = f"""
-            SELECT Id, Name, CreatedDate, 
-                litify_pm__Status__c,
-                litify_pm__Display_Name__c,
-                litify_pm__First_Name__c,
-                litify_pm__Last_Name__c,
-                Client_Name__c,
-                litify_pm__Case_Type__c,
-                litify_pm__Case_Type__r.Name,
-                Retainer_Signed_Date__c,
-                litify_pm__UTM_Campaign__c,
-                litify_pm__Matter__c,
-                litify_ext__Companion__c,
-                isDroppedatIntake__c
-            FROM litify_pm__Intake__c
-            WHERE litify_pm__UTM_Campaign__c != null
-            AND Retainer_Signed_Date__c >= {date_start}
-            AND Retainer_Signed_Date__c <= {date_end}
-            ORDER BY Retainer_Signed_Date__c DESC
-            LIMIT {limit}
-        """
+        # Long ranges run as Bulk API 2.0 jobs
+        bulk = (end_dt_utc - start_dt_utc).days + 1 >= PERFORMANCE_CONFIG['bulk_query_min_days']
+        timeout = PERFORMANCE_CONFIG['bulk_query_timeout' if bulk else 'api_timeout']
         
-        # Execute both queries
-        created_leads = {}
-        converted_leads = {}
+        # Execute both queries at once (independent round-trips; a failure raises here)
+        logger.info(f"Fetching leads CREATED between {datetime_start} and {datetime_end} "
+                    f"and CONVERTED between {date_start} and {date_end}{' (Bulk API)' if bulk else ''}...")
+        with fetch_executor() as executor:
+            created_future = executor.submit(litify_manager.query_records_by_id, leads_query, bulk)
+            converted_future = executor.submit(litify_manager.query_records_by_id, conversions_query, bulk)
+            created_leads = created_future.result(timeout=timeout)
+            converted_leads = converted_future.result(timeout=timeout)
         
-        # Get leads created in period
-        logger.info(f"Fetching leads CREATED between {datetime_start} and {datetime_end}...")
-        result = litify_manager.client.query(leads_query)
-        for record in result['records']:
-            created_leads[record['Id']] = record
         logger.info(f"   Found {len(created_leads)} leads created in period")
-        
-        # Get leads converted in period
-        logger.info(f"Fetching leads CONVERTED between {date_start} and {date_end}...")
-        result = litify_manager.client.query(conversions_query)
-        for record in result['records']:
-            converted_leads[record['Id']] = record
         logger.info(f"   Found {len(converted_leads)} leads converted in period")
+        warn_if_query_truncated('created', created_leads, int(limit))
+        warn_if_query_truncated('converted', converted_leads, int(limit))
         
-        # Merge results - mark conversions from previous periods
-        all_records_dict = created_leads.copy()
-        conversions_from_previous = 0
-        
-        for lead_id, lead_data in converted_leads.items():
-            if lead_id not in created_leads:
-                # This is a conversion from a previous period
-                lead_data['from_previous_period'] = True
-                all_records_dict[lead_id] = lead_data
-                conversions_from_previous += 1
+        # Merge results - mark conversions from previous periods (converted, not created, in period)
+        previous_only = converted_leads.keys() - created_leads.keys()
+        for lead_id in previous_only:
+            converted_leads[lead_id]['from_previous_period'] = True
+        conversions_from_previous = len(previous_only)
         
         logger.info(f"   Including {conversions_from_previous} conversions from previous periods")
         
-        all_records = list(all_records_dict.values())
+        # Created leads first, then conversions from previous periods, each in query order
+        all_records = list(created_leads.values())
+        if previous_only:
+            all_records.extend(record for lead_id, record in converted_leads.items() if lead_id in previous_only)
         
-        # Get IN_PRACTICE_CASE_TYPES and EXCLUDED_CASE_TYPES
-        try:
-            from app import IN_PRACTICE_CASE_TYPES, EXCLUDED_CASE_TYPES, UTM_TO_BUCKET_MAPPING
-        except ImportError:
-            IN_PRACTICE_CASE_TYPES = [
-                'Pedestrian', 'Automobile Accident', 'Wrongful Death', 'Premise Liability',
-                'Public Entity', 'Personal injury', 'Habitability', 'Automobile Accident - Commercial',
-                'Bicycle', 'Animal Incident', 'Wildfire 2025', 'Motorcycle', 'Slip and Fall',
-                'Electric Scooter', 'Mold', 'Product Liability'
-            ]
-            EXCLUDED_CASE_TYPES = ['Spam', 'Abandoned', 'Duplicate']
-            UTM_TO_BUCKET_MAPPING = {}
+        IN_PRACTICE_CASE_TYPES, EXCLUDED_CASE_TYPES, lookup_utm_bucket = litify_app_lookups()
+        case_type_names = litify_manager.case_type_names(
+            {record['litify_pm__Case_Type__c'] for record in all_records if record.get('litify_pm__Case_Type__c')})
         
         # Process leads
         leads = []
-        excluded_count = 0
+        
+        # Salesforce record URLs share the org's Lightning prefix
+        instance_url = litify_manager.client.base_url if litify_manager.client else ""
+        if '.my.salesforce.com' in instance_url:
+            instance_name = instance_url.split('//')[1].split('.')[0]
+        else:
+            instance_name = 'sweetjames'
+        salesforce_url_prefix = f"https://{instance_name}.lightning.force.com/lightning/r/litify_pm__Intake__c/"
+        
+        # One bucket lookup per distinct UTM campaign
+        utm_buckets = {utm: lookup_utm_bucket(utm)
+                       for utm in {record.get('litify_pm__UTM_Campaign__c', '') for record in all_records}}
         
         for record in all_records:
             # Get UTM Campaign
-            utm_campaign = record.get('litify_pm__UTM_Campaign__c', '')
+            utm_campaign = intern_value(record.get('litify_pm__UTM_Campaign__c', ''))
             
-            # Get case type NAME from relationship field
-            case_type = ''
-            if 'litify_pm__Case_Type__r' in record and record['litify_pm__Case_Type__r']:
-                case_type = record['litify_pm__Case_Type__r'].get('Name', '')
+            # Get case type NAME from its Id
+            case_type = case_type_names.get(record.get('litify_pm__Case_Type__c'), '')
             
             # Determine if in practice
             in_practice = case_type in IN_PRACTICE_CASE_TYPES
             
-            # Check if it's an excluded type
+            # Check if it's an excluded type (only the included ones are queried)
             is_excluded = case_type in EXCLUDED_CASE_TYPES
             
-            # Track and skip excluded types if not included
-            if is_excluded:
-                excluded_count += 1
-                if case_type == 'Spam' and not include_spam:
-                    continue
-                elif case_type == 'Abandoned' and not include_abandoned:
-                    continue
-                elif case_type == 'Duplicate' and not include_duplicate:
-                    continue
-            
             # Check for companion case
             has_companion = bool(record.get('litify_ext__Companion__c'))
             
             # Determine conversion status
             retainer_signed = record.get('Retainer_Signed_Date__c')
-            status = record.get('litify_pm__Status__c', '')
+            status = intern_value(record.get('litify_pm__Status__c', ''))
             display_name = (record.get('litify_pm__Display_Name__c', '') or '').lower()
             is_dropped = record.get('isDroppedatIntake__c', False)
             
-            # Status values that indicate successful conversion
-            CONVERTED_STATUSES = ['Retained', 'Converted', 'Signed']
-            
             # Check if converted
             is_converted = (
-                (retainer_signed is not None or status in CONVERTED_STATUSES) and 
-                status not in ['Converted DAI', 'Referred Out'] and
+                (retainer_signed is not None or status in LITIFY_CONVERTED_STATUSES) and 
+                status not in LITIFY_NON_CONVERTING_STATUSES and
                 not is_dropped and
                 display_name != 'test'
             )
@@ -561,21 +1269,10 @@ def optimize_litify_fetch(litify_manager, start_date=None, end_date=None, limit=
             is_pending = status == 'Retainer Sent'
             
             # Map UTM Campaign to bucket
-            bucket = UTM_TO_BUCKET_MAPPING.get(utm_campaign, '')
-            if not bucket and utm_campaign:
-                utm_lower = utm_campaign.lower()
-                for utm_key, bucket_name in UTM_TO_BUCKET_MAPPING.items():
-                    if utm_key.lower() == utm_lower:
-                        bucket = bucket_name
-                        break
+            bucket = utm_buckets[utm_campaign]
             
             # Build Salesforce URL
-            instance_url = litify_manager.client.base_url if litify_manager.client else ""
-            if '.my.salesforce.com' in instance_url:
-                instance_name = instance_url.split('//')[1].split('.')[0]
-                salesforce_url = f"https://{instance_name}.lightning.force.com/lightning/r/litify_pm__Intake__c/{record.get('Id')}/view"
-            else:
-                salesforce_url = f"https://sweetjames.lightning.force.com/lightning/r/litify_pm__Intake__c/{record.get('Id')}/view"
+            salesforce_url = f"{salesforce_url_prefix}{record.get('Id')}/view"
             
             # Determine if from previous period
             from_previous_period = record.get('from_previous_period', False)
@@ -629,8 +1326,11 @@ def optimize_litify_fetch(litify_manager, start_date=None, end_date=None, limit=
         logger.info(f"   - {len([l for l in leads if l['count_for_conversions']])} converted in period")
         logger.info(f"   - {conversions_from_previous} conversions from previous periods")
         
-        # Cache the processed results
-        global_cache.set(cache_key, leads)
+        # Cache the processed results - ranges that ended before today are kept much longer
+        today_pt = datetime.now(PACIFIC_TZ).strftime('%Y-%m-%d')
+        closed_range = bool(end_date) and end_date < today_pt
+        global_cache.set(cache_key, leads,
+                         ttl=PERFORMANCE_CONFIG['closed_range_cache_ttl'] if closed_range else None)
         
         # If single day, also cache in daily cache
         if start_date and end_date and start_date == end_date:
@@ -641,6 +1341,9 @@ def optimize_litify_fetch(litify_manager, start_date=None, end_date=None, limit=
         
     except Exception as e:
         logger.error(f"❌ Litify query error: {e}")
+        failed_fetch_cache.set(cache_key, True)
+        if not demo_on_error:
+            return None
         # Return demo data on error
         return litify_manager.get_demo_litify_leads(include_spam, include_abandoned, include_duplicate)
 
@@ -648,6 +1351,7 @@ def warm_cache_for_month(ads_manager, litify_manager, year=None, month=None):
     """
     Pre-warm the cache for an entire month by fetching all days.
     Useful for pre-loading data during off-peak hours.
+    Uncached days are fetched PERFORMANCE_CONFIG['warm_cache_workers'] at a time.
     """
     from datetime import date, timedelta
     
@@ -662,46 +1366,273 @@ def warm_cache_for_month(ads_manager, litify_manager, year=None, month=None):
     
     logger.info(f"🔥 Warming cache for {year}-{month:02d}")
     
+    missing = []
     current = month_start
-    days_cached = 0
-    
     while current <= min(month_end, today):
         date_str = current.strftime('%Y-%m-%d')
         
         # Check if already cached
         if not daily_cache.get_day(date_str, 'combined'):
-            # Fetch and cache
-            if ads_manager and ads_manager.connected:
-                ads_manager.fetch_campaigns(date_str, date_str, active_only=False)
-            
-            if litify_manager and litify_manager.connected:
-                litify_manager.fetch_detailed_leads(date_str, date_str, limit=500)
-            
-            days_cached += 1
-            logger.info(f"  Cached {date_str}")
+            missing.append(date_str)
         else:
             logger.info(f"  Skipped {date_str} (already cached)")
         
         current += timedelta(days=1)
     
+    def warm_day(date_str):
+        # Fetch and cache
+        if ads_manager and ads_manager.connected:
+            ads_manager.fetch_campaigns(date_str, date_str, active_only=False)
+        
+        if litify_manager and litify_manager.connected:
+            litify_manager.fetch_detailed_leads(date_str, date_str, limit=500)
+    
+    # Days are independent - fetch them concurrently on a small pool of their own (their
+    # per-account/per-query fetches still fan out on the shared FETCH_EXECUTOR)
+    days_cached = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=PERFORMANCE_CONFIG['warm_cache_workers'],
+                                               thread_name_prefix='pp-warm') as executor:
+        future_to_date = {executor.submit(warm_day, date_str): date_str for date_str in missing}
+        for future in concurrent.futures.as_completed(future_to_date):
+            date_str = future_to_date[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"  Error caching {date_str}: {e}")
+                continue
+            days_cached += 1
+            logger.info(f"  Cached {date_str}")
+    
     logger.info(f"✅ Cache warmed: {days_cached} new days cached")
     return days_cached
 
+def to_json_bytes(obj):
+    """
+    Serialize obj to compact JSON bytes.
+    Uses orjson when available (numpy values and non-string keys allowed), stdlib json otherwise.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def from_json_bytes(payload):
+    """Parse JSON bytes/str with orjson when available, stdlib json otherwise"""
+    return orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+
+def fast_json_response_hook(response, *args, **kwargs):
+    """
+    requests response hook: response.json() parses the body with from_json_bytes
+    (keyword arguments such as object_pairs_hook=OrderedDict are dropped - dicts keep key
+    order); bodies it rejects go through requests' own parser for the usual error
+    """
+    original_json = response.json
+    
+    def parse_json(**json_kwargs):
+        try:
+            return from_json_bytes(response.content)
+        except ValueError:
+            return original_json(**json_kwargs)
+    
+    response.json = parse_json
+    return response
+
+def json_response(obj, status=200):
+    """
+    JSON Response built straight from orjson bytes.
+    Skips the provider's str round-trip and key sorting for large payloads;
+    falls back to jsonify() when orjson is unavailable.
+    """
+    from flask import Response, jsonify
+    if ORJSON_AVAILABLE:
+        return Response(to_json_bytes(obj), status=status, mimetype='application/json')
+    return jsonify(obj), status
+
+def json_bytes_response(payload, status=200):
+    """JSON Response for a body already serialized with to_json_bytes (e.g. kept with cached data)"""
+    from flask import Response
+    return Response(payload, status=status, mimetype='application/json')
+
+def wants_msgpack():
+    """True when msgpack is installed and the request's Accept header prefers it over JSON"""
+    from flask import request
+    return MSGPACK_AVAILABLE and request.accept_mimetypes.best_match(
+        ['application/json', 'application/msgpack']) == 'application/msgpack'
+
+def msgpack_default(obj):
+    """msgpack fallback for values it can't pack natively (numpy values, sets, dates)"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Cannot pack {type(obj).__name__}")
+
+def to_msgpack_bytes(obj):
+    """Serialize obj to msgpack bytes (for clients that send Accept: application/msgpack)"""
+    return msgpack.packb(obj, default=msgpack_default, use_bin_type=True)
+
+def msgpack_bytes_response(payload, status=200):
+    """msgpack Response for a body already serialized with to_msgpack_bytes"""
+    from flask import Response
+    return Response(payload, status=status, mimetype='application/msgpack')
+
+def write_json_file(filepath, data):
+    """
+    Write data to a JSON file with 2-space indentation.
+    Uses orjson (single bytes write) when available, stdlib json otherwise.
+    The file is written to a temp file and swapped in, so readers never see a partial file.
+    """
+    tmp_path = f"{filepath}.tmp"
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+    os.replace(tmp_path, filepath)
+
+def read_json_file(filepath):
+    """
+    Read a JSON file in one read.
+    Uses orjson when available, stdlib json otherwise.
+    """
+    if ORJSON_AVAILABLE:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
 def enable_compression(app):
     """
-    Enable gzip compression for Flask app.
+    Enable response compression for Flask app: zstd for clients that accept it
+    (smaller and cheaper to encode than gzip), gzip via flask-compress for the rest.
     Call this after creating your Flask app:
     
     app = Flask(__name__)
     enable_compression(app)
     """
     if COMPRESS_AVAILABLE:
+        app.config.setdefault('COMPRESS_LEVEL', PERFORMANCE_CONFIG['compression_level'])
         Compress(app)
         logger.info("✅ Response compression enabled")
     else:
         logger.warning("⚠️ Compression not available - install flask-compress")
+    
+    if ZSTD_AVAILABLE:
+        # Registered after Compress so it runs first (after_request runs in reverse);
+        # flask-compress leaves responses that already have a Content-Encoding alone
+        app.after_request(zstd_compress_response)
+        logger.info("✅ zstd response compression enabled")
+    return app
+
+def zstd_compress_response(response):
+    """after_request hook: zstd-encode a response body if the client accepts zstd"""
+    from flask import request
+    
+    response.vary.add('Accept-Encoding')
+    if ('zstd' not in request.headers.get('Accept-Encoding', '')
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    data = response.get_data()
+    if len(data) < PERFORMANCE_CONFIG['compression_min_size']:
+        return response
+    
+    # Compressors aren't thread-safe - one per response
+    response.set_data(zstandard.ZstdCompressor(level=PERFORMANCE_CONFIG['zstd_level']).compress(data))
+    response.headers['Content-Encoding'] = 'zstd'
+    
+    # The encoded body is a different representation - give it its own ETag
+    etag, weak = response.get_etag()
+    if etag and not etag.endswith(ZSTD_ETAG_SUFFIX):
+        response.set_etag(etag + ZSTD_ETAG_SUFFIX, weak=weak)
+    return response
+
+if ORJSON_AVAILABLE:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """
+        Flask JSON provider backed by orjson.
+        Keeps Flask's key sorting and date/Decimal handling; falls back to
+        the standard encoder for anything orjson rejects (e.g. huge ints).
+        """
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY |
+                  orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+
+        def dumps(self, obj, **kwargs):
+            try:
+                return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+            except TypeError:
+                return super().dumps(obj, **kwargs)
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+def enable_orjson(app):
+    """
+    Serialize all jsonify() responses with orjson.
+    Call this after creating your Flask app:
+    
+    app = Flask(__name__)
+    enable_orjson(app)
+    """
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+        logger.info("✅ orjson response encoding enabled")
+    else:
+        logger.warning("⚠️ orjson not available - install orjson for faster JSON responses")
     return app
 
+def stream_json_response(sections, stream_keys=(), on_complete=None, encoded=None):
+    """
+    Stream a JSON object one top-level key at a time.
+    `sections` is an iterable of (key, value) pairs; each value is encoded with
+    the app's JSON provider (orjson when enabled) as it is sent, so the whole
+    document is never serialized into memory at once.
+    Values of keys in `stream_keys` (any iterable, e.g. a long list of rows) are
+    sent one item at a time.
+    `encoded` optionally maps keys to already-encoded JSON text that is sent in
+    place of the section's value (e.g. constants serialized once at startup).
+    `on_complete(body)`, if given, receives the whole encoded document (bytes) once
+    the last chunk has been sent, e.g. to cache it.
+    """
+    from flask import Response, current_app, stream_with_context
+
+    def chunks():
+        dumps = current_app.json.dumps
+        preencoded = encoded or {}
+        separator = '{'
+        for key, value in sections:
+            if key in preencoded:
+                yield f"{separator}{dumps(key)}:{preencoded[key]}"
+            elif key in stream_keys:
+                yield f"{separator}{dumps(key)}:["
+                item_separator = ''
+                for item in value:
+                    yield item_separator + dumps(item)
+                    item_separator = ','
+                yield ']'
+            else:
+                yield f"{separator}{dumps(key)}:{dumps(value)}"
+            separator = ','
+        yield '}' if separator == ',' else '{}'
+
+    def generate():
+        if on_complete is None:
+            yield from chunks()
+            return
+        sent = []
+        for chunk in chunks():
+            sent.append(chunk)
+            yield chunk
+        on_complete(''.join(sent).encode('utf-8'))
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 def create_performance_endpoints(app, cache=None):
     """
     Add performance monitoring endpoints to your Flask app.
@@ -718,8 +1649,10 @@ def create_performance_endpoints(app, cache=None):
         return {
             'cache': cache.get_stats(),
             'daily_cache': daily_cache.get_stats(),
+            'failed_fetch_cache': failed_fetch_cache.get_stats(),
             'config': PERFORMANCE_CONFIG,
-            'compression': COMPRESS_AVAILABLE
+            'compression': COMPRESS_AVAILABLE,
+            'zstd': ZSTD_AVAILABLE
         }
     
     @app.route('/api/performance/clear-cache', methods=['POST'])
@@ -727,6 +1660,7 @@ def create_performance_endpoints(app, cache=None):
         """Clear the cache"""
         cache.clear()
         daily_cache.clear()
+        failed_fetch_cache.clear()
         return {'success': True, 'message': 'All caches cleared'}
     
     @app.route('/api/performance/clear-month-cache/<int:year>/<int:month>', methods=['POST'])
@@ -738,8 +1672,9 @@ def create_performance_endpoints(app, cache=None):
     @app.route('/api/performance/warm-cache', methods=['POST'])
     def warm_cache_endpoint():
         """Warm the cache for the current month"""
-        from app import ads_manager, litify_manager
-        days_cached = warm_cache_for_month(ads_manager, litify_manager)
+        from flask import current_app
+        deps = current_app.extensions['ppcdash']
+        days_cached = warm_cache_for_month(deps.ads_manager, deps.litify_manager)
         return {'success': True, 'days_cached': days_cached}
     
     logger.info("✅ Performance endpoints added")
@@ -755,6 +1690,9 @@ def optimize_app(app, ads_manager=None, litify_manager=None):
     # Enable compression
     enable_compression(app)
     
+    # Faster JSON encoding for jsonify()
+    enable_orjson(app)
+    
     # Add performance endpoints
     create_performance_endpoints(app)
     
@@ -779,15 +1717,46 @@ def optimize_app(app, ads_manager=None, litify_manager=None):
 # Export all utilities
 __all__ = [
     'SmartCache',
+    'CacheShard',
     'global_cache',
     'daily_cache',
+    'failed_fetch_cache',
     'DailyDataCache',
+    'RedisCache',
+    'RedisDailyDataCache',
+    'create_caches',
+    'create_response_cache',
     'warm_cache_for_month',
     'time_it',
+    'SingleFlight',
+    'coalesce_calls',
+    'etag_response',
     'parallel_fetch',
+    'parallel_map',
     'optimize_google_ads_fetch',
+    'campaign_row_data',
     'optimize_litify_fetch',
+    'litify_case_type_filter',
+    'LITIFY_CREATED_QUERY',
+    'LITIFY_CONVERTED_QUERY',
+    'salesforce_records_by_id',
+    'stream_salesforce_records',
+    'salesforce_bulk_records_by_id',
+    'is_expired_session_error',
+    'warn_if_query_truncated',
+    'read_json_file',
+    'write_json_file',
+    'to_json_bytes',
+    'from_json_bytes',
+    'fast_json_response_hook',
+    'json_response',
+    'json_bytes_response',
+    'wants_msgpack',
+    'to_msgpack_bytes',
+    'msgpack_bytes_response',
     'enable_compression',
+    'zstd_compress_response',
+    'enable_orjson',
     'create_performance_endpoints',
     'BackgroundRefresher',
     'optimize_app',